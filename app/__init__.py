@@ -67,6 +67,9 @@ def create_app(config_name=None):
             # Create all tables
             db.create_all()
             
+            # Add columns introduced after the initial schema to existing databases
+            upgrade_news_articles_schema()
+            
             # Initialize default news sources if they don't exist
             from app.models.models import NewsSource
             if NewsSource.query.count() == 0:
@@ -200,6 +203,25 @@ def create_app(config_name=None):
 
     return app
 
+def upgrade_news_articles_schema():
+    """Add and backfill news_articles.content_length on databases created before it existed"""
+    from sqlalchemy import text
+    
+    try:
+        db.session.execute(text("ALTER TABLE news_articles ADD COLUMN IF NOT EXISTS content_length INTEGER"))
+        db.session.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_news_articles_content_length ON news_articles (content_length)"
+        ))
+        db.session.execute(text(
+            "UPDATE news_articles SET content_length = CHAR_LENGTH(content) "
+            "WHERE content_length IS NULL AND content IS NOT NULL AND content != ''"
+        ))
+        db.session.commit()
+        
+    except Exception as e:
+        db.session.rollback()
+        print(f"⚠️  Could not upgrade news_articles schema: {e}")
+
 def initialize_news_sources():
     """Initialize default news sources in database"""
     from .models.models import NewsSource
@@ -21,7 +21,8 @@ class NewsArticle(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(500), nullable=False)  # Măresc size-ul pentru titluri lungi
     summary = db.Column(db.Text, nullable=False)
-    content = db.Column(db.Text, nullable=True)  # Full article content
+    content = db.deferred(db.Column(db.Text, nullable=True))  # Full article content (loaded only when accessed)
+    content_length = db.Column(db.Integer, nullable=True, index=True)  # len(content), used for update checks
     link = db.Column(db.String(1000), nullable=False, unique=True)  # Măresc pentru URL-uri lungi
     source = db.Column(db.String(100), nullable=False)
     
@@ -5,6 +5,21 @@ from datetime import datetime, timedelta
 import os
 import sys
 import threading
+import time
+import difflib
+import unicodedata
+import logging
+import pytz
+from sqlalchemy import and_, or_, update
+
+from app.scrapers.timestamp_utils import parse_iso_datetime
+
+# Per-article update diagnostics go through logging so they cost nothing
+# unless debug output is enabled
+logger = logging.getLogger(__name__)
+
+# Resolved once - ensure_romania_timezone runs for every update comparison
+_ROMANIA_TZ = pytz.timezone('Europe/Bucharest')
 
 # Global locks to prevent concurrent execution of same scraper
 _scraper_locks = {
@@ -325,16 +340,27 @@ def save_articles(articles_data, source):
     """Save articles to database with duplicate checking and smart update detection"""
     # Import models inside the function to ensure proper app context
     from app.models.models import db, NewsArticle
-    import hashlib
     
     try:
         saved_count = 0
         updated_count = 0
         checked_count = 0  # Track how many updates we've checked
+        pending_updates = []  # Column values for changed duplicates, keyed by primary key
+        
+        # Look up all duplicates with one IN query instead of one query per article
+        links = [article_data['link'] for article_data in articles_data]
+        existing_by_link = {}
+        if links:
+            existing_by_link = {
+                article.link: article
+                for article in NewsArticle.query.filter(NewsArticle.link.in_(links)).all()
+            }
+        # Age/frequency rules are evaluated in SQL - only check-worthy ids come back
+        check_candidate_ids = select_articles_to_check(links, source)
         
         for article_data in articles_data:
             # Check for duplicates by link
-            existing = NewsArticle.query.filter_by(link=article_data['link']).first()
+            existing = existing_by_link.get(article_data['link'])
             
             if not existing:
                 # NEW ARTICLE - Parse and save normally
@@ -356,40 +382,54 @@ def save_articles(articles_data, source):
                 updated_at = None
                 if article_data.get('updated_at'):
                     try:
-                        updated_at = datetime.fromisoformat(article_data['updated_at'].replace('Z', '+00:00'))
-                    except:
+                        updated_at = parse_iso_datetime(article_data['updated_at'])
+                    except ValueError:
                         updated_at = None
                 
                 article = NewsArticle(
                     title=article_data['title'],
                     summary=article_data['summary'],
                     content=article_data.get('content'),  # Include full content
+                    content_length=content_length_of(article_data.get('content')),
                     link=article_data['link'],
                     source=source,
                     published_at=published_at,  # Use the real publication date
                     updated_at=updated_at  # Use the real update date (can be None)
                 )
                 db.session.add(article)
+                existing_by_link[article.link] = article  # Same link later in this batch is a duplicate
                 saved_count += 1
                 
             else:
                 # DUPLICATE FOUND - Check if we should verify for updates
                 # Respect the session limit for update checks
                 if (checked_count < UPDATE_CHECK_CONFIG['max_checks_per_session'] and 
-                    should_check_article_for_updates(existing, article_data)):
+                    existing.id in check_candidate_ids):
                     
                     checked_count += 1
-                    print(f"🔍 Checking for updates ({checked_count}/{UPDATE_CHECK_CONFIG['max_checks_per_session']}): {existing.title[:50]}...")
+                    logger.debug("🔍 Checking for updates (%d/%d): %.50s...", checked_count, UPDATE_CHECK_CONFIG['max_checks_per_session'], existing.title)
                     # Parse the new updated_at from scraped data
                     new_updated_at = None
-                    if article_data.get('updated_at'):
-                        try:
-                            new_updated_at = datetime.fromisoformat(article_data['updated_at'].replace('Z', '+00:00'))
-                        except:
-                            new_updated_at = None
+                    raw_updated_at = article_data.get('updated_at')
+                    if raw_updated_at:
+                        if updated_at_unchanged(existing, raw_updated_at):
+                            # Same timestamp string as stored - reuse it, no parsing needed
+                            new_updated_at = existing.updated_at
+                        else:
+                            try:
+                                new_updated_at = parse_iso_datetime(raw_updated_at)
+                            except ValueError:
+                                new_updated_at = None
                     
                     # Check if the article was actually updated
                     if article_needs_update(existing, article_data, new_updated_at):
+                        # New column values, written for the whole batch with one bulk UPDATE below
+                        article_update = {
+                            'id': existing.id,
+                            'updated_at': existing.updated_at,
+                            'summary': existing.summary
+                        }
+                        
                         # ENHANCED UPDATE: Re-extract content when updated_at changed
                         if new_updated_at and existing.updated_at:
                             # Ensure both datetimes are timezone-aware for comparison
@@ -398,12 +438,10 @@ def save_articles(articles_data, source):
                             if new_updated_tz > existing_updated_tz:
                                 # Check if content refresh is enabled
                                 if UPDATE_CHECK_CONFIG.get('enable_content_refresh', True):
-                                    print(f"🔄 Article has newer updated_at - re-extracting full content: {existing.title[:50]}...")
+                                    logger.debug("🔄 Article has newer updated_at - re-extracting full content: %.50s...", existing.title)
                                     
                                     # Re-extract full content from the source with timeout protection
                                     try:
-                                        import time
-                                        import threading
                                         from app.scrapers.content_extractor import extract_article_content, extract_article_metadata, generate_summary_from_content
                                         
                                         # Ultra-robust timeout wrapper that prevents all hanging
@@ -419,13 +457,13 @@ def save_articles(articles_data, source):
                                             def extraction_thread():
                                                 try:
                                                     extraction_started.set()
-                                                    print(f"   🌐 Starting content extraction (max: {timeout_seconds}s)...")
+                                                    logger.debug("   🌐 Starting content extraction (max: %ss)...", timeout_seconds)
                                                     
                                                     # Use the improved extract_article_content which has internal timeouts
                                                     result['content'] = extract_article_content(url, source_name)
                                                     
                                                     if result['content']:
-                                                        print(f"   🌐 Starting metadata extraction...")
+                                                        logger.debug("   🌐 Starting metadata extraction...")
                                                         result['metadata'] = extract_article_metadata(url, source_name)
                                                     
                                                 except Exception as e:
@@ -451,7 +489,7 @@ def save_articles(articles_data, source):
                                                 
                                                 # Check if extraction completed
                                                 if extraction_complete.wait(timeout=poll_interval):
-                                                    print(f"   ✅ Extraction completed in {elapsed:.1f}s")
+                                                    logger.debug("   ✅ Extraction completed in %.1fs", elapsed)
                                                     break
                                                 
                                                 # Check for timeout
@@ -461,80 +499,90 @@ def save_articles(articles_data, source):
                                                         'metadata': None,
                                                         'error': f"Extraction timeout after {elapsed:.1f}s (limit: {timeout_seconds}s)"
                                                     }
-                                                    print(f"   ⏱️  TIMEOUT: {result['error']}")
+                                                    logger.warning("   ⏱️  TIMEOUT: %s", result['error'])
                                                     break
                                                 
                                                 # Progress indicator
                                                 if int(elapsed) % 5 == 0 and elapsed > 0:
-                                                    print(f"   ⏳ Still extracting... ({elapsed:.0f}s/{timeout_seconds}s)")
+                                                    logger.debug("   ⏳ Still extracting... (%.0fs/%ss)", elapsed, timeout_seconds)
                                             
                                             return result
                                         
                                         # Use guaranteed timeout protection
                                         timeout_seconds = min(UPDATE_CHECK_CONFIG.get('content_extraction_timeout', 20), 30)  # Cap at 30s
-                                        print(f"   🛡️  Using guaranteed timeout: {timeout_seconds}s")
+                                        logger.debug("   🛡️  Using guaranteed timeout: %ss", timeout_seconds)
                                         extraction_result = extract_with_guaranteed_timeout(existing.link, source.lower(), timeout_seconds=timeout_seconds)
                                         
                                         if extraction_result['error']:
-                                            print(f"   ⏱️  Content extraction failed: {extraction_result['error']}")
-                                            print(f"   ⚠️  Using basic update without content re-extraction")
+                                            logger.warning("   ⏱️  Content extraction failed: %s", extraction_result['error'])
+                                            logger.debug("   ⚠️  Using basic update without content re-extraction")
                                             # Fallback to basic update
-                                            existing.updated_at = new_updated_at
-                                            existing.summary = article_data.get('summary', existing.summary)
-                                            existing.content = article_data.get('content', existing.content)
+                                            article_update['updated_at'] = new_updated_at
+                                            article_update['summary'] = article_data.get('summary', existing.summary)
+                                            if 'content' in article_data:
+                                                article_update.update(content_values(article_data['content']))
                                         else:
                                             fresh_content = extraction_result['content']
                                             fresh_metadata = extraction_result['metadata'] or {}
                                             
                                             if fresh_content:
-                                                existing.content = fresh_content
-                                                print(f"   ✅ Updated content ({len(fresh_content)} chars)")
+                                                article_update.update(content_values(fresh_content))
+                                                logger.debug("   ✅ Updated content (%d chars)", len(fresh_content))
                                                 
                                                 # Regenerate summary from new content
                                                 if len(fresh_content) > 100:
                                                     fresh_summary = generate_summary_from_content(fresh_content, 200)
-                                                    existing.summary = fresh_summary
-                                                    print(f"   ✅ Updated summary from fresh content")
+                                                    article_update['summary'] = fresh_summary
+                                                    logger.debug("   ✅ Updated summary from fresh content")
                                                 
                                             else:
                                                 # Fallback: use scraped summary if content extraction failed
-                                                existing.summary = article_data.get('summary', existing.summary)
-                                                existing.content = article_data.get('content', existing.content)
-                                                print(f"   ⚠️  Content re-extraction failed, using scraped data")
+                                                article_update['summary'] = article_data.get('summary', existing.summary)
+                                                if 'content' in article_data:
+                                                    article_update.update(content_values(article_data['content']))
+                                                logger.debug("   ⚠️  Content re-extraction failed, using scraped data")
                                             
                                             # Use fresh metadata if available
                                             if fresh_metadata.get('updated_at'):
                                                 try:
-                                                    fresh_updated_at = datetime.fromisoformat(fresh_metadata['updated_at'].replace('Z', '+00:00'))
-                                                    existing.updated_at = fresh_updated_at
-                                                    print(f"   ✅ Updated with fresh metadata updated_at: {fresh_updated_at}")
+                                                    fresh_updated_at = parse_iso_datetime(fresh_metadata['updated_at'])
+                                                    article_update['updated_at'] = fresh_updated_at
+                                                    logger.debug("   ✅ Updated with fresh metadata updated_at: %s", fresh_updated_at)
                                                 except:
-                                                    existing.updated_at = new_updated_at
+                                                    article_update['updated_at'] = new_updated_at
                                             else:
-                                                existing.updated_at = new_updated_at
+                                                article_update['updated_at'] = new_updated_at
                                         
                                     except Exception as content_error:
-                                        print(f"   ❌ Error re-extracting content: {content_error}")
+                                        logger.warning("   ❌ Error re-extracting content: %s", content_error)
                                         # Fallback to basic update
-                                        existing.updated_at = new_updated_at
-                                        existing.summary = article_data.get('summary', existing.summary)
-                                        existing.content = article_data.get('content', existing.content)
+                                        article_update['updated_at'] = new_updated_at
+                                        article_update['summary'] = article_data.get('summary', existing.summary)
+                                        if 'content' in article_data:
+                                            article_update.update(content_values(article_data['content']))
                                 else:
                                     # Content refresh disabled - do basic update
-                                    print(f"🔄 Article has newer updated_at - content refresh disabled, doing basic update: {existing.title[:50]}...")
-                                    existing.updated_at = new_updated_at
-                                    existing.summary = article_data.get('summary', existing.summary)
-                                    existing.content = article_data.get('content', existing.content)
+                                    logger.debug("🔄 Article has newer updated_at - content refresh disabled, doing basic update: %.50s...", existing.title)
+                                    article_update['updated_at'] = new_updated_at
+                                    article_update['summary'] = article_data.get('summary', existing.summary)
+                                    if 'content' in article_data:
+                                        article_update.update(content_values(article_data['content']))
                         else:
                             # Normal update without content re-extraction
-                            existing.updated_at = new_updated_at
-                            existing.summary = article_data.get('summary', existing.summary)
-                            existing.content = article_data.get('content', existing.content)
+                            article_update['updated_at'] = new_updated_at
+                            article_update['summary'] = article_data.get('summary', existing.summary)
+                            if 'content' in article_data:
+                                article_update.update(content_values(article_data['content']))
                         
+                        pending_updates.append(article_update)
                         updated_count += 1
-                        print(f"🔄 Updated article: {existing.title[:50]}... (new updated_at: {existing.updated_at})")
+                        logger.debug("🔄 Updated article: %.50s... (new updated_at: %s)", existing.title, article_update['updated_at'])
                     # else: Article is duplicate but no update needed - skip silently
         
+        if pending_updates:
+            # Core bulk UPDATE by primary key - skips per-attribute ORM change tracking
+            db.session.execute(update(NewsArticle), pending_updates)
+        
         db.session.commit()
         
         if updated_count > 0:
@@ -557,106 +605,100 @@ UPDATE_CHECK_CONFIG = {
     'skip_content_refresh_on_timeout': True  # Skip content refresh if it times out
 }
 
+def content_length_of(content):
+    """Value for NewsArticle.content_length (None when there is no content)"""
+    return len(content) if content else None
+
+def content_values(content):
+    """Column values for replacing an article's content, keeping content_length in sync"""
+    return {'content': content, 'content_length': content_length_of(content)}
+
+def updated_at_unchanged(existing_article, raw_updated_at):
+    """
+    Cheap pre-check before parsing: True when the scraped ISO string is
+    identical to the stored updated_at, so the timestamp did not change
+    """
+    existing_updated_at = existing_article.updated_at
+    return existing_updated_at is not None and existing_updated_at.isoformat() == raw_updated_at
+
 def ensure_romania_timezone(dt):
-    """Helper function to ensure datetime is in Romania timezone"""
-    import pytz
-    ROMANIA_TZ = pytz.timezone('Europe/Bucharest')
-    
-    if dt is None:
-        return None
-        
-    if dt.tzinfo is None:
-        # Naive datetime - assume it's already in Romania timezone
-        return ROMANIA_TZ.localize(dt)
-    else:
-        # Timezone-aware datetime - convert to Romania timezone
-        return dt.astimezone(ROMANIA_TZ)
+    """
+    Helper function to ensure datetime is in Romania timezone
+    Naive datetimes are assumed to already be Romania local time
+    """
+    return None if dt is None else (
+        _ROMANIA_TZ.localize(dt) if dt.tzinfo is None else dt.astimezone(_ROMANIA_TZ)
+    )
 
-def should_check_article_for_updates(existing_article, new_article_data):
+def select_articles_to_check(links, source):
     """
-    Determine if a duplicate article should be checked for updates
-    Uses selective criteria to avoid performance impact
+    Return the ids of stored articles (among the given links) that are due for an update check
+    Due means no updated_at yet, or last updated more than the source's check frequency ago
+    and published within max_article_age_days - all decided in a single SQL query
     """
-    from datetime import datetime, timedelta
-    import pytz
-    
-    if not UPDATE_CHECK_CONFIG['enable_update_checks']:
-        return False
-    
-    # Use timezone-aware datetime for Romania
-    ROMANIA_TZ = pytz.timezone('Europe/Bucharest')
-    now = datetime.now(ROMANIA_TZ)
+    from app.models.models import db, NewsArticle
     
-    # Always check if existing article has no updated_at
-    if not existing_article.updated_at:
-        return True
+    if not links or not UPDATE_CHECK_CONFIG['enable_update_checks']:
+        return set()
     
-    # Only check recent articles (configurable age limit)
-    if existing_article.published_at:
-        published_at = ensure_romania_timezone(existing_article.published_at)
-        days_since_published = (now - published_at).days
-        if days_since_published > UPDATE_CHECK_CONFIG['max_article_age_days']:
-            return False  # Article too old, skip checking
+    now = datetime.now(_ROMANIA_TZ)
     
-    # Check frequency limits based on source importance
-    updated_at = ensure_romania_timezone(existing_article.updated_at)
-    hours_since_last_update = (now - updated_at).total_seconds() / 3600
     source_frequency = UPDATE_CHECK_CONFIG['check_frequency_hours'].get(
-        existing_article.source, 
+        source,
         UPDATE_CHECK_CONFIG['check_frequency_hours']['default']
     )
+    recheck_cutoff = now - timedelta(hours=source_frequency)
+    # Articles older than max_article_age_days (whole days) are skipped
+    age_cutoff = now - timedelta(days=UPDATE_CHECK_CONFIG['max_article_age_days'] + 1)
     
-    if hours_since_last_update < source_frequency:
-        return False  # Too soon to check again
-    
-    # Check if scraped data suggests changes
-    if new_article_data.get('updated_at'):
-        try:
-            new_updated_at = datetime.fromisoformat(new_article_data['updated_at'].replace('Z', '+00:00'))
-            new_updated_at = ensure_romania_timezone(new_updated_at)
-            
-            if new_updated_at and existing_article.updated_at:
-                existing_updated_at = ensure_romania_timezone(existing_article.updated_at)
-                if new_updated_at > existing_updated_at:
-                    return True  # Scraped data shows newer update date
-        except Exception as e:
-            print(f"   ⚠️  Error parsing new updated_at: {e}")
+    rows = db.session.query(NewsArticle.id).filter(
+        NewsArticle.link.in_(links),
+        or_(
+            # Always check articles without updated_at
+            NewsArticle.updated_at.is_(None),
+            and_(
+                NewsArticle.updated_at <= recheck_cutoff,
+                or_(NewsArticle.published_at.is_(None), NewsArticle.published_at > age_cutoff)
+            )
+        )
+    ).all()
     
-    return True  # Default: check for updates
+    return {row.id for row in rows}
 
 def article_needs_update(existing_article, new_article_data, new_updated_at):
     """
     Determine if an article actually needs to be updated in the database
     Enhanced logic to detect real content changes
     """
-    import pytz
-    
-    # Use Romania timezone for comparisons
-    ROMANIA_TZ = pytz.timezone('Europe/Bucharest')
-    
     # Priority 1: If updated_at changed, it definitely needs update
     if new_updated_at and existing_article.updated_at:
         # Ensure both datetimes are timezone-aware and in Romania timezone
         new_updated_at = ensure_romania_timezone(new_updated_at)
         existing_updated_at = ensure_romania_timezone(existing_article.updated_at)
         
+        if new_updated_at == existing_updated_at:
+            # Unchanged timestamp (the usual re-scrape case) - skip the content/summary/title
+            # comparisons; silent edits are picked up by the periodic re-check instead
+            return False
+        
         if new_updated_at > existing_updated_at:
-            print(f"   📅 updated_at changed: {existing_updated_at} → {new_updated_at}")
+            logger.debug("   📅 updated_at changed: %s → %s", existing_updated_at, new_updated_at)
             return True
     elif new_updated_at and not existing_article.updated_at:
         # Article has no updated_at but new data has one
         new_updated_at = ensure_romania_timezone(new_updated_at)
-        print(f"   📅 First time updated_at detected: {new_updated_at}")
+        logger.debug("   📅 First time updated_at detected: %s", new_updated_at)
         return True
     
     # Priority 2: Content length changes significantly (indicates real changes)
-    if new_article_data.get('content') and existing_article.content:
-        old_length = len(existing_article.content)
+    # Compares the stored content_length so the (deferred) content column is never loaded
+    if new_article_data.get('content') and existing_article.content_length:
+        old_length = existing_article.content_length
         new_length = len(new_article_data['content'])
         length_diff_percent = abs(new_length - old_length) / old_length * 100 if old_length > 0 else 0
         
         if length_diff_percent > 5:  # More than 5% change in content length
-            print(f"   📝 Content length changed significantly: {old_length} → {new_length} chars ({length_diff_percent:.1f}%)")
+            logger.debug("   📝 Content length changed significantly: %d → %d chars (%.1f%%)", old_length, new_length, length_diff_percent)
             return True
     
     # Priority 3: Summary changes significantly
@@ -667,26 +709,45 @@ def article_needs_update(existing_article, new_article_data, new_updated_at):
         # Check if summary is completely different
         if new_summary != old_summary:
             # Allow minor differences (whitespace, punctuation)
-            import difflib
             similarity = difflib.SequenceMatcher(None, old_summary.lower(), new_summary.lower()).ratio()
             
             if similarity < 0.8:  # Less than 80% similar
-                print(f"   📋 Summary changed significantly (similarity: {similarity:.2f})")
+                logger.debug("   📋 Summary changed significantly (similarity: %.2f)", similarity)
                 return True
     
     # Priority 4: Title changes (rare but important)
     if new_article_data.get('title') and existing_article.title:
         if new_article_data['title'].strip() != existing_article.title.strip():
-            print(f"   📰 Title changed: {existing_article.title[:30]}... → {new_article_data['title'][:30]}...")
+            logger.debug("   📰 Title changed: %.30s... → %.30s...", existing_article.title, new_article_data['title'])
             return True
     
     return False
 
+# Helper function to safely get and clean string values
+def safe_get_string(data, key, default=''):
+    value = data.get(key, default)
+    if isinstance(value, str):
+        return value.strip()
+    return default
+
+# Helper function to safely get integer values
+def safe_get_int(data, key, default=0):
+    value = data.get(key, default)
+    if isinstance(value, (int, str)) and str(value).isdigit():
+        return int(value)
+    return default
+
+# Helper function to safely get boolean values
+def safe_get_bool(data, key, default=False):
+    value = data.get(key, default)
+    if isinstance(value, bool):
+        return value
+    return default
+
 def save_facebook_profile(profile_data, profile_url):
     """Save Facebook profile to database with duplicate checking and ALL enhanced fields"""
     # Import models inside the function to ensure proper app context
     from app.models.models import db, FacebookUserProfile
-    from datetime import datetime
     
     try:
         # Check for duplicates by profile_url
@@ -694,27 +755,6 @@ def save_facebook_profile(profile_data, profile_url):
         if not existing:
             connected_accounts = ','.join(profile_data.get('connected_accounts', []))
             
-            # Helper function to safely get and clean string values
-            def safe_get_string(data, key, default=''):
-                value = data.get(key, default)
-                if isinstance(value, str):
-                    return value.strip()
-                return default
-            
-            # Helper function to safely get integer values
-            def safe_get_int(data, key, default=0):
-                value = data.get(key, default)
-                if isinstance(value, (int, str)) and str(value).isdigit():
-                    return int(value)
-                return default
-            
-            # Helper function to safely get boolean values  
-            def safe_get_bool(data, key, default=False):
-                value = data.get(key, default)
-                if isinstance(value, bool):
-                    return value
-                return default
-            
             profile = FacebookUserProfile(
                 # Basic information
                 name=profile_data['name'],
@@ -810,18 +850,10 @@ def save_facebook_profile(profile_data, profile_url):
 def update_facebook_profile(existing_profile, new_profile_data):
     """Update existing Facebook profile with fresh data"""
     from app.models.models import db
-    import json
     
     try:
         updated = False
         
-        # Helper function to safely get and clean string values
-        def safe_get_string(data, key, default=''):
-            value = data.get(key, default)
-            if isinstance(value, str):
-                return value.strip()
-            return default
-        
         # Helper function to update field if different
         def update_field_if_different(field_name, new_value):
             nonlocal updated
@@ -927,7 +959,6 @@ def update_facebook_profile(existing_profile, new_profile_data):
         last_scraped_str = new_profile_data.get('last_scraped_at')
         if last_scraped_str:
             try:
-                from datetime import datetime
                 if isinstance(last_scraped_str, str):
                     # Try to parse ISO format
                     last_scraped = datetime.fromisoformat(last_scraped_str.replace('Z', '+00:00'))
@@ -938,7 +969,6 @@ def update_facebook_profile(existing_profile, new_profile_data):
         
         # Update the updated_at timestamp if any changes were made
         if updated:
-            from datetime import datetime
             existing_profile.updated_at = datetime.now()
             db.session.commit()
             print(f"   ✅ Successfully updated profile in database with {sum(1 for k, v in new_profile_data.items() if v)} fields")
@@ -957,7 +987,6 @@ def get_scraping_config():
     try:
         # Import here to avoid circular imports
         from app.models.models import NewsSource
-        import unicodedata
         
         def normalize_source_name(name):
             """Normalize source name by removing diacritics and converting to lowercase"""
@@ -1022,6 +1051,10 @@ def start_scheduler_in_context(app):
                 traceback.print_exc()
         return wrapper
     
+    # Thread-based scheduler on purpose: each job only waits on a scraper
+    # subprocess (all HTTP traffic happens in the child process), so an
+    # AsyncIOScheduler would add an event loop thread without overlapping any I/O.
+    # Concurrent article fetching belongs inside the scrapers themselves.
     scheduler = BackgroundScheduler()
     
     # Get configuration with fallback strategy
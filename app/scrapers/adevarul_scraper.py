@@ -5,186 +5,279 @@ Extracts news articles and outputs JSON format for the scheduler
 """
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from selectolax.lexbor import LexborHTMLParser
+from lxml import etree
 import json
+import io
+import logging
 import sys
 import os
 from datetime import datetime
 import re
+import unicodedata
+from itertools import chain
+from hashlib import blake2b
+from concurrent.futures import ThreadPoolExecutor
 try:
-    from .content_extractor import extract_article_content, generate_summary_from_content, extract_article_metadata
-    from .timestamp_utils import extract_published_date_from_content, get_romania_now, format_for_database
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    from .content_extractor import extract_article_content, generate_summary_from_content, extract_article_metadata, fetch_and_parse
+    from .timestamp_utils import get_romania_now
+    from .scraper_logging import configure_scraper_logging
 except ImportError:
     # Fallback for when running as script
-    import os
-    import sys
     sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-    from content_extractor import extract_article_content, generate_summary_from_content, extract_article_metadata
-    from timestamp_utils import extract_published_date_from_content, get_romania_now, format_for_database
+    from content_extractor import extract_article_content, generate_summary_from_content, extract_article_metadata, fetch_and_parse
+    from timestamp_utils import get_romania_now
+    from scraper_logging import configure_scraper_logging
 
-# Fix Windows Unicode encoding issues
-if sys.platform == "win32":
-    import codecs
-    try:
-        if hasattr(sys.stdout, 'buffer'):
-            sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer)
-        if hasattr(sys.stderr, 'buffer'):
-            sys.stderr = codecs.getwriter('utf-8')(sys.stderr.buffer)
-    except:
-        pass  # Fallback if encoding fix fails
+# Browser-like headers sent with every request to adevarul.ro
+_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'ro-RO,ro;q=0.9,en;q=0.8',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1'
+}
+
+# Shared session - homepage, RSS and all article pages are on the same host,
+# so keep-alive connections skip a TCP+TLS handshake per request
+_SESSION = requests.Session()
+_SESSION.headers.update(_HEADERS)
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=32,
+    max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+))
+
+# Article pages are fetched concurrently - every fetch is a blocking wait on
+# the network, so the waits overlap instead of adding up
+_MAX_WORKERS = 20
+
+# Progress goes through logging - main() sets it up via configure_scraper_logging()
+logger = logging.getLogger(__name__)
+
+# Homepage link selectors, most specific first - built once at import
+_ARTICLE_SELECTORS = (
+    # Primary selectors for main articles
+    'a.title.titleAndHeadings[href*="adevarul.ro"]',
+    'a[data-gtrack*="homepage"][href*="adevarul.ro"]',
+    'a[data-gtrack*="box_deschidere"][href*="adevarul.ro"]',
+    
+    # Secondary selectors for additional articles
+    'a.item.svelte-hjtm2f[href*="adevarul.ro"]',
+    'a[href*="adevarul.ro"][class*="title"]',
+    'a[href*="adevarul.ro"][class*="svelte"]',
+    
+    # Catch-all for any adevarul.ro links with tracking
+    'a[data-gtrack][href*="adevarul.ro"]'
+)
+
+# Elements near a homepage link that usually hold its summary
+_SUMMARY_SELECTOR = 'p, [class*="summary"], [class*="desc"], [class*="sub"]'
+
+# Patterns compiled once at import instead of on every call
+_VIDEO_RE = re.compile(r'^(Video\s*)?', re.IGNORECASE)
+
+# Section paths that mark a link as an article URL
+_INCLUDE_RE = re.compile(r'/stiri-|/politica/|/economie/|/sport/|/stil-de-viata/|/showbiz/|/tech/|/istoria-zilei/|/blogurile-adevarul/|/stiri-externe/|/stiri-interne/|/stiri-locale/')
+
+# Non-article links (comments, tags, media files, social, ...)
+_SKIP_RE = re.compile(r'#comments|/tag/|/author/|facebook\.com|twitter\.com|\.jpg|\.png|\.pdf|/rss/|/search|mailto:')
+
+# Navigation / non-article link titles (matched against the lowercased title)
+_NAV_RE = re.compile(r'vezi toate|citește mai mult|mai multe din|comentarii|homepage|menu|contact|despre|află mai mult')
 
 def clean_text(text):
     """Clean and normalize text content"""
     if not text:
         return ""
-    # Remove extra whitespace and normalize
-    text = re.sub(r'\s+', ' ', text.strip())
+    # Collapse whitespace - str.split() also splits on non-breaking spaces, like \s did
+    text = ' '.join(text.split())
+    # Compose diacritics (ă/ș/ț) so RSS and homepage titles compare equal; the
+    # quick check skips the rewrite for text that is already NFC
+    if not unicodedata.is_normalized('NFC', text):
+        text = unicodedata.normalize('NFC', text)
     return text
 
+def find_descendant_by_class(node, fragment):
+    """Return the first descendant of node whose class attribute contains fragment"""
+    for child in node.traverse():
+        if child.mem_id != node.mem_id and fragment in (child.attributes.get('class') or ''):
+            return child
+    return None
+
+# url -> fetch_article_details result, for pages that were fetched successfully
+_ARTICLE_DETAILS = {}
+
+def fetch_article_details(url):
+    """
+    Fetch full content and dates for one article page - the page is
+    downloaded once and shared by all extractors. Cached per URL, so stories
+    present in both the RSS feed and on the homepage are only fetched once;
+    failed fetches are not cached and are retried on the next call
+    Returns (full_content, published_at, updated_at) - any of them can be None
+    """
+    cached = _ARTICLE_DETAILS.get(url)
+    if cached is not None:
+        return cached
+    
+    full_content = None
+    metadata = {'published_at': None, 'updated_at': None}
+    
+    try:
+        article_soup, page_html = fetch_and_parse(url, _SESSION)
+    except Exception as e:
+        logger.warning("⚠️  Page fetch failed for %s: %s", url, e)
+        article_soup = None
+    if article_soup is None:
+        return None, None, None
+    
+    try:
+        # Extract metadata from the shared soup (JSON-LD, meta tags)
+        metadata = extract_article_metadata(url, "adevarul", soup=article_soup)
+        logger.debug("📅 Metadata extracted: pub=%s, upd=%s", metadata.get('published_at'), metadata.get('updated_at'))
+    except Exception as e:
+        logger.warning("⚠️  Metadata extraction failed for %s: %s", url, e)
+    
+    try:
+        # Extract content from the same page
+        full_content = extract_article_content(url, "adevarul", html=page_html)
+        logger.debug("✅ Content extracted for: %s...", url[:60])
+    except Exception as e:
+        logger.warning("⚠️  Content extraction failed for %s: %s", url, e)
+    
+    # Either date can be None
+    details = full_content, metadata.get('published_at'), metadata.get('updated_at')
+    _ARTICLE_DETAILS[url] = details
+    return details
+
 def extract_adevarul_articles():
     """Extract articles from Adevarul.ro homepage - OPTIMIZED VERSION"""
     articles = []
     
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'ro-RO,ro;q=0.9,en;q=0.8',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1'
-        }
-        
-        print("🔍 Fetching Adevarul homepage with enhanced selectors...", file=sys.stderr)
+        logger.info("🔍 Fetching Adevarul homepage with enhanced selectors...")
         
         # Enhanced error handling for network requests
         try:
-            response = requests.get('https://adevarul.ro/', headers=headers, timeout=20, verify=True)
-            response.raise_for_status()
+            response = _SESSION.get('https://adevarul.ro/', timeout=20, verify=True, stream=True)
+            try:
+                response.raise_for_status()
+            except requests.exceptions.HTTPError:
+                # Streamed - hand the pooled connection back before falling back
+                response.close()
+                raise
         except requests.exceptions.SSLError as ssl_err:
-            print(f"❌ SSL Error accessing Adevarul homepage: {ssl_err}", file=sys.stderr)
+            logger.error("❌ SSL Error accessing Adevarul homepage: %s", ssl_err)
             return []
         except requests.exceptions.ConnectTimeout as timeout_err:
-            print(f"⏱️ Timeout Error accessing Adevarul homepage: {timeout_err}", file=sys.stderr)
+            logger.warning("⏱️ Timeout Error accessing Adevarul homepage: %s", timeout_err)
             return []
         except requests.exceptions.RequestException as req_err:
-            print(f"🌐 Request Error accessing Adevarul homepage: {req_err}", file=sys.stderr)
+            logger.warning("🌐 Request Error accessing Adevarul homepage: %s", req_err)
             # Check if it's a blocking issue
             if "403" in str(req_err) or "Forbidden" in str(req_err):
-                print("🚫 Detected IP blocking - switching to fallback mode", file=sys.stderr)
+                logger.warning("🚫 Detected IP blocking - switching to fallback mode")
                 return extract_adevarul_fallback()
             return extract_adevarul_fallback()
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        # Lexbor (C) parser - much faster than html.parser for the same CSS selectors.
+        # The body is read straight off the socket (gzip/br decoded by urllib3) and
+        # handed over as bytes, skipping the response.content copy and a str decode
+        # _HEADERS advertise br - urllib3 can only decode it with brotli installed
+        logger.debug("🗜️  Homepage Content-Encoding: %s", response.headers.get('Content-Encoding'))
         
-        print("📰 Searching for articles using multiple strategies...", file=sys.stderr)
+        with response:
+            response.raw.decode_content = True
+            tree = LexborHTMLParser(response.raw.read())
         
-        # STRATEGY 1: Enhanced selectors based on HTML analysis
-        enhanced_selectors = [
-            # Primary selectors for main articles
-            'a.title.titleAndHeadings[href*="adevarul.ro"]',
-            'a[data-gtrack*="homepage"][href*="adevarul.ro"]',
-            'a[data-gtrack*="box_deschidere"][href*="adevarul.ro"]',
-            
-            # Secondary selectors for additional articles
-            'a.item.svelte-hjtm2f[href*="adevarul.ro"]',
-            'a[href*="adevarul.ro"][class*="title"]',
-            'a[href*="adevarul.ro"][class*="svelte"]',
-            
-            # Catch-all for any adevarul.ro links with tracking
-            'a[data-gtrack][href*="adevarul.ro"]'
-        ]
+        logger.info("📰 Searching for articles using multiple strategies...")
+        
+        # STRATEGY 1: Enhanced selectors based on HTML analysis (_ARTICLE_SELECTORS)
         
-        found_articles = set()
+        # Cleaned href (no fragment/parameters) -> first matching <a> element
+        found_articles = {}
         
         # Collect all potential articles
-        for selector in enhanced_selectors:
+        for selector in _ARTICLE_SELECTORS:
             try:
-                elements = soup.select(selector)
-                print(f"   🔗 Selector '{selector}' found {len(elements)} elements", file=sys.stderr)
+                elements = tree.css(selector)
+                logger.debug("   🔗 Selector '%s' found %s elements", selector, len(elements))
                 
                 for element in elements:
-                    href = element.get('href', '')
-                    if href and href not in found_articles:
-                        # Only include actual article URLs
-                        if any(section in href for section in [
-                            '/stiri-', '/politica/', '/economie/', '/sport/', '/stil-de-viata/', 
-                            '/showbiz/', '/tech/', '/istoria-zilei/', '/blogurile-adevarul/',
-                            '/stiri-externe/', '/stiri-interne/', '/stiri-locale/'
-                        ]):
-                            found_articles.add(href)
+                    href = element.attributes.get('href') or ''
+                    # Only include actual article URLs, skip non-article links
+                    if not href or not _INCLUDE_RE.search(href) or _SKIP_RE.search(href):
+                        continue
+                    clean_href = href.partition('#')[0].partition('?')[0]  # Remove fragments and parameters
+                    if clean_href and clean_href not in found_articles:
+                        found_articles[clean_href] = element
                             
             except Exception as e:
-                print(f"   ⚠️  Selector error: {e}", file=sys.stderr)
+                logger.warning("   ⚠️  Selector error: %s", e)
                 continue
         
-        print(f"🎯 Found {len(found_articles)} unique article URLs", file=sys.stderr)
+        logger.info("🎯 Found %s unique article URLs", len(found_articles))
         
         # STRATEGY 2: Process each article URL and extract title/summary
-        processed_urls = set()
-        
         # Limit to 200 articles for faster processing (avoid timeout)
         max_articles = 200
-        print(f"📋 Processing maximum {max_articles} articles to avoid timeout", file=sys.stderr)
+        logger.info("📋 Processing maximum %s articles to avoid timeout", max_articles)
         
-        for href in list(found_articles)[:max_articles]:
+        # Title/summary come from the homepage DOM; the article pages are
+        # fetched afterwards in parallel
+        candidates = []
+        
+        for clean_href, link_element in list(found_articles.items())[:max_articles]:
             try:
-                # Skip duplicates and invalid URLs
-                clean_href = href.split('#')[0].split('?')[0]  # Remove fragments and parameters
-                if clean_href in processed_urls:
-                    continue
-                    
-                # Skip non-article links
-                if any(skip in href for skip in [
-                    '#comments', '/tag/', '/author/', 'facebook.com', 'twitter.com',
-                    '.jpg', '.png', '.pdf', '/rss/', '/search', 'mailto:'
-                ]):
-                    continue
-                
-                processed_urls.add(clean_href)
-                
-                # Find the element containing this URL to extract title and summary
+                # Title and summary come from the element that carried this URL
                 title = ""
                 summary = ""
                 
-                # Method A: Find by exact href match
-                link_element = soup.find('a', href=href)
-                if not link_element:
-                    # Method B: Find by partial href match
-                    link_elements = soup.find_all('a', href=lambda x: x and clean_href in x)
-                    if link_elements:
-                        link_element = link_elements[0]
-                
                 if link_element:
                     # Extract title from the link text
-                    title_text = clean_text(link_element.get_text())
+                    title_text = clean_text(link_element.text())
                     
                     # Enhanced title extraction for different structures
                     if not title_text or len(title_text) < 15:
                         # Try to find title in child elements
-                        title_elem = link_element.find(class_=lambda x: x and 'title' in str(x))
+                        title_elem = find_descendant_by_class(link_element, 'title')
                         if title_elem:
-                            title_text = clean_text(title_elem.get_text())
+                            title_text = clean_text(title_elem.text())
                     
                     # Clean and validate title
                     if title_text and len(title_text) >= 15:
                         # Remove video indicators and other prefixes
-                        title_text = re.sub(r'^(Video\s*)?', '', title_text, flags=re.IGNORECASE)
+                        title_text = _VIDEO_RE.sub('', title_text, count=1)
                         title = title_text.strip()
                     
                     # Extract summary from parent container
-                    parent_container = link_element.find_parent()
+                    parent_container = link_element.parent
                     if parent_container:
                         # Look for summary class
-                        summary_elem = parent_container.find(class_=lambda x: x and 'summary' in str(x))
+                        summary_elem = find_descendant_by_class(parent_container, 'summary')
                         if summary_elem:
-                            summary = clean_text(summary_elem.get_text())
+                            summary = clean_text(summary_elem.text())
                         
-                        # If no summary found, look for any text content nearby
+                        # If no summary found, try the first summary-like element nearby
                         if not summary:
-                            text_elements = parent_container.find_all(text=True)
+                            candidate = next((node for node in parent_container.css(_SUMMARY_SELECTOR) if node.mem_id != parent_container.mem_id), None)
+                            if candidate:
+                                candidate_text = clean_text(candidate.text(separator=' ', strip=True))[:300]
+                                if candidate_text != title:
+                                    summary = candidate_text
+                        
+                        # Last resort: first long text node, walked lazily so it stops at the first hit
+                        if not summary:
+                            text_elements = (node.text(deep=False) for node in parent_container.traverse(include_text=True) if node.tag == '-text')
                             for text in text_elements:
-                                text_content = clean_text(str(text))
+                                text_content = clean_text(text)
                                 if text_content and len(text_content) > 50 and text_content != title:
                                     summary = text_content[:300]
                                     break
@@ -194,84 +287,60 @@ def extract_adevarul_articles():
                     continue
                 
                 # Skip navigation and non-article titles
-                if any(skip in title.lower() for skip in [
-                    'vezi toate', 'citește mai mult', 'mai multe din', 'comentarii',
-                    'homepage', 'menu', 'contact', 'despre', 'află mai mult'
-                ]):
+                if _NAV_RE.search(title.lower()):
                     continue
                 
                 # Use title as summary if no summary found
                 if not summary or len(summary) < 20:
                     summary = title[:200] + "..." if len(title) > 200 else title
                 
-                # Create article object with content extraction (with timeout protection)
-                full_content = None
-                metadata = {'published_at': None, 'updated_at': None}
-                
-                try:
-                    # Extract content with timeout protection
-                    full_content = extract_article_content(clean_href, "adevarul")
-                    print(f"✅ Content extracted for: {title[:30]}...", file=sys.stderr)
-                except Exception as e:
-                    print(f"⚠️  Content extraction failed for {clean_href}: {e}", file=sys.stderr)
-                
-                try:
-                    # Extract metadata (published_at and updated_at) from the article page
-                    metadata = extract_article_metadata(clean_href, "adevarul")
-                    print(f"📅 Metadata extracted: pub={metadata.get('published_at')}, upd={metadata.get('updated_at')}", file=sys.stderr)
-                except Exception as e:
-                    print(f"⚠️  Metadata extraction failed for {clean_href}: {e}", file=sys.stderr)
-                
-                # Use published_at from metadata if available, otherwise from old method
-                final_published_at = metadata.get('published_at')
-                if not final_published_at:
-                    # Extract published date from article (legacy method)
-                    published_date = extract_published_date_from_content(clean_href, "adevarul")
-                    final_published_at = format_for_database(published_date)
-                
-                # Get updated_at from metadata (could be None)
-                updated_at = metadata.get('updated_at')  # This can be None
-                
-                # Generate summary from content or use fallback
-                if full_content and len(full_content) > 100:
-                    final_summary = generate_summary_from_content(full_content, 100)
-                    print(f"✅ Generated summary from content: {final_summary[:50]}...", file=sys.stderr)
-                else:
-                    # Fallback to extracted summary or title
-                    final_summary = summary if summary and len(summary) > 20 else (title[:100] + "..." if len(title) > 100 else title)
-                    print(f"⚠️  Using fallback summary: {final_summary[:50]}...", file=sys.stderr)
-                
-                article_data = {
-                    'title': title,
-                    'summary': final_summary,
-                    'content': full_content,  # Include full content
-                    'link': clean_href,
-                    'published_at': final_published_at,  # Real publication date from metadata
-                    'updated_at': updated_at,  # Real update date or None
-                    'timestamp': get_romania_now().isoformat()  # Data extragerii (pentru compatibilitate)
-                }
-                
-                articles.append(article_data)
-                print(f"✅ Extracted: {title[:70]}... (updated_at: {'Yes' if updated_at else 'None'})", file=sys.stderr)
+                candidates.append((clean_href, title, summary))
                 
             except Exception as e:
-                print(f"⚠️  Error processing article {href}: {e}", file=sys.stderr)
+                logger.warning("⚠️  Error processing article %s: %s", clean_href, e)
                 continue
         
+        # Fetch content + metadata for all candidates concurrently (results keep homepage order)
+        with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
+            details = list(executor.map(fetch_article_details, [candidate[0] for candidate in candidates]))
+        
+        for (clean_href, title, summary), (full_content, final_published_at, updated_at) in zip(candidates, details):
+            # Generate summary from content or use fallback
+            if full_content and len(full_content) > 100:
+                final_summary = generate_summary_from_content(full_content, 100)
+                logger.debug("✅ Generated summary from content: %s...", final_summary[:50])
+            else:
+                # Fallback to extracted summary or title
+                final_summary = summary if summary and len(summary) > 20 else (title[:100] + "..." if len(title) > 100 else title)
+                logger.debug("⚠️  Using fallback summary: %s...", final_summary[:50])
+            
+            article_data = {
+                'title': title,
+                'summary': final_summary,
+                'content': full_content,  # Include full content
+                'link': clean_href,
+                'published_at': final_published_at,  # Real publication date from metadata
+                'updated_at': updated_at,  # Real update date or None
+                'timestamp': get_romania_now().isoformat()  # Data extragerii (pentru compatibilitate)
+            }
+            
+            articles.append(article_data)
+            logger.debug("✅ Extracted: %s... (updated_at: %s)", title[:70], 'Yes' if updated_at else 'None')
+        
         # Validation - no fallback needed since RSS runs separately
         if len(articles) < 5:
-            print(f"⚠️  Only {len(articles)} articles found from homepage scraping", file=sys.stderr)
+            logger.warning("⚠️  Only %s articles found from homepage scraping", len(articles))
         
-        print(f"🎉 Successfully extracted {len(articles)} articles from Adevarul homepage", file=sys.stderr)
+        logger.info("🎉 Successfully extracted %s articles from Adevarul homepage", len(articles))
         
     except requests.RequestException as e:
-        print(f"❌ Network error fetching Adevarul homepage: {e}", file=sys.stderr)
-        print("⚠️  Homepage scraping failed, returning empty list", file=sys.stderr)
+        logger.error("❌ Network error fetching Adevarul homepage: %s", e)
+        logger.warning("⚠️  Homepage scraping failed, returning empty list")
         return []
         
     except Exception as e:
-        print(f"💥 Unexpected error in homepage scraping: {e}", file=sys.stderr)
-        print("⚠️  Homepage scraping failed, returning empty list", file=sys.stderr)
+        logger.error("💥 Unexpected error in homepage scraping: %s", e)
+        logger.warning("⚠️  Homepage scraping failed, returning empty list")
         return []
     
     return articles
@@ -281,51 +350,44 @@ def extract_adevarul_rss():
     articles = []
     
     try:
-        import xml.etree.ElementTree as ET
-        
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        }
-        
-        print("📡 Fetching Adevarul RSS feed...", file=sys.stderr)
+        logger.info("📡 Fetching Adevarul RSS feed...")
         
         # Enhanced error handling for network requests  
         try:
-            response = requests.get('https://adevarul.ro/rss/index', headers=headers, timeout=10, verify=True)
+            response = _SESSION.get('https://adevarul.ro/rss/index', timeout=10, verify=True)
             response.raise_for_status()
         except requests.exceptions.SSLError as ssl_err:
-            print(f"❌ SSL Error accessing Adevarul RSS: {ssl_err}", file=sys.stderr)
+            logger.error("❌ SSL Error accessing Adevarul RSS: %s", ssl_err)
             return []
         except requests.exceptions.ConnectTimeout as timeout_err:
-            print(f"⏱️ Timeout Error accessing Adevarul RSS: {timeout_err}", file=sys.stderr)
+            logger.warning("⏱️ Timeout Error accessing Adevarul RSS: %s", timeout_err)
             return []
         except requests.exceptions.RequestException as req_err:
-            print(f"🌐 Request Error accessing Adevarul RSS: {req_err}", file=sys.stderr)
+            logger.warning("🌐 Request Error accessing Adevarul RSS: %s", req_err)
             # Check if it's a blocking issue
             if "403" in str(req_err) or "Forbidden" in str(req_err):
-                print("🚫 Detected IP blocking - switching to fallback mode", file=sys.stderr)
+                logger.warning("🚫 Detected IP blocking - switching to fallback mode")
                 return extract_adevarul_fallback()
             return extract_adevarul_fallback()
         
-        # Parse RSS XML
-        root = ET.fromstring(response.content)
-        
-        # Find all items in RSS
-        items = root.findall('.//item')
+        # Stream RSS items with lxml - nothing past the 200th item is parsed
+        items = etree.iterparse(io.BytesIO(response.content), tag='item')
+        item_count = 0
         
-        print(f"📰 Found {len(items)} items in RSS feed", file=sys.stderr)
+        # (title, description, link, published_at) read from the feed; the
+        # article pages are fetched afterwards in parallel
+        feed_entries = []
         
-        for item in items[:200]:  # Limit to 200 articles
+        for _, item in items:
+            if item_count >= 200:  # Limit to 200 articles
+                break
+            item_count += 1
+            
             try:
-                title_elem = item.find('title')
-                description_elem = item.find('description')
-                link_elem = item.find('link')
-                pubdate_elem = item.find('pubDate')
-                
-                title = clean_text(title_elem.text) if title_elem is not None else ""
-                description = clean_text(description_elem.text) if description_elem is not None else ""
-                link = link_elem.text.strip() if link_elem is not None else ""
-                pubdate = pubdate_elem.text.strip() if pubdate_elem is not None else ""
+                title = clean_text(item.findtext('title'))
+                description = clean_text(item.findtext('description'))
+                link = (item.findtext('link') or '').strip()
+                pubdate = (item.findtext('pubDate') or '').strip()
                 
                 # Skip if essential fields are missing
                 if not title or not link or len(title) < 10:
@@ -343,54 +405,60 @@ def extract_adevarul_rss():
                 else:
                     published_at = get_romania_now().isoformat()
                 
-                # Extract full content from the article URL
-                full_content = extract_article_content(link, "adevarul")
-                
-                # Extract metadata (updated_at) from the article page
-                metadata = extract_article_metadata(link, "adevarul")
-                updated_at = metadata.get('updated_at')  # This can be None
-                
-                # Use published_at from RSS as primary source, but could also check metadata
-                final_published_at = published_at
-                if not final_published_at and metadata.get('published_at'):
-                    final_published_at = metadata.get('published_at')
-                
-                # Generate summary from content or use description as fallback
-                if full_content and len(full_content) > 100:
-                    final_summary = generate_summary_from_content(full_content, 100)
-                    print(f"✅ RSS: Generated summary from content", file=sys.stderr)
-                else:
-                    # Use description as summary, fallback to title
-                    final_summary = description if description else (title[:100] + "..." if len(title) > 100 else title)
-                    print(f"⚠️  RSS: Using fallback summary", file=sys.stderr)
-                
-                article_data = {
-                    'title': title,
-                    'summary': final_summary,
-                    'content': full_content,  # Include full content
-                    'link': link,
-                    'published_at': final_published_at,  # Real publication date from RSS
-                    'updated_at': updated_at  # Real update date or None
-                }
-                
-                articles.append(article_data)
-                print(f"✅ RSS: {title[:50]}... (updated_at: {'Yes' if updated_at else 'None'})", file=sys.stderr)
+                feed_entries.append((title, description, link, published_at))
                 
             except Exception as e:
-                print(f"⚠️  Error processing RSS item: {e}", file=sys.stderr)
+                logger.warning("⚠️  Error processing RSS item: %s", e)
                 continue
+            finally:
+                # Free the processed item and its already-seen siblings
+                item.clear()
+                while item.getprevious() is not None:
+                    del item.getparent()[0]
+        
+        # Content + dates from the article pages, concurrently (cached - reused by the homepage pass)
+        with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
+            details = list(executor.map(fetch_article_details, [entry[2] for entry in feed_entries]))
+        
+        for (title, description, link, published_at), (full_content, page_published_at, updated_at) in zip(feed_entries, details):
+            # Use published_at from RSS as primary source, but could also check metadata
+            final_published_at = published_at
+            if not final_published_at and page_published_at:
+                final_published_at = page_published_at
+            
+            # Generate summary from content or use description as fallback
+            if full_content and len(full_content) > 100:
+                final_summary = generate_summary_from_content(full_content, 100)
+                logger.debug("✅ RSS: Generated summary from content")
+            else:
+                # Use description as summary, fallback to title
+                final_summary = description if description else (title[:100] + "..." if len(title) > 100 else title)
+                logger.debug("⚠️  RSS: Using fallback summary")
+            
+            article_data = {
+                'title': title,
+                'summary': final_summary,
+                'content': full_content,  # Include full content
+                'link': link,
+                'published_at': final_published_at,  # Real publication date from RSS
+                'updated_at': updated_at  # Real update date or None
+            }
+            
+            articles.append(article_data)
+            logger.debug("✅ RSS: %s... (updated_at: %s)", title[:50], 'Yes' if updated_at else 'None')
         
-        print(f"🎉 Successfully extracted {len(articles)} articles from Adevarul RSS", file=sys.stderr)
+        logger.info("📰 Processed %s items from RSS feed", item_count)
+        logger.info("🎉 Successfully extracted %s articles from Adevarul RSS", len(articles))
         
     except Exception as e:
-        print(f"❌ Error fetching RSS feed: {e}", file=sys.stderr)
+        logger.error("❌ Error fetching RSS feed: %s", e)
         return extract_adevarul_fallback()
     
     return articles
 
 def extract_adevarul_fallback():
     """Fallback method when Adevarul.ro blocks access"""
-    print("🔄 Using fallback method for Adevarul scraping", file=sys.stderr)
+    logger.warning("🔄 Using fallback method for Adevarul scraping")
     
     # Return minimal data to keep the system running
     fallback_articles = [
@@ -403,87 +471,94 @@ def extract_adevarul_fallback():
         }
     ]
     
-    print(f"🔄 Fallback method returned {len(fallback_articles)} placeholder articles", file=sys.stderr)
+    logger.info("🔄 Fallback method returned %s placeholder articles", len(fallback_articles))
     return fallback_articles
 
+def short_hash(text):
+    """64-bit blake2b digest of text - compact fixed-size set key"""
+    return blake2b(text.encode('utf-8'), digest_size=8).digest()
+
+def article_dedup_key(article):
+    """Return hashed (link_key, title_key) used to detect duplicate articles - link_key is None without a link"""
+    link_key = (article.get('link') or '').partition('?')[0].partition('#')[0].lower()  # Clean URL
+    title_key = ' '.join((article.get('title') or '').split()).lower()
+    return (short_hash(link_key) if link_key else None), short_hash(title_key)
+
 def combine_and_deduplicate_articles(rss_articles, homepage_articles):
     """Combine articles from RSS and homepage, removing duplicates based on title and link"""
     try:
-        print("🔄 Combining articles from RSS and homepage...", file=sys.stderr)
+        logger.info("🔄 Combining articles from RSS and homepage...")
         
         all_articles = []
         seen_links = set()
         seen_titles = set()
         
-        # Process RSS articles first (they have priority due to real-time updates)
-        print("📡 Processing RSS articles (priority)...", file=sys.stderr)
-        for article in rss_articles:
-            link_key = article.get('link', '').split('?')[0].split('#')[0].lower()  # Clean URL
-            title_key = clean_text(article.get('title', '')).lower()
+        # RSS articles first (they have priority due to real-time updates), then homepage extras
+        for article in chain(rss_articles, homepage_articles):
+            link_key, title_key = article_dedup_key(article)
             
             if link_key and link_key not in seen_links and title_key not in seen_titles:
                 seen_links.add(link_key)
                 seen_titles.add(title_key)
                 all_articles.append(article)
-                print(f"   ✅ Added RSS: {article.get('title', 'No title')[:50]}...", file=sys.stderr)
-            else:
-                print(f"   ⏭️  Skipped RSS duplicate: {article.get('title', 'No title')[:30]}...", file=sys.stderr)
-        
-        # Process homepage articles (additional content not in RSS)
-        print("🏠 Processing homepage articles (additional)...", file=sys.stderr)
-        for article in homepage_articles:
-            link_key = article.get('link', '').split('?')[0].split('#')[0].lower()  # Clean URL
-            title_key = clean_text(article.get('title', '')).lower()
-            
-            if link_key and link_key not in seen_links and title_key not in seen_titles:
-                seen_links.add(link_key)
-                seen_titles.add(title_key)
-                all_articles.append(article)
-                print(f"   ✅ Added Homepage: {article.get('title', 'No title')[:50]}...", file=sys.stderr)
-            else:
-                print(f"   ⏭️  Skipped Homepage duplicate: {article.get('title', 'No title')[:30]}...", file=sys.stderr)
         
-        print(f"📊 Deduplication summary:", file=sys.stderr)
-        print(f"   📡 RSS articles: {len(rss_articles)}", file=sys.stderr)
-        print(f"   🏠 Homepage articles: {len(homepage_articles)}", file=sys.stderr)
-        print(f"   🎯 Final unique articles: {len(all_articles)}", file=sys.stderr)
+        logger.info("📊 Deduplication summary:")
+        logger.info("   📡 RSS articles: %s", len(rss_articles))
+        logger.info("   🏠 Homepage articles: %s", len(homepage_articles))
+        logger.info("   ⏭️  Duplicates skipped: %s", len(rss_articles) + len(homepage_articles) - len(all_articles))
+        logger.info("   🎯 Final unique articles: %s", len(all_articles))
         
         return all_articles
         
     except Exception as e:
-        print(f"⚠️  Error in deduplication: {e}", file=sys.stderr)
+        logger.warning("⚠️  Error in deduplication: %s", e)
         # Fallback: return RSS articles if deduplication fails
         return rss_articles if rss_articles else homepage_articles
 
+def write_json_output(data):
+    """Write the articles as compact UTF-8 JSON to stdout (orjson when installed)"""
+    if orjson is not None:
+        output = orjson.dumps(data)
+        buffer = getattr(sys.stdout, 'buffer', None)
+        if buffer is not None:
+            sys.stdout.flush()
+            buffer.write(output + b'\n')
+            buffer.flush()
+        else:
+            print(output.decode('utf-8'))
+    else:
+        print(json.dumps(data, ensure_ascii=False))
+
 def main():
     """Main function - called when script is run directly"""
+    configure_scraper_logging()
+    
     try:
-        print("🎯 Starting Adevarul scraper - Dual method approach", file=sys.stderr)
+        logger.info("🎯 Starting Adevarul scraper - Dual method approach")
         
         # STEP 1: RSS Feed method (primary - real-time updates)
-        print("📡 STEP 1: Extracting from RSS feed (real-time content)...", file=sys.stderr)
+        logger.info("📡 STEP 1: Extracting from RSS feed (real-time content)...")
         rss_articles = extract_adevarul_rss()
-        print(f"✅ RSS method yielded {len(rss_articles)} articles", file=sys.stderr)
+        logger.info("✅ RSS method yielded %s articles", len(rss_articles))
         
         # STEP 2: Homepage scraping method (mandatory - additional content)
-        print("� STEP 2: Extracting from homepage (additional content)...", file=sys.stderr)
+        logger.info("� STEP 2: Extracting from homepage (additional content)...")
         homepage_articles = extract_adevarul_articles()
-        print(f"✅ Homepage method yielded {len(homepage_articles)} articles", file=sys.stderr)
+        logger.info("✅ Homepage method yielded %s articles", len(homepage_articles))
         
         # STEP 3: Combine and deduplicate articles
-        print("🔗 STEP 3: Combining and deduplicating articles...", file=sys.stderr)
+        logger.info("🔗 STEP 3: Combining and deduplicating articles...")
         all_articles = combine_and_deduplicate_articles(rss_articles, homepage_articles)
         print(f"🎉 Final result: {len(all_articles)} unique articles", file=sys.stderr)
         
         # Output JSON to stdout for the scheduler with proper encoding
-        json_output = json.dumps(all_articles, ensure_ascii=False, indent=2)
-        print(json_output)
+        write_json_output(all_articles)
         
         # Exit with appropriate code
         sys.exit(0 if all_articles else 1)
         
     except Exception as e:
-        print(f"💥 Fatal error in Adevarul scraper: {e}", file=sys.stderr)
+        logger.error("💥 Fatal error in Adevarul scraper: %s", e)
         # Output empty array to prevent scheduler errors
         print("[]")
         sys.exit(1)
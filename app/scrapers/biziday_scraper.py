@@ -5,68 +5,103 @@ Extracts news articles and outputs JSON format for the scheduler
 """
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, SoupStrainer
 import json
+import logging
 import sys
 import os
 from datetime import datetime
+import atexit
 import re
+from html import unescape
+from concurrent.futures import ThreadPoolExecutor
 try:
-    from .content_extractor import extract_article_content, generate_summary_from_content, extract_article_metadata
-    from .timestamp_utils import extract_biziday_published_date, format_for_database, get_romania_now
+    from .content_extractor import extract_article_content, generate_summary_from_content, extract_article_metadata, fetch_html, HTML_PARSER
+    from .timestamp_utils import extract_biziday_published_date, format_for_database, get_romania_now, parse_iso_datetime
+    from .scraper_logging import configure_scraper_logging
 except ImportError:
     # Fallback for when running as script
-    import os
-    import sys
     sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-    from content_extractor import extract_article_content, generate_summary_from_content, extract_article_metadata
-    from timestamp_utils import extract_biziday_published_date, format_for_database, get_romania_now
+    from content_extractor import extract_article_content, generate_summary_from_content, extract_article_metadata, fetch_html, HTML_PARSER
+    from timestamp_utils import extract_biziday_published_date, format_for_database, get_romania_now, parse_iso_datetime
+    from scraper_logging import configure_scraper_logging
 
-# Fix Windows Unicode encoding issues
-if sys.platform == "win32":
-    import codecs
-    try:
-        if hasattr(sys.stdout, 'buffer'):
-            sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer)
-        if hasattr(sys.stderr, 'buffer'):
-            sys.stderr = codecs.getwriter('utf-8')(sys.stderr.buffer)
-    except:
-        pass  # Fallback if encoding fix fails
+# Article pages are fetched concurrently - each fetch is a blocking network
+# wait, so running them side by side overlaps the waits
+_MAX_WORKERS = 16
+
+# Progress goes through logging - main() sets it up via configure_scraper_logging()
+logger = logging.getLogger(__name__)
+
+# Shared session - every request goes to www.biziday.ro, so keep-alive
+# connections skip a TCP+TLS handshake per article
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+})
+_SESSION.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=16))
+atexit.register(_SESSION.close)
+
+# extract_article_metadata only reads <meta> and <time> tags - the metadata
+# soup skips building the rest of the page (scripts, styles, body markup)
+_METADATA_STRAINER = SoupStrainer(['meta', 'time'])
+
+# The article:* date metas sit near the top of <head> - a byte-level scan of
+# the first 16 KB usually finds both without building any tree
+_HEAD_SCAN_BYTES = 16 * 1024
+_META_RE = re.compile(
+    rb'<meta[^>]+property=["\'](article:(?:published|modified)_time)["\'][^>]+content=["\']([^"\']+)["\']',
+    re.IGNORECASE
+)
+
+def scan_date_metas(html):
+    """Return {property: content} for the article date metas found in the page head"""
+    return {
+        prop.decode('ascii').lower(): unescape(value.decode('utf-8', 'replace'))
+        for prop, value in _META_RE.findall(html[:_HEAD_SCAN_BYTES])
+    }
 
 def clean_text(text):
     """Clean and normalize text content"""
     if not text:
         return ""
     # Remove extra whitespace and normalize
-    text = re.sub(r'\s+', ' ', text.strip())
-    return text
+    return ' '.join(text.split())
 
-def extract_article_metadata(url, source_name=""):
+def extract_article_metadata(url, source_name="", soup=None, html=None):
     """
     Extract publication and modification dates from article page meta tags
     Returns dict with 'published_at' and 'updated_at' (can be None)
+    Pass an already-parsed page as `soup`, or its raw bytes as `html`, to
+    skip downloading it again
     """
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-        }
-        
-        # Enhanced error handling for network requests
-        try:
-            response = requests.get(url, headers=headers, timeout=10, verify=True)
-            response.raise_for_status()
-        except requests.exceptions.SSLError as ssl_err:
-            print(f"❌ SSL Error for {url}: {ssl_err}")
-            return {'published_at': None, 'updated_at': None}
-        except requests.exceptions.ConnectTimeout as timeout_err:
-            print(f"⏱️ Timeout Error for {url}: {timeout_err}")
-            return {'published_at': None, 'updated_at': None}
-        except requests.exceptions.RequestException as req_err:
-            print(f"🌐 Request Error for {url}: {req_err}")
-            return {'published_at': None, 'updated_at': None}
+        if soup is None and html is None:
+            # Enhanced error handling for network requests
+            try:
+                response = _SESSION.get(url, timeout=10, verify=True)
+                response.raise_for_status()
+            except requests.exceptions.SSLError as ssl_err:
+                logger.error("❌ SSL Error for %s: %s", url, ssl_err)
+                return {'published_at': None, 'updated_at': None}
+            except requests.exceptions.ConnectTimeout as timeout_err:
+                logger.warning("⏱️ Timeout Error for %s: %s", url, timeout_err)
+                return {'published_at': None, 'updated_at': None}
+            except requests.exceptions.RequestException as req_err:
+                logger.warning("🌐 Request Error for %s: %s", url, req_err)
+                return {'published_at': None, 'updated_at': None}
+            
+            html = response.content
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        metas = None
+        if soup is None:
+            # Fast path: regex scan of the head; parse only if a date is missing
+            metas = scan_date_metas(html)
+            if len(metas) < 2:
+                metas = None
+                soup = BeautifulSoup(html, HTML_PARSER, parse_only=_METADATA_STRAINER)
         
         metadata = {
             'published_at': None,
@@ -74,40 +109,42 @@ def extract_article_metadata(url, source_name=""):
         }
         
         if 'biziday.ro' in url.lower():
+            if metas is None:
+                # Index the property meta tags in one pass over the page
+                metas = {meta.get('property'): meta.get('content') for meta in soup.find_all('meta', property=True)}
+            
             # Extract published date from article:published_time meta tag
-            published_meta = soup.find('meta', {'property': 'article:published_time'})
-            if published_meta:
-                published_content = published_meta.get('content')
-                if published_content:
-                    try:
-                        published_dt = datetime.fromisoformat(published_content.replace('Z', '+00:00'))
-                        metadata['published_at'] = published_dt.isoformat()
-                        print(f"📅 Found published date: {published_content}", file=sys.stderr)
-                    except:
-                        pass
+            published_content = metas.get('article:published_time')
+            if published_content:
+                try:
+                    published_dt = parse_iso_datetime(published_content)
+                    metadata['published_at'] = published_dt.isoformat()
+                    logger.debug("📅 Found published date: %s", published_content)
+                except:
+                    pass
             
             # Extract updated date from article:modified_time meta tag
-            modified_meta = soup.find('meta', {'property': 'article:modified_time'})
-            if modified_meta:
-                modified_content = modified_meta.get('content')
-                if modified_content:
-                    try:
-                        modified_dt = datetime.fromisoformat(modified_content.replace('Z', '+00:00'))
-                        metadata['updated_at'] = modified_dt.isoformat()
-                        print(f"🔄 Found updated date: {modified_content}", file=sys.stderr)
-                    except:
-                        pass
+            modified_content = metas.get('article:modified_time')
+            if modified_content:
+                try:
+                    modified_dt = parse_iso_datetime(modified_content)
+                    metadata['updated_at'] = modified_dt.isoformat()
+                    logger.debug("🔄 Found updated date: %s", modified_content)
+                except:
+                    pass
             
             # Also try to extract from time elements with datetime attributes
             if not metadata['published_at']:
+                if soup is None:
+                    soup = BeautifulSoup(html, HTML_PARSER, parse_only=_METADATA_STRAINER)
                 time_elements = soup.find_all('time')
                 for time_elem in time_elements:
                     datetime_attr = time_elem.get('datetime')
                     if datetime_attr:
                         try:
-                            parsed_time = datetime.fromisoformat(datetime_attr.replace('Z', '+00:00'))
+                            parsed_time = parse_iso_datetime(datetime_attr)
                             metadata['published_at'] = parsed_time.isoformat()
-                            print(f"📅 Found published date from time element: {datetime_attr}", file=sys.stderr)
+                            logger.debug("📅 Found published date from time element: %s", datetime_attr)
                             break
                         except:
                             continue
@@ -115,63 +152,125 @@ def extract_article_metadata(url, source_name=""):
         return metadata
         
     except Exception as e:
-        print(f"⚠️  Error extracting metadata from {url}: {e}", file=sys.stderr)
+        logger.warning("⚠️  Error extracting metadata from %s: %s", url, e)
         return {'published_at': None, 'updated_at': None}
 
+def fetch_article_details(link):
+    """
+    Fetch full content and metadata for one Biziday article page - the page
+    is downloaded once and shared by both extractors. Callers dedupe links
+    first, so a story listed in several homepage sections is only fetched once
+    Returns (full_content, metadata) - content can be None
+    """
+    page_html = fetch_html(link, _SESSION)
+    if page_html is None:
+        return None, {'published_at': None, 'updated_at': None}
+    
+    # Extract metadata (published_at and updated_at) from the same page
+    metadata = extract_article_metadata(link, "biziday", html=page_html)
+    
+    # Extract full content from the same page
+    full_content = extract_article_content(link, "biziday", html=page_html)
+    
+    return full_content, metadata
+
+def process_article(candidate):
+    """
+    Build the article dict for one homepage candidate - runs in the worker
+    pool, fetching the article page and combining it with the homepage data
+    Returns the article dict or None if required data is missing
+    """
+    i, link, title, summary, published_at = candidate
+    full_content, metadata = fetch_article_details(link)
+    
+    # Use published_at from metadata if available, otherwise use time element
+    final_published_at = metadata.get('published_at')
+    if not final_published_at:
+        final_published_at = published_at
+    
+    # Get updated_at from metadata (could be None)
+    updated_at = metadata.get('updated_at')  # This can be None
+    
+    # Generate summary from content or use fallback
+    if full_content and len(full_content) > 100:
+        final_summary = generate_summary_from_content(full_content, 100)
+        logger.debug("✅ Generated summary from content: %s...", final_summary[:50])
+    else:
+        # Use extracted summary or title as fallback
+        final_summary = summary if summary and len(summary) > 20 else (title[:100] + "..." if len(title) > 100 else title)
+        logger.debug("⚠️  Using fallback summary: %s...", final_summary[:50])
+    
+    # Ensure we have minimum required data
+    if title and link and final_summary:
+        article_data = {
+            'title': title,
+            'summary': final_summary,
+            'content': full_content,  # Include full content
+            'link': link,
+            'published_at': final_published_at,  # Real publication date from meta tags
+            'updated_at': updated_at  # Real update date or None
+        }
+        logger.debug("✅ Extracted article %s: %s... (updated_at: %s)", i+1, title[:50], 'Yes' if updated_at else 'None')
+        return article_data
+    
+    logger.warning("⚠️  Skipping incomplete article %s: title=%s, link=%s, summary=%s", i+1, bool(title), bool(link), bool(summary))
+    return None
+
 def extract_biziday_articles():
     """Extract articles from Biziday.ro"""
     articles = []
     
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        
-        print("🔍 Fetching Biziday.ro homepage...", file=sys.stderr)
+        logger.info("🔍 Fetching Biziday.ro homepage...")
         
         # Enhanced error handling for network requests
         try:
-            response = requests.get('https://www.biziday.ro', headers=headers, timeout=10, verify=True)
+            response = _SESSION.get('https://www.biziday.ro', timeout=10, verify=True)
             response.raise_for_status()
         except requests.exceptions.SSLError as ssl_err:
-            print(f"❌ SSL Error accessing Biziday homepage: {ssl_err}", file=sys.stderr)
+            logger.error("❌ SSL Error accessing Biziday homepage: %s", ssl_err)
             return []
         except requests.exceptions.ConnectTimeout as timeout_err:
-            print(f"⏱️ Timeout Error accessing Biziday homepage: {timeout_err}", file=sys.stderr)
+            logger.warning("⏱️ Timeout Error accessing Biziday homepage: %s", timeout_err)
             return []
         except requests.exceptions.RequestException as req_err:
-            print(f"🌐 Request Error accessing Biziday homepage: {req_err}", file=sys.stderr)
+            logger.warning("🌐 Request Error accessing Biziday homepage: %s", req_err)
             return []
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = BeautifulSoup(response.content, HTML_PARSER)
         
         # Find article elements - updated selector based on the HTML structure
         article_elements = soup.find_all('li', class_='article')
         
-        print(f"📊 Found {len(article_elements)} articles on page", file=sys.stderr)
+        logger.info("📊 Found %s articles on page", len(article_elements))
         
         if not article_elements:
-            print("⚠️  No articles found - trying alternative selectors", file=sys.stderr)
+            logger.warning("⚠️  No articles found - trying alternative selectors")
             # Try alternative selectors
             article_elements = soup.find_all('article') or soup.find_all('div', class_='post')
         
+        # Link/title/summary/date read from the homepage; the article pages
+        # are fetched afterwards in parallel
+        candidates = []
+        seen_links = set()
+        
         # Remove the limit - extract ALL articles found
         for i, article in enumerate(article_elements):
             try:
                 # Skip ad elements
                 if article.get('class') and 'is-ad' in article.get('class'):
-                    print(f"⏭️  Skipping ad element {i+1}", file=sys.stderr)
+                    logger.debug("⏭️  Skipping ad element %s", i+1)
                     continue
                 
                 # Find the main link
                 link_element = article.find('a', class_='post-url')
                 if not link_element:
-                    print(f"⚠️  No link found for article {i+1}", file=sys.stderr)
+                    logger.warning("⚠️  No link found for article %s", i+1)
                     continue
                 
                 link = link_element.get('href')
                 if not link:
-                    print(f"⚠️  Empty link for article {i+1}", file=sys.stderr)
+                    logger.warning("⚠️  Empty link for article %s", i+1)
                     continue
                 
                 # Extract title
@@ -198,60 +297,34 @@ def extract_biziday_articles():
                     if datetime_attr:
                         try:
                             # Parse the datetime - this is the real publication date
-                            parsed_time = datetime.fromisoformat(datetime_attr.replace('Z', '+00:00'))
+                            parsed_time = parse_iso_datetime(datetime_attr)
                             published_at = parsed_time.isoformat()
                         except:
                             published_at = get_romania_now().isoformat()
                 else:
                     published_at = get_romania_now().isoformat()
                 
-                # Extract full content from the article URL
-                full_content = extract_article_content(link, "biziday")
-                
-                # Extract metadata (published_at and updated_at) from the article page
-                metadata = extract_article_metadata(link, "biziday")
-                
-                # Use published_at from metadata if available, otherwise use time element
-                final_published_at = metadata.get('published_at')
-                if not final_published_at:
-                    final_published_at = published_at
-                
-                # Get updated_at from metadata (could be None)
-                updated_at = metadata.get('updated_at')  # This can be None
+                # Featured and latest sections can both list a story - keep the first
+                if link in seen_links:
+                    logger.debug("⏭️  Skipping duplicate link for article %s", i+1)
+                    continue
+                seen_links.add(link)
                 
-                # Generate summary from content or use fallback
-                if full_content and len(full_content) > 100:
-                    final_summary = generate_summary_from_content(full_content, 100)
-                    print(f"✅ Generated summary from content: {final_summary[:50]}...", file=sys.stderr)
-                else:
-                    # Use extracted summary or title as fallback
-                    final_summary = summary if summary and len(summary) > 20 else (title[:100] + "..." if len(title) > 100 else title)
-                    print(f"⚠️  Using fallback summary: {final_summary[:50]}...", file=sys.stderr)
+                candidates.append((i, link, title, summary, published_at))
                 
-                # Ensure we have minimum required data
-                if title and link and final_summary:
-                    article_data = {
-                        'title': title,
-                        'summary': final_summary,
-                        'content': full_content,  # Include full content
-                        'link': link,
-                        'published_at': final_published_at,  # Real publication date from meta tags
-                        'updated_at': updated_at  # Real update date or None
-                    }
-                    articles.append(article_data)
-                    print(f"✅ Extracted article {len(articles)}: {title[:50]}... (updated_at: {'Yes' if updated_at else 'None'})", file=sys.stderr)
-                else:
-                    print(f"⚠️  Skipping incomplete article {i+1}: title={bool(title)}, link={bool(link)}, summary={bool(summary)}", file=sys.stderr)
-                    
             except Exception as e:
-                print(f"❌ Error processing article {i+1}: {e}", file=sys.stderr)
+                logger.warning("❌ Error processing article %s: %s", i+1, e)
                 continue
         
-        print(f"🎉 Successfully extracted {len(articles)} articles from Biziday", file=sys.stderr)
+        # Fetch and assemble all articles concurrently (results keep page order)
+        with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
+            articles = [article_data for article_data in executor.map(process_article, candidates) if article_data]
+        
+        logger.info("🎉 Successfully extracted %s articles from Biziday", len(articles))
         
         # If no articles found, return mock data for testing
         if not articles:
-            print("📝 No articles found, returning mock data for testing", file=sys.stderr)
+            logger.warning("📝 No articles found, returning mock data for testing")
             articles = [{
                 'title': 'Test Article from Biziday - No Real Data Available',
                 'summary': 'This is a test article because no real articles could be extracted from Biziday. The website might have anti-scraping measures or the structure has changed.',
@@ -263,7 +336,7 @@ def extract_biziday_articles():
         return articles
         
     except requests.RequestException as e:
-        print(f"❌ Network error accessing Biziday: {e}", file=sys.stderr)
+        logger.error("❌ Network error accessing Biziday: %s", e)
         # Return mock data for testing
         return [{
             'title': 'Network Error - Biziday Unavailable',
@@ -274,7 +347,7 @@ def extract_biziday_articles():
         }]
         
     except Exception as e:
-        print(f"❌ Unexpected error in Biziday scraper: {e}", file=sys.stderr)
+        logger.error("❌ Unexpected error in Biziday scraper: %s", e)
         # Return mock data for testing
         return [{
             'title': 'Scraper Error - Biziday',
@@ -286,6 +359,8 @@ def extract_biziday_articles():
 
 def main():
     """Main function - called when script is run directly"""
+    configure_scraper_logging()
+    
     try:
         articles = extract_biziday_articles()
         
@@ -297,7 +372,7 @@ def main():
         sys.exit(0 if articles else 1)
         
     except Exception as e:
-        print(f"💥 Fatal error in Biziday scraper: {e}", file=sys.stderr)
+        logger.error("💥 Fatal error in Biziday scraper: %s", e)
         # Output empty array to prevent scheduler errors
         print("[]")
         sys.exit(1)
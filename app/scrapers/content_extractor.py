@@ -5,246 +5,317 @@ Fetches full article content from URLs
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
+from lxml import etree, html as lxml_html
 import re
 import time
+import logging
 from urllib.parse import urljoin, urlparse
-import sys
+import atexit
+try:
+    from .timestamp_utils import (
+        extract_published_date_from_content, 
+        extract_updated_date_from_content,
+        format_for_database
+    )
+except ImportError:
+    # Fallback for when imported as a top-level module (scraper scripts)
+    from timestamp_utils import (
+        extract_published_date_from_content, 
+        extract_updated_date_from_content,
+        format_for_database
+    )
 
-# Fix Windows Unicode encoding issues
-if sys.platform == "win32":
-    import codecs
-    try:
-        if hasattr(sys.stdout, 'buffer'):
-            sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer)
-        if hasattr(sys.stderr, 'buffer'):
-            sys.stderr = codecs.getwriter('utf-8')(sys.stderr.buffer)
-    except:
-        pass  # Fallback if encoding fix fails
+# BeautifulSoup tree builder for the metadata soup - the C-based lxml parser
+# is much faster than the pure-Python html.parser
+HTML_PARSER = 'lxml'
+
+# Progress goes through logging - the scraper scripts configure the level
+logger = logging.getLogger(__name__)
+
+# Shared session used when the caller does not pass its own - reuses
+# keep-alive connections across article fetches
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=16))
+atexit.register(_SESSION.close)
+
+# Upper bound on the bytes read from one article page - far more than any
+# article needs, but keeps a runaway page from stalling the parsers
+_MAX_PAGE_BYTES = 512 * 1024
+_CHUNK_SIZE = 64 * 1024
+
+# clean_text junk phrases, compiled once at import - clean_text runs on every
+# paragraph, and one alternation strips them all in a single scan
+_JUNK_RE = re.compile(r'Cite[șs]te mai mult|Continuă citirea|Vezi mai mult|Foto:|Photo:|Video:', re.IGNORECASE)
 
 def clean_text(text):
     """Clean and normalize text content"""
     if not text:
         return ""
-    # Remove extra whitespace and normalize
-    text = re.sub(r'\s+', ' ', text.strip())
+    # Remove extra whitespace and normalize - str.split() collapses any run
+    # of whitespace without going through the regex engine
+    text = ' '.join(text.split())
     # Remove common unwanted patterns
-    text = re.sub(r'(Citește mai mult|Citeste mai mult|Continuă citirea|Vezi mai mult)', '', text, flags=re.IGNORECASE)
-    text = re.sub(r'(Foto:|Photo:|Video:|FOTO:|VIDEO:)', '', text, flags=re.IGNORECASE)
+    text = _JUNK_RE.sub('', text)
     return text.strip()
 
-def extract_article_content(url, source_name=""):
+def fetch_html(url, session=None):
     """
-    Extract full article content from a given URL with guaranteed timeout protection
-    Returns the full text content or None if extraction fails
+    Download an article page with guaranteed timeout protection
+    Returns the raw HTML bytes or None if the fetch fails
+    Pass a requests.Session as `session` to reuse the caller's connection pool
     """
+    headers = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+        'Accept-Language': 'ro-RO,ro;q=0.9,en;q=0.8',
+        'Accept-Encoding': 'gzip, deflate, br',
+        'Connection': 'keep-alive',
+        'Upgrade-Insecure-Requests': '1'
+    }
+    
+    logger.debug("🔍 Fetching content from: %s...", url[:80])
+    
+    # ULTRA-ROBUST error handling with multiple timeout layers
+    start_time = time.time()
+    
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'ro-RO,ro;q=0.9,en;q=0.8',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1'
-        }
-        
-        print(f"🔍 Fetching content from: {url[:80]}...", file=sys.stderr)
-        
-        # ULTRA-ROBUST error handling with multiple timeout layers
-        import time
-        start_time = time.time()
-        
+        # Use aggressive timeout settings to prevent hanging
+        response = (session or _SESSION).get(
+            url, 
+            headers=headers, 
+            timeout=(5, 8),  # (connect_timeout, read_timeout) - very aggressive
+            verify=True,
+            allow_redirects=True,
+            stream=True  # Read the body ourselves, up to _MAX_PAGE_BYTES
+        )
         try:
-            # Use aggressive timeout settings to prevent hanging
-            response = requests.get(
-                url, 
-                headers=headers, 
-                timeout=(5, 8),  # (connect_timeout, read_timeout) - very aggressive
-                verify=True,
-                allow_redirects=True,
-                stream=False  # Download all content at once
-            )
             response.raise_for_status()
             
-            fetch_time = time.time() - start_time
-            print(f"🌐 Network fetch completed in {fetch_time:.2f}s", file=sys.stderr)
-            
-        except requests.exceptions.ConnectTimeout:
-            print(f"⏱️ Connect timeout for {url} (>5s)", file=sys.stderr)
-            return None
-        except requests.exceptions.ReadTimeout:
-            print(f"⏱️ Read timeout for {url} (>8s)", file=sys.stderr)
-            return None
-        except requests.exceptions.Timeout:
-            print(f"⏱️ General timeout for {url}", file=sys.stderr)
-            return None
-        except requests.exceptions.SSLError as ssl_err:
-            print(f"❌ SSL Error for {url}: {ssl_err}", file=sys.stderr)
-            return None
-        except requests.exceptions.RequestException as req_err:
-            print(f"🌐 Request Error for {url}: {req_err}", file=sys.stderr)
-            return None
+            # iter_content decodes gzip/br on the fly, chunk by chunk
+            chunks = []
+            size = 0
+            for chunk in response.iter_content(_CHUNK_SIZE):
+                chunks.append(chunk)
+                size += len(chunk)
+                if size >= _MAX_PAGE_BYTES:
+                    logger.warning("✂️  Page truncated at %s KB: %s", _MAX_PAGE_BYTES // 1024, url[:80])
+                    break
+            html = b''.join(chunks)[:_MAX_PAGE_BYTES]
+        finally:
+            response.close()
+        
+        fetch_time = time.time() - start_time
+        logger.debug("🌐 Network fetch completed in %.2fs", fetch_time)
+        
+    except requests.exceptions.ConnectTimeout:
+        logger.warning("⏱️ Connect timeout for %s (>5s)", url)
+        return None
+    except requests.exceptions.ReadTimeout:
+        logger.warning("⏱️ Read timeout for %s (>8s)", url)
+        return None
+    except requests.exceptions.Timeout:
+        logger.warning("⏱️ General timeout for %s", url)
+        return None
+    except requests.exceptions.SSLError as ssl_err:
+        logger.error("❌ SSL Error for %s: %s", url, ssl_err)
+        return None
+    except requests.exceptions.RequestException as req_err:
+        logger.warning("🌐 Request Error for %s: %s", url, req_err)
+        return None
+    
+    return html
+
+def fetch_and_parse(url, session=None, parse_only=None):
+    """
+    Download an article page once and parse it for the metadata extractors
+    Returns (soup, html_bytes) or (None, None) if the fetch fails - pass
+    html_bytes on to extract_article_content(html=...) to reuse the download
+    Pass a bs4 SoupStrainer as `parse_only` to build the soup only for the
+    tags the caller reads
+    """
+    html = fetch_html(url, session)
+    if html is None:
+        return None, None
+    return BeautifulSoup(html, HTML_PARSER, parse_only=parse_only), html
+
+def _class_xpath(tag, class_name, within=None):
+    """Compile the XPath equivalent of the CSS selector `[within ]tag.class_name`"""
+    has_class = f"contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')"
+    prefix = f"//{within}" if within else ""
+    return etree.XPath(f"{prefix}//{tag}[{has_class}]")
+
+# Content selectors compiled once at import - (CSS label for logs, XPath)
+_ADEVARUL_XPATHS = [
+    ('div.article-content', _class_xpath('div', 'article-content')),
+    ('div.content-article', _class_xpath('div', 'content-article')),
+    ('div.entry-content', _class_xpath('div', 'entry-content')),
+    ('article .content', _class_xpath('*', 'content', within='article')),
+    ('div.post-content', _class_xpath('div', 'post-content')),
+    ('.articleContent', _class_xpath('*', 'articleContent')),
+    ('.article-body', _class_xpath('*', 'article-body'))
+]
+
+_BIZIDAY_XPATHS = [
+    ('div.post-content', _class_xpath('div', 'post-content')),
+    ('div.entry-content', _class_xpath('div', 'entry-content')),
+    ('article .content', _class_xpath('*', 'content', within='article')),
+    ('div.article-content', _class_xpath('div', 'article-content')),
+    ('.post-body', _class_xpath('*', 'post-body')),
+    ('.content-area', _class_xpath('*', 'content-area'))
+]
+
+_GENERIC_XPATHS = [
+    ('article', etree.XPath('//article')),
+    ('[role="main"]', etree.XPath('//*[@role="main"]')),
+    ('main', etree.XPath('//main')),
+    ('.content', _class_xpath('*', 'content')),
+    ('.post-content', _class_xpath('*', 'post-content')),
+    ('.entry-content', _class_xpath('*', 'entry-content')),
+    ('.article-content', _class_xpath('*', 'article-content')),
+    ('.story-content', _class_xpath('*', 'story-content')),
+    ('.news-content', _class_xpath('*', 'news-content'))
+]
+
+# Boilerplate removed before content extraction, collected in a single traversal
+_STRIP_XPATH = etree.XPath(
+    ".//script|.//style|.//nav|.//header|.//footer|.//aside|.//iframe"
+    "|.//*[contains(@class, 'advertisement')]"
+)
+
+def extract_article_content(url, source_name="", session=None, html=None):
+    """
+    Extract full article content from a given URL with guaranteed timeout protection
+    Returns the full text content or None if extraction fails
+    Pass a requests.Session as `session` to reuse the caller's connection pool,
+    or the already-downloaded page bytes as `html` to skip the download
+    """
+    try:
+        if html is None:
+            html = fetch_html(url, session)
+            if html is None:
+                return None
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        root = lxml_html.fromstring(html)
         
         # Remove unwanted elements
-        for tag in soup(['script', 'style', 'nav', 'header', 'footer', 'aside', 'iframe', 'advertisement']):
-            tag.decompose()
+        for element in _STRIP_XPATH(root):
+            element.drop_tree()
         
         # Try different extraction strategies based on the source
         content = None
         
         if 'adevarul.ro' in url.lower():
-            content = extract_adevarul_content(soup)
+            content = extract_adevarul_content(root)
         elif 'biziday.ro' in url.lower():
-            content = extract_biziday_content(soup)
+            content = extract_biziday_content(root)
         else:
             # Generic extraction
-            content = extract_generic_content(soup)
+            content = extract_generic_content(root)
         
         if content and len(content) > 100:
-            print(f"✅ Extracted {len(content)} characters of content", file=sys.stderr)
+            logger.debug("✅ Extracted %s characters of content", len(content))
             return content
         else:
-            print(f"⚠️  Content extraction failed or too short ({len(content or '')} chars)", file=sys.stderr)
+            logger.warning("⚠️  Content extraction failed or too short (%s chars)", len(content or ''))
             return None
             
     except requests.RequestException as e:
-        print(f"❌ Network error fetching {url}: {e}", file=sys.stderr)
+        logger.error("❌ Network error fetching %s: %s", url, e)
         return None
     except Exception as e:
-        print(f"❌ Error extracting content from {url}: {e}", file=sys.stderr)
+        logger.error("❌ Error extracting content from %s: %s", url, e)
         return None
 
-def extract_adevarul_content(soup):
-    """Extract content specifically from Adevarul.ro articles"""
+def container_text(content_div):
+    """
+    Collect the text of a content container in one traversal - the text
+    chunks are joined with spaces so words from adjacent paragraphs never
+    run together (text_content() concatenates them as-is)
+    """
+    return clean_text(' '.join(content_div.itertext()))
+
+def extract_adevarul_content(root):
+    """Extract content specifically from Adevarul.ro articles (lxml tree)"""
     try:
         # Try multiple selectors for Adevarul content
-        content_selectors = [
-            'div.article-content',
-            'div.content-article',
-            'div.entry-content',
-            'article .content',
-            'div.post-content',
-            '.articleContent',
-            '.article-body'
-        ]
-        
-        for selector in content_selectors:
-            content_div = soup.select_one(selector)
-            if content_div:
-                # Extract all paragraphs
-                paragraphs = content_div.find_all(['p', 'div'], recursive=True)
-                content_parts = []
-                
-                for p in paragraphs:
-                    text = clean_text(p.get_text())
-                    if text and len(text) > 20:  # Only meaningful paragraphs
-                        content_parts.append(text)
-                
-                if content_parts:
-                    full_content = ' '.join(content_parts)
-                    print(f"✅ Adevarul content extracted with selector: {selector}", file=sys.stderr)
+        for selector, xpath in _ADEVARUL_XPATHS:
+            matches = xpath(root)
+            if matches:
+                full_content = container_text(matches[0])
+                if len(full_content) > 200:
+                    logger.debug("✅ Adevarul content extracted with selector: %s", selector)
                     return full_content
         
         # Fallback: extract all text from article tag
-        article = soup.find('article')
-        if article:
-            text = clean_text(article.get_text())
+        article = root.find('.//article')
+        if article is not None:
+            text = container_text(article)
             if len(text) > 200:
                 return text
         
         return None
         
     except Exception as e:
-        print(f"❌ Error in Adevarul content extraction: {e}", file=sys.stderr)
+        logger.error("❌ Error in Adevarul content extraction: %s", e)
         return None
 
-def extract_biziday_content(soup):
-    """Extract content specifically from Biziday.ro articles"""
+def extract_biziday_content(root):
+    """Extract content specifically from Biziday.ro articles (lxml tree)"""
     try:
         # Try multiple selectors for Biziday content
-        content_selectors = [
-            'div.post-content',
-            'div.entry-content',
-            'article .content',
-            'div.article-content',
-            '.post-body',
-            '.content-area'
-        ]
-        
-        for selector in content_selectors:
-            content_div = soup.select_one(selector)
-            if content_div:
-                # Extract all paragraphs
-                paragraphs = content_div.find_all(['p', 'div'], recursive=True)
-                content_parts = []
-                
-                for p in paragraphs:
-                    text = clean_text(p.get_text())
-                    if text and len(text) > 20:  # Only meaningful paragraphs
-                        content_parts.append(text)
-                
-                if content_parts:
-                    full_content = ' '.join(content_parts)
-                    print(f"✅ Biziday content extracted with selector: {selector}", file=sys.stderr)
+        for selector, xpath in _BIZIDAY_XPATHS:
+            matches = xpath(root)
+            if matches:
+                full_content = container_text(matches[0])
+                if len(full_content) > 200:
+                    logger.debug("✅ Biziday content extracted with selector: %s", selector)
                     return full_content
         
         # Fallback: look for main content area
-        main_content = soup.find('main') or soup.find('article')
-        if main_content:
-            text = clean_text(main_content.get_text())
+        main_content = root.find('.//main')
+        if main_content is None:
+            main_content = root.find('.//article')
+        if main_content is not None:
+            text = container_text(main_content)
             if len(text) > 200:
                 return text
         
         return None
         
     except Exception as e:
-        print(f"❌ Error in Biziday content extraction: {e}", file=sys.stderr)
+        logger.error("❌ Error in Biziday content extraction: %s", e)
         return None
 
-def extract_generic_content(soup):
-    """Generic content extraction for any website"""
+def extract_generic_content(root):
+    """Generic content extraction for any website (lxml tree)"""
     try:
         # Try common content selectors
-        content_selectors = [
-            'article',
-            '[role="main"]',
-            'main',
-            '.content',
-            '.post-content',
-            '.entry-content',
-            '.article-content',
-            '.story-content',
-            '.news-content'
-        ]
-        
-        for selector in content_selectors:
-            content_div = soup.select_one(selector)
-            if content_div:
-                text = clean_text(content_div.get_text())
+        for selector, xpath in _GENERIC_XPATHS:
+            matches = xpath(root)
+            if matches:
+                text = container_text(matches[0])
                 if len(text) > 200:
-                    print(f"✅ Generic content extracted with selector: {selector}", file=sys.stderr)
+                    logger.debug("✅ Generic content extracted with selector: %s", selector)
                     return text
         
         # Last resort: get all paragraphs from body
-        paragraphs = soup.find_all('p')
-        if paragraphs:
-            content_parts = []
-            for p in paragraphs:
-                text = clean_text(p.get_text())
-                if text and len(text) > 20:
-                    content_parts.append(text)
-            
-            if content_parts and len(content_parts) >= 3:  # At least 3 meaningful paragraphs
-                full_content = ' '.join(content_parts)
-                if len(full_content) > 200:
-                    return full_content
+        content_parts = []
+        for p in root.iter('p'):
+            text = clean_text(p.text_content())
+            if text and len(text) > 20:
+                content_parts.append(text)
+        
+        if content_parts and len(content_parts) >= 3:  # At least 3 meaningful paragraphs
+            full_content = ' '.join(content_parts)
+            if len(full_content) > 200:
+                return full_content
         
         return None
         
     except Exception as e:
-        print(f"❌ Error in generic content extraction: {e}", file=sys.stderr)
+        logger.error("❌ Error in generic content extraction: %s", e)
         return None
 
 def generate_summary_from_content(content, max_length=100):
@@ -252,11 +323,13 @@ def generate_summary_from_content(content, max_length=100):
     if not content:
         return ""
     
-    # Clean the content
-    clean_content = clean_text(content)
+    # Clean only a prefix of the content - the summary needs at most
+    # max_length characters, the slack covers collapsed whitespace and junk
+    prefix_length = max_length * 4
+    clean_content = clean_text(content[:prefix_length])
     
     # Take first 100 characters and try to end at a word boundary
-    if len(clean_content) <= max_length:
+    if len(clean_content) <= max_length and len(content) <= prefix_length:
         return clean_content
     
     # Find a good breaking point (sentence or word boundary)
@@ -275,46 +348,33 @@ def generate_summary_from_content(content, max_length=100):
     # Fallback: just truncate and add ellipsis
     return truncated + '...'
 
-def extract_article_metadata(url, source_name=""):
+def extract_article_metadata(url, source_name="", soup=None):
     """
     Extract metadata from an article page including published_at and updated_at
     Returns a dictionary with extracted metadata
+    Pass an already-parsed page as `soup` to skip downloading it again
     """
     try:
-        # Import timestamp utilities
-        try:
-            from .timestamp_utils import (
-                extract_published_date_from_content, 
-                extract_updated_date_from_content,
-                format_for_database
-            )
-        except ImportError:
-            from timestamp_utils import (
-                extract_published_date_from_content, 
-                extract_updated_date_from_content,
-                format_for_database
-            )
-        
         metadata = {
             'published_at': None,
             'updated_at': None
         }
         
         # Extract published date
-        published_dt = extract_published_date_from_content(url, source_name)
+        published_dt = extract_published_date_from_content(url, source_name, soup)
         if published_dt:
             metadata['published_at'] = format_for_database(published_dt)
         
         # Extract updated date
-        updated_dt = extract_updated_date_from_content(url, source_name)
+        updated_dt = extract_updated_date_from_content(url, source_name, soup)
         if updated_dt:
             metadata['updated_at'] = format_for_database(updated_dt)
         
-        print(f"📅 Metadata for {url[:50]}...: published={metadata['published_at']}, updated={metadata['updated_at']}", file=sys.stderr)
+        logger.debug("📅 Metadata for %s...: published=%s, updated=%s", url[:50], metadata['published_at'], metadata['updated_at'])
         return metadata
         
     except Exception as e:
-        print(f"❌ Error extracting metadata from {url}: {e}", file=sys.stderr)
+        logger.error("❌ Error extracting metadata from %s: %s", url, e)
         return {'published_at': None, 'updated_at': None}
 
 def test_content_extraction():
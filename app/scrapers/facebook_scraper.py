@@ -5,13 +5,38 @@ Extracts public profile data from Facebook profiles
 """
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, NavigableString
+from selectolax.lexbor import LexborHTMLParser
 import json
+import logging
 import re
 import sys
 import time
+import atexit
+from bisect import bisect_right
+from collections import namedtuple
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from urllib.parse import urljoin, urlparse
 from datetime import datetime
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    from .scraper_logging import configure_scraper_logging
+except ImportError:
+    from scraper_logging import configure_scraper_logging
+
+# C-based lxml parser when installed - Facebook pages are several hundred KB
+# and the pure-Python html.parser dominates the scrape's CPU time
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
 
 # Fix Windows Unicode encoding issues
 if sys.platform == "win32":
@@ -24,39 +49,275 @@ if sys.platform == "win32":
     except:
         pass
 
+# Progress goes through logging - main() sets it up via configure_scraper_logging()
+logger = logging.getLogger(__name__)
+# With SCRAPER_DEBUG=1 the per-span debug lines are written in batches of this many records
+_DEBUG_LOG_BATCH = 200
+
+# Browser-like request headers, built once and shared read-only by every fetch
+_REQUEST_HEADERS = MappingProxyType({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9,ro;q=0.8',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'none'
+})
+
+# orjson when installed - the application/json blocks run to megabytes and
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so handlers are shared
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Hot-path patterns, compiled once at import instead of on every call
+_WS_RE = re.compile(r'\s+')
+_ALLOWED_RE = re.compile(r'[^\w\s\.\,\!\?\;\:\-\(\)\[\]\'\"]+')
+# "| Facebook", "- Facebook", "| Log into Facebook", "| Sign up for Facebook"
+_FB_TITLE_SUFFIX_RE = re.compile(r'\s*[|\-]\s*(?:Log into |Sign up for )?Facebook.*$', re.IGNORECASE)
+_URL_RE = re.compile(r'^https?://')
+_DIGITS_RE = re.compile(r'^\d+$')
+# Username separators become spaces and '@' is dropped, in one translate() pass
+_NAME_SEP_TABLE = str.maketrans({'.': ' ', '_': ' ', '-': ' ', '@': ''})
+_FOLLOWERS_RE = re.compile(r'([\d,.]+)\s*(aprecieri|followers|urmăritori)', re.IGNORECASE)
+
+# Location patterns for extract_from_facebook_selectors, keyed by keyword
+_LOCATION_KEYWORDS = ['lives in', 'from', 'location', 'based in', 'located in']
+_LOCATION_RES = {
+    keyword: [
+        re.compile(rf'{keyword}\s+([^.\n,;]+?)(?:\s*[,;.]|\s*$)'),
+        re.compile(rf'{keyword}:?\s*([^.\n,;]+?)(?:\s*[,;.]|\s*$)'),
+        re.compile(rf'{keyword}\s+(.+?)(?:\s*\n|\s*$)')
+    ]
+    for keyword in _LOCATION_KEYWORDS
+}
+# Text after a keyword hit that the location patterns look at - a location
+# is under 50 characters, so longer captures are rejected anyway
+_LOCATION_WINDOW = 200
+
+# The profile body is streamed; a page that has no JSON data script in its
+# first 64 KB and reads like an error page is abandoned at that point
+_BODY_CHUNK_SIZE = 8192
+_EARLY_ABORT_BYTES = 64 * 1024
+_JSON_SCRIPT_MARKER = b'<script type="application/json"'
+
+# Texts up to this length (UI chrome like "Follow", "See more" repeats a lot
+# on a page) have their clean_text() result memoized
+_CLEAN_TEXT_CACHE_MAX_LEN = 200
+
+# Span-scoring filters for extract_from_page_content - one C-level search
+# per span instead of a Python loop over characters / UI phrases
+_DIGIT_RE = re.compile(r'\d')
+_SKIP_SPAN_RE = re.compile(
+    '|'.join(re.escape(pattern) for pattern in [
+        'like', 'share', 'comment', 'follow', 'message', 'more', 'home', 'timeline',
+        'about', 'photos', 'friends', 'videos', 'check in', 'facebook', 'log in',
+        'sign up', 'create', 'help', 'settings', 'privacy', 'terms', 'cookies',
+        'see more', 'see less', 'add friend', 'edit profile', 'activity log'
+    ]),
+    re.IGNORECASE
+)
+
+# Elements that plausibly hold a profile name - extract_name_fallback only
+# scores these instead of every text node in the page
+_NAME_FALLBACK_SELECTOR = 'title, h1, h2, h3, [role="main"] span, [role="banner"] span'
+
+# Intro-section patterns for extract_bio_from_modern_structure - one search
+# per span over a single alternation; the group name is the matched category
+_INTRO_BIO_RE = re.compile(
+    r'(?P<title>profile.*digital creator|archdeacon and protopsalt|cantaret bisericesc'
+    r'|digital creator|creator|artist|musician|singer)'
+    r'|(?P<work>worked at|works at|employed at|position at|pictura bisericeasca|catedrala patriarhala)'
+    r'|(?P<education>studied at|studies at|went to|graduated from'
+    r'|facultatea de teologie ortodoxa pitesti|pastorala'
+    r'|s\.t\.o\. bucuresti|seulement pour les connaisseurs|teologia)'
+    r'|(?P<location>lives in|from|located in|based in|bucharest|bucuresti|romania)'
+    r'|(?P<personal>married|single|in a relationship)'
+    r'|(?P<link>youtube\.com/channel|facebook\.com/.*)'
+    r'|(?P<descriptive>passionate|dedicated|experience|specialist)',
+    re.IGNORECASE
+)
+_INTRO_STANDALONE_TERMS = (
+    'profile', 'digital creator', 'archdeacon', 'protopsalt', 'married',
+    'bucharest', 'romania', 'bucuresti', 'cantaret bisericesc'
+)
+_INTRO_UI_SKIP = (
+    'see more', 'see less', 'follow', 'message', 'add friend',
+    'edit profile', 'like this', 'comment on', 'share this'
+)
+
+# Keyword scoring for the fallback span scoring in extract_bio_from_modern_structure.
+# The lookahead reports every keyword start, overlapping ones included, so the
+# set of hits from one findall equals the per-keyword substring checks
+_BIO_UI_KEYWORDS = (
+    'see more', 'see less', 'follow', 'message', 'add friend',
+    'edit profile', 'like', 'comment', 'share', 'photos', 'videos',
+    'friends', 'timeline', 'about', 'home', 'posts', 'reels', 'create'
+)
+_BIO_INDICATORS = (
+    'profile', 'digital creator', 'worked at', 'studied at', 'lives in',
+    'archdeacon', 'protopsalt', 'cantaret', 'bisericesc', 'teologie',
+    'married', 'from', 'passionate', 'dedicated', 'experience'
+)
+_BIO_UI_KEYWORD_RE = re.compile('(?=(%s))' % '|'.join(map(re.escape, _BIO_UI_KEYWORDS)))
+_BIO_INDICATOR_RE = re.compile('(?=(%s))' % '|'.join(map(re.escape, _BIO_INDICATORS)))
+
+# Per-category patterns for extract_detailed_intro_information, in priority order
+_PROF_TITLE_RES = tuple(re.compile(pattern) for pattern in [
+    r'(?i)^(digital creator|creator|artist|musician|singer|cantaret|protopsalt|archdeacon|diacon)$',
+    r'(?i)^(profile)\s*[•·]\s*(digital creator|creator)$',
+    r'(?i)^(arhidiacon|protopsalt|cântăreț|diacon)$',
+    r'(?i)^(creator digital|artist|muzician)$',
+    r'(?i)^(arhidiacon și protopsalt|archdeacon and protopsalt)$',
+    r'(?i)^(cântăreț bisericesc|cantor|psaltic)$',
+    r'(?i)^(profile|profil)\s*[•·]\s*(.+)$'
+])
+_WORK_RES = tuple(re.compile(pattern) for pattern in [
+    r'(?i)(worked at|works at|employed at)\s+(.+)',
+    r'(?i)(archdeacon and protopsalt at)\s+(.+)',
+    r'(?i)(cantaret at|position at)\s+(.+)',
+    r'(?i)(arhidiacon și protopsalt la)\s+(.+)',
+    r'(?i)(lucrează la|a lucrat la)\s+(.+)',
+    r'(?i)(cântăreț la|diacon la)\s+(.+)',
+    r'(?i)(poziție la|angajat la)\s+(.+)',
+    r'(?i)(Archdeacon and Protopsalt)\s+(la|at)\s+(.+)',
+    r'(?i)(.*?)\s+(la|at)\s+(Catedrala\s+Patriarhală|Cathedral|Biserica|Church)(.+)',
+    r'(?i)(muzician la|artist la|creator la)\s+(.+)'
+])
+_EDU_RES = tuple(re.compile(pattern) for pattern in [
+    r'(?i)(studied at|studies at|graduated from|went to)\s+(.+)',
+    r'(?i)(facultatea de teologie)\s*(.+)?',
+    r'(?i)(s\.t\.o\.\s*bucuresti|pastorala)',
+])
+_INTRO_LOCATION_RES = tuple(re.compile(pattern) for pattern in [
+    r'(?i)(lives in)\s+(.+)',
+    r'(?i)(from)\s+(.+)',
+    r'(?i)(located in|based in)\s+(.+)'
+])
+_RELATIONSHIP_RES = tuple(re.compile(pattern) for pattern in [
+    r'(?i)^(married|single|in a relationship|divorced|widowed)$',
+    r'(?i)(married to|in a relationship with)\s+(.+)'
+])
+# Only whether any religious pattern matches is used, so they share one regex
+_RELIGIOUS_RE = re.compile(
+    r'protopsalt|archdeacon|diacon|cantaret bisericesc'
+    r'|catedrala patriarhala|biserica|cathedral'
+    r'|pictura bisericeasca|church painting|religious art',
+    re.IGNORECASE
+)
+_LANGUAGE_RES = tuple(re.compile(pattern) for pattern in [
+    r'(?i)(speaks|fluent in|languages?)\s*[:]\s*(.+)',
+    r'(?i)(romanian|english|french|german|spanish|italian|greek)',
+])
+
+# Title-text fallbacks for the profile tile helpers (extract_facebook_*_info,
+# extract_facebook_location_from_title, extract_facebook_contact), in priority order
+_TILE_WORK_RES = tuple(re.compile(pattern) for pattern in [
+    r'(?i)(.*?)\s+(?:works?\s+at|worked\s+at|la)\s+(.+)',
+    r'(?i)(?:works?\s+at|worked\s+at|la)\s+(.+)'
+])
+_TILE_EDU_RES = tuple(re.compile(pattern) for pattern in [
+    r'(?i)(?:studied at|studies at|a studiat la)\s+(.+)',
+    r'(?i)(.+)(?:\s+University|\s+College|\s+Faculty)'
+])
+_TILE_LOCATION_RES = tuple(re.compile(pattern) for pattern in [
+    r'(?i)(?:lives in|based in|located in|din)\s+(.+)',
+    r'(?i)(.+?)(?:,\s*Romania|,\s*România)',
+    r'(?i)(.+?)(?:\s*$)'
+])
+_EMAIL_RE = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+_PHONE_RE = re.compile(r'[\+]?[0-9\s\-\(\)]{10,}')
+
+# UI text that disqualifies a name/bio candidate, matched as substrings of the
+# lowercased text (tuples - iterated once per candidate, never rebuilt)
+_H1_SKIP_PATTERNS = (
+    'facebook', 'log in', 'sign up', 'home', 'timeline', 'about', 'photos', 'friends',
+    'more', 'settings', 'activity log', 'privacy shortcuts', 'support inbox'
+)
+_SELECTOR_NAME_SKIP_PATTERNS = (
+    'facebook', 'timeline', 'cover photo', 'profile picture', 'add friend',
+    'message', 'follow', 'more', 'activity', 'about', 'friends', 'photos'
+)
+_NAME_FALLBACK_SKIP_PATTERNS = (
+    'facebook', 'log in', 'sign up', 'home', 'timeline', 'about', 'photos',
+    'friends', 'more', 'settings', 'help', 'privacy', 'terms', 'cookies',
+    'like', 'share', 'comment', 'follow', 'message', 'post', 'story',
+    'see more', 'see all', 'show more', 'load more', 'view', 'edit',
+    'add friend', 'accept', 'decline', 'block', 'report', 'hide'
+)
+_DIV_BIO_SKIP_KEYWORDS = ('follow', 'message', 'friend', 'like', 'share', 'comment')
+
+# Comprehensive text search: UI text to reject and bio keywords worth +3 each.
+# Plain escaped alternations (no \b) so they keep the substring semantics
+_TEXT_SEARCH_SKIP_PATTERNS = (
+    'facebook', 'log in', 'sign up', 'home', 'timeline', 'photos', 'friends',
+    'see more', 'see less', 'follow', 'message', 'add friend', 'like', 'share',
+    'comment', 'post', 'story', 'settings', 'privacy', 'help'
+)
+_TEXT_SEARCH_BIO_KEYWORDS = (
+    'din', 'din anul', 'din 1888', 'încă din', 'ceea ce', 'adevărul',
+    'since', 'founded', 'established', 'about', 'mission', 'vision',
+    'passionate', 'dedicated', 'company', 'organization'
+)
+_TEXT_SEARCH_SKIP_RE = re.compile('|'.join(map(re.escape, _TEXT_SEARCH_SKIP_PATTERNS)))
+_TEXT_SEARCH_BIO_RE = re.compile('|'.join(map(re.escape, _TEXT_SEARCH_BIO_KEYWORDS)))
+
+# Comprehensive text search walks at most this many candidate text nodes
+_TEXT_SEARCH_MAX_CANDIDATES = 2000
+
+# Concurrent profile fetches in extract_facebook_profiles - every request goes
+# to the same host, so keep this low to stay under Facebook's rate limits
+_MAX_PROFILE_WORKERS = 4
+
+# Shared session - keep-alive reuses the TCP/TLS connection to facebook.com
+# across profiles instead of a fresh handshake per requests.get
+_SESSION = requests.Session()
+_SESSION.headers.update(_REQUEST_HEADERS)
+_SESSION.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=_MAX_PROFILE_WORKERS))
+atexit.register(_SESSION.close)
+
 def clean_text(text):
     """Clean and normalize text content"""
     if not text:
         return ""
     
-    # Convert to string if needed
-    if not isinstance(text, str):
+    # Convert to a plain string if needed - bs4 strings too, so the cache
+    # below never keeps a parse tree alive
+    if type(text) is not str:
         try:
             text = str(text)
         except:
             return ""
     
-    # Remove non-printable characters and control characters
-    text = ''.join(char for char in text if char.isprintable() or char.isspace())
-    
+    if len(text) <= _CLEAN_TEXT_CACHE_MAX_LEN:
+        return _clean_short_text(text)
+    return _clean_str(text)
+
+def _clean_str(text):
+    """clean_text() for a plain str"""
     # Remove extra whitespace and normalize
-    text = re.sub(r'\s+', ' ', text.strip())
+    text = _WS_RE.sub(' ', text.strip())
     
-    # Remove any remaining binary or encoded characters
-    text = re.sub(r'[^\w\s\.\,\!\?\;\:\-\(\)\[\]\'\"]+', '', text)
+    # Remove control, non-printable and any remaining binary or encoded
+    # characters - none of them are word characters, whitespace or the
+    # allowed punctuation, so this single pass also covers them
+    text = _ALLOWED_RE.sub('', text)
     
     return text.strip()
 
+_clean_short_text = lru_cache(maxsize=4096)(_clean_str)
+
 def normalize_facebook_url(user_input):
     """Convert user input to proper Facebook URL"""
     user_input = user_input.strip()
     
     # If it's already a full URL, return as is
-    if user_input.startswith('http'):
+    if _URL_RE.match(user_input):
         return user_input
     
     # If it's a numeric ID, convert to facebook.com/profile.php?id=
-    if user_input.isdigit():
+    if _DIGITS_RE.match(user_input):
         return f"https://www.facebook.com/profile.php?id={user_input}"
     
     # If it's a username, convert to facebook.com/username
@@ -75,187 +336,330 @@ def extract_facebook_profile(profile_input):
     """
     try:
         profile_url = normalize_facebook_url(profile_input)
-        print(f"🔍 Fetching Facebook profile from: {profile_url}", file=sys.stderr)
-        
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.9,ro;q=0.8',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-            'Sec-Fetch-Dest': 'document',
-            'Sec-Fetch-Mode': 'navigate',
-            'Sec-Fetch-Site': 'none'
-        }
+        username = extract_username_from_url(profile_url)
+        logger.debug("🔍 Fetching Facebook profile from: %s", profile_url)
         
         try:
-            print(f"🌐 Making HTTP request to {profile_url}...", file=sys.stderr)
-            print(f"⏱️ Using timeout: 10s connect, 15s read", file=sys.stderr)
-            response = requests.get(
+            logger.debug("🌐 Making HTTP request to %s...", profile_url)
+            logger.debug("⏱️ Using timeout: 10s connect, 15s read")
+            response = _SESSION.get(
                 profile_url, 
-                headers=headers, 
                 timeout=(10, 15),  # Increased timeout for better reliability
                 verify=True,
-                allow_redirects=True
+                allow_redirects=True,
+                stream=True  # Body is read below, with an early abort for error pages
             )
-            print(f"📡 HTTP request completed with status: {response.status_code}", file=sys.stderr)
+            logger.debug("📡 HTTP request completed with status: %s", response.status_code)
             
-            # Check for Facebook blocking/error pages BEFORE raising for status
-            if response.status_code == 400:
-                print(f"❌ Facebook returned 400 Bad Request - likely blocking automated requests", file=sys.stderr)
-                print(f"📄 Response content preview: {response.text[:200]}...", file=sys.stderr)
-                return {
-                    "error": f"Facebook is blocking automated requests for profile '{profile_input}' (HTTP 400). The profile may be private or Facebook has anti-bot measures active.",
-                    "profile_url": profile_url,
-                    "username": extract_username_from_url(profile_url)
-                }
-            
-            # Only raise for status if it's not a 400 (which we handle above)
-            if response.status_code >= 400:
-                response.raise_for_status()
-            
-            # Ensure proper encoding
-            if response.encoding is None or response.encoding == 'ISO-8859-1':
-                response.encoding = 'utf-8'
+            # Streamed response - the with block hands the pooled connection back
+            # on every exit path, including the early returns and raise_for_status()
+            with response:
+                # Check for Facebook blocking/error pages BEFORE raising for status
+                if response.status_code == 400:
+                    logger.error("❌ Facebook returned 400 Bad Request - likely blocking automated requests")
+                    logger.debug("📄 Response content preview: %s...", response.text[:200])
+                    return {
+                        "error": f"Facebook is blocking automated requests for profile '{profile_input}' (HTTP 400). The profile may be private or Facebook has anti-bot measures active.",
+                        "profile_url": profile_url,
+                        "username": username
+                    }
+                
+                # Only raise for status if it's not a 400 (which we handle above)
+                if response.status_code >= 400:
+                    response.raise_for_status()
+                
+                # Ensure proper encoding
+                if response.encoding is None or response.encoding == 'ISO-8859-1':
+                    response.encoding = 'utf-8'
+                
+                # Read the body in chunks - a blocking/error page is recognised after
+                # its first 64 KB instead of being downloaded and parsed in full
+                body = bytearray()
+                aborted = False
+                checked_head = False
+                for chunk in response.iter_content(chunk_size=_BODY_CHUNK_SIZE):
+                    body += chunk
+                    if not checked_head and len(body) > _EARLY_ABORT_BYTES:
+                        checked_head = True
+                        if _JSON_SCRIPT_MARKER not in body and b'Error' in body[:500]:
+                            aborted = True
+                            break
             
-            print(f"✅ Successfully fetched profile page ({len(response.content)} bytes)", file=sys.stderr)
+            html = bytes(body)
             
-            # Check if we got a valid Facebook page with JSON data
-            json_script_count = response.text.count('<script type="application/json"')
-            print(f"📊 Found {json_script_count} JSON script tags on the page", file=sys.stderr)
+            if aborted:
+                logger.debug("✂️  No JSON script tags in the first %s KB of an error page - download aborted", _EARLY_ABORT_BYTES // 1024)
+                json_script_count = 0
+            else:
+                logger.debug("✅ Successfully fetched profile page (%s bytes)", len(html))
+                
+                # Check if we got a valid Facebook page with JSON data
+                json_script_count = html.count(_JSON_SCRIPT_MARKER)
+            logger.debug("📊 Found %s JSON script tags on the page", json_script_count)
             
             if json_script_count == 0:
-                print(f"⚠️  No JSON script tags found - may indicate Facebook blocking or error page", file=sys.stderr)
+                logger.warning("⚠️  No JSON script tags found - may indicate Facebook blocking or error page")
                 # Check if this looks like an error page
-                if "Error" in response.text[:500] or len(response.content) < 5000:
-                    print(f"🚨 Detected Facebook error page - likely blocking request", file=sys.stderr)
+                if aborted or b'Error' in html[:500] or len(html) < 5000:
+                    logger.error("🚨 Detected Facebook error page - likely blocking request")
                     return {
                         "error": f"Facebook appears to be blocking requests for profile '{profile_input}'. The page returned appears to be an error page rather than a profile.",
                         "profile_url": profile_url,
-                        "username": extract_username_from_url(profile_url)
+                        "username": username
                     }
             
         except requests.exceptions.Timeout as e:
-            print(f"⏰ Request timeout: The profile '{profile_input}' took too long to load", file=sys.stderr)
-            print("💡 This may indicate the profile is private, blocked, or Facebook is limiting access", file=sys.stderr)
+            logger.warning("⏰ Request timeout: The profile '%s' took too long to load", profile_input)
+            logger.warning("💡 This may indicate the profile is private, blocked, or Facebook is limiting access")
             return {
                 "error": f"Request timeout for profile '{profile_input}'. The profile may be private or Facebook is blocking access.",
                 "profile_url": profile_url,
-                "username": extract_username_from_url(profile_url)
+                "username": username
             }
         except requests.exceptions.ConnectionError as e:
-            print(f"🌐 Connection error: {e}", file=sys.stderr)
-            print("💡 This may indicate network issues or Facebook blocking the request", file=sys.stderr)
+            logger.warning("🌐 Connection error: %s", e)
+            logger.warning("💡 This may indicate network issues or Facebook blocking the request")
             return {
                 "error": f"Connection error for profile '{profile_input}'. Check network connectivity.",
                 "profile_url": profile_url,
-                "username": extract_username_from_url(profile_url)
+                "username": username
             }
         except requests.exceptions.HTTPError as e:
             status_code = getattr(response, 'status_code', None)
             if status_code == 400:
-                print(f"❌ Bad Request (400): The profile '{profile_input}' may not exist or may be private", file=sys.stderr)
+                logger.error("❌ Bad Request (400): The profile '%s' may not exist or may be private", profile_input)
                 return {
                     "error": f"Profile '{profile_input}' may not exist or is private (HTTP 400)",
                     "profile_url": profile_url,
-                    "username": extract_username_from_url(profile_url)
+                    "username": username
                 }
             elif status_code == 403:
-                print(f"❌ Forbidden (403): Access denied to profile '{profile_input}'", file=sys.stderr)
+                logger.error("❌ Forbidden (403): Access denied to profile '%s'", profile_input)
                 return {
                     "error": f"Access denied to profile '{profile_input}' (HTTP 403)",
                     "profile_url": profile_url,
-                    "username": extract_username_from_url(profile_url)
+                    "username": username
                 }
             elif status_code == 404:
-                print(f"❌ Not Found (404): The profile '{profile_input}' does not exist", file=sys.stderr)
+                logger.error("❌ Not Found (404): The profile '%s' does not exist", profile_input)
                 return {
                     "error": f"Profile '{profile_input}' does not exist (HTTP 404)",
                     "profile_url": profile_url,
-                    "username": extract_username_from_url(profile_url)
+                    "username": username
                 }
             else:
-                print(f"❌ HTTP Error {status_code}: {e}", file=sys.stderr)
+                logger.error("❌ HTTP Error %s: %s", status_code, e)
                 return {
                     "error": f"HTTP Error {status_code} for profile '{profile_input}': {e}",
                     "profile_url": profile_url,
-                    "username": extract_username_from_url(profile_url)
+                    "username": username
                 }
         except requests.exceptions.RequestException as e:
-            print(f"❌ Error fetching profile: {e}", file=sys.stderr)
+            logger.error("❌ Error fetching profile: %s", e)
             return {
                 "error": f"Network error for profile '{profile_input}': {e}",
                 "profile_url": profile_url,
-                "username": extract_username_from_url(profile_url)
+                "username": username
             }
         
-        # Parse the HTML with better encoding handling
+        # Decoded only once the page is known not to be an error page
         try:
-            soup = BeautifulSoup(response.text, 'html.parser')
-        except UnicodeDecodeError:
-            # Fallback to content with explicit encoding
-            soup = BeautifulSoup(response.content, 'html.parser', from_encoding='utf-8')
-        
-        # Extract profile data using multiple strategies
-        profile_data = {
-            'name': None,
-            'bio': None,
-            'connected_accounts': [],
-            'location': None,
-            'profile_url': profile_url,
-            'username': extract_username_from_url(profile_url),
-            'followers_count': 0,
-            'interests': []
-        }
-        
-        # Strategy 1: Extract from meta tags
-        extract_from_meta_tags(soup, profile_data)
-        
-        # Strategy 2: Extract from page title and content
-        extract_from_page_content(soup, profile_data)
-        
-        # Strategy 3: Extract from JSON-LD structured data
-        extract_from_json_ld(soup, profile_data)
-        
-        # Strategy 4: Extract from specific Facebook selectors
-        extract_from_facebook_selectors(soup, profile_data)
+            page_text = html.decode(response.encoding, errors='replace')
+        except LookupError:
+            page_text = html.decode('utf-8', errors='replace')
         
-        # Strategy 5: Extract from JSON application data blocks (ENHANCED)
-        extract_from_json_application_data(soup, profile_data)
+        return _parse_profile_html(html, profile_url, profile_input, page_text)
         
-        # Strategy 6: Extract detailed intro information (fallback patterns)
-        extract_detailed_intro_information(soup, profile_data)
-        
-        # Strategy 7: Fallback - try to extract from any text that looks like a name
-        if not profile_data['name']:
-            extract_name_fallback(soup, profile_data)
-        
-        # Strategy 7: Last resort - use URL components
-        if not profile_data['name']:
-            extract_from_url_components(profile_input, profile_data)
-        
-        # Validate extracted data
-        if not profile_data['name']:
-            print("⚠️  Could not extract profile name", file=sys.stderr)
-            print("📋 Available meta tags:", file=sys.stderr)
-            
-            # Debug: show available meta tags
-            meta_tags = soup.find_all('meta')
-            for meta in meta_tags[:10]:  # Show first 10 meta tags
-                if meta.get('property') or meta.get('name'):
-                    content = meta.get('content', '')[:50]
-                    prop_or_name = meta.get('property') or meta.get('name')
-                    print(f"     {prop_or_name}: {content}...", file=sys.stderr)
-            
-            return None
+    except Exception as e:
+        logger.error("❌ Error extracting Facebook profile: %s", e)
+        return None
+
+def _parse_profile_html(html_bytes, profile_url, profile_input, page_text=None):
+    """
+    Parse a fetched profile page and run the extraction strategies on it
+    Args:
+        html_bytes: raw page body
+        profile_url: normalized profile URL
+        profile_input: the original username, numeric ID, or URL
+        page_text: the body already decoded, if the caller has it
+    Returns:
+        dict with profile data or None if no name could be extracted
+    """
+    # Lexbor (C) tree for the plain attribute lookups of strategies 1 and 3
+    tree = LexborHTMLParser(html_bytes)
+    
+    # Parse the HTML with better encoding handling
+    try:
+        soup = BeautifulSoup(page_text if page_text is not None else html_bytes, HTML_PARSER)
+    except UnicodeDecodeError:
+        # Fallback to content with explicit encoding
+        soup = BeautifulSoup(html_bytes, HTML_PARSER, from_encoding='utf-8')
+    
+    # Lowercased page text, built once and shared by the text-scanning strategies
+    page_text_lower = soup.get_text().lower()
+    
+    # span/h1/div/JSON script lists from one tree walk, instead of a
+    # find_all per strategy
+    tags = _index_tags(soup, tree)
+    
+    # Extract profile data using multiple strategies
+    profile_data = {
+        'name': None,
+        'bio': None,
+        'connected_accounts': [],
+        'location': None,
+        'profile_url': profile_url,
+        'username': extract_username_from_url(profile_url),
+        'followers_count': 0,
+        'interests': []
+    }
+    
+    # Strategy 1: Extract from meta tags
+    extract_from_meta_tags(tree, profile_data)
+    
+    # Strategy 2: Extract from page title and content
+    extract_from_page_content(soup, profile_data, tags)
+    
+    # Strategy 3: Extract from JSON-LD structured data - it only fills
+    # name and bio, so skip it when the meta tags already gave both
+    if not (profile_data['name'] and profile_data['bio']):
+        extract_from_json_ld(tree, profile_data)
+    
+    # Strategy 4: Extract from specific Facebook selectors
+    extract_from_facebook_selectors(soup, profile_data, page_text_lower)
+    
+    # Strategy 5: Extract from JSON application data blocks (ENHANCED)
+    extract_from_json_application_data(soup, profile_data, tags)
+    
+    # Strategy 6: Extract detailed intro information (fallback patterns)
+    extract_detailed_intro_information(soup, profile_data, tags)
+    
+    # Strategy 7: Fallback - try to extract from any text that looks like a name
+    if not profile_data['name']:
+        extract_name_fallback(soup, profile_data)
+    
+    # Strategy 7: Last resort - use URL components
+    if not profile_data['name']:
+        extract_from_url_components(profile_input, profile_data)
+    
+    # Validate extracted data
+    if not profile_data['name']:
+        logger.warning("⚠️  Could not extract profile name")
+        logger.debug("📋 Available meta tags:")
         
-        print(f"✅ Successfully extracted profile: {profile_data['name']}", file=sys.stderr)
-        return profile_data
+        # Debug: show available meta tags
+        for meta in tree.css('meta[property], meta[name]')[:10]:  # Show first 10 meta tags
+            content = (meta.attributes.get('content') or '')[:50]
+            prop_or_name = meta.attributes.get('property') or meta.attributes.get('name')
+            logger.debug("     %s: %s...", prop_or_name, content)
         
-    except Exception as e:
-        print(f"❌ Error extracting Facebook profile: {e}", file=sys.stderr)
         return None
+    
+    logger.debug("✅ Successfully extracted profile: %s", profile_data['name'])
+    return profile_data
+
+def extract_facebook_profiles(profile_inputs):
+    """
+    Extract several Facebook profiles concurrently
+    Args:
+        profile_inputs: list of usernames, numeric IDs, or full URLs
+    Returns:
+        list of results from extract_facebook_profile, in input order
+    """
+    if len(profile_inputs) <= 1:
+        return [extract_facebook_profile(profile_input) for profile_input in profile_inputs]
+    
+    # The fetches are I/O bound - a small pool overlaps the network waits
+    # instead of paying for each profile's round trip one after another
+    with ThreadPoolExecutor(max_workers=min(_MAX_PROFILE_WORKERS, len(profile_inputs))) as executor:
+        return list(executor.map(extract_facebook_profile, profile_inputs))
+
+def _index_tags(soup, tree=None):
+    """
+    Walk the tree once and bucket the tags the strategy functions scan
+    Pass the page's selectolax `tree` to take the intro span texts from it
+    Returns:
+        dict of tag lists in document order, passed to the strategies as `tags`,
+        plus the cleaned intro span texts under 'intro_spans'
+    """
+    tags = {'span': [], 'span_dir_auto': [], 'h1': [], 'div': [], 'json_script': []}
+    for tag in soup.find_all(['span', 'h1', 'div', 'script']):
+        if tag.name == 'span':
+            tags['span'].append(tag)
+            if tag.get('dir') == 'auto':
+                tags['span_dir_auto'].append(tag)
+        elif tag.name == 'script':
+            if tag.get('type') == 'application/json':
+                tags['json_script'].append(tag)
+        else:
+            tags[tag.name].append(tag)
+    # The intro/bio scans read the dir="auto" spans, or every span when there are
+    # none - they only need the text, which Lexbor extracts in C. Its text()
+    # keeps script/style contents that get_text() drops, so pages with those
+    # inside a span keep the BeautifulSoup path
+    if tree is not None and tree.css_first('span script, span style') is None:
+        intro_nodes = tree.css('span[dir="auto"]') or tree.css('span')
+        tags['intro_spans'] = [(node, text, text.lower()) for node, text in
+                               ((node, clean_text(node.text())) for node in intro_nodes)]
+    else:
+        tags['intro_spans'] = _build_span_index(tags['span_dir_auto'] or tags['span'])
+    return tags
+
+def _iter_text_candidates(soup, min_length, cap=_TEXT_SEARCH_MAX_CANDIDATES):
+    """
+    Lazily yield the text nodes of `soup` (document order, like
+    find_all(text=True)) that are at least `min_length` characters long,
+    stopping after `cap` of them. clean_text() never lengthens a string,
+    so shorter nodes could not pass a min_length check afterwards either
+    """
+    count = 0
+    for node in soup.descendants:
+        if isinstance(node, NavigableString) and len(node) >= min_length:
+            yield node
+            count += 1
+            if count >= cap:
+                return
+
+def _span_text(span):
+    """
+    A span's text - most spans wrap a single string, which is returned as is
+    instead of walking the subtree with get_text()
+    """
+    string = span.string
+    if string is not None and type(string) is NavigableString:
+        return string
+    return span.get_text()
+
+def _build_span_index(spans):
+    """
+    Clean each span's text once for the intro/bio scans
+    Returns:
+        list of (span, cleaned text, lowercased text) tuples
+    """
+    span_index = []
+    for span in spans:
+        text = clean_text(_span_text(span))
+        span_index.append((span, text, text.lower()))
+    return span_index
+
+def _first_hits_by_span(regex, span_index):
+    """
+    First `regex` match in each span's cleaned text, from one finditer() over
+    all of them joined by newlines - clean_text() output never contains one,
+    so no match can run into the next text. Hits are mapped back to their
+    span with bisect over the text start offsets
+    Returns:
+        dict of span position -> match object
+    """
+    starts = []
+    offset = 0
+    for _, text, _ in span_index:
+        starts.append(offset)
+        offset += len(text) + 1
+    hits = {}
+    for match in regex.finditer('\n'.join(text for _, text, _ in span_index)):
+        hits.setdefault(bisect_right(starts, match.start()) - 1, match)
+    return hits
 
 def extract_username_from_url(url):
     """Extract username from Facebook URL"""
@@ -267,74 +671,75 @@ def extract_username_from_url(url):
     except:
         return None
 
-def extract_from_meta_tags(soup, profile_data):
-    """Extract data from meta tags with enhanced field extraction"""
+def extract_from_meta_tags(tree, profile_data):
+    """Extract data from meta tags with enhanced field extraction (selectolax tree)"""
     try:
         # Open Graph meta tags
-        og_title = soup.find('meta', property='og:title')
-        if og_title and og_title.get('content'):
-            title_content = clean_text(og_title['content'])
+        og_title = tree.css_first('meta[property="og:title"]')
+        if og_title and og_title.attributes.get('content'):
+            title_content = clean_text(og_title.attributes['content'])
             # Remove common Facebook suffixes
-            title_content = re.sub(r'\s*\|\s*Facebook.*$', '', title_content)
-            title_content = re.sub(r'\s*-\s*Facebook.*$', '', title_content)
+            title_content = _FB_TITLE_SUFFIX_RE.sub('', title_content)
             if title_content and len(title_content.strip()) > 0:
                 profile_data['name'] = title_content.strip()
-                print(f"📋 Extracted name from og:title: {profile_data['name']}", file=sys.stderr)
+                logger.debug("📋 Extracted name from og:title: %s", profile_data['name'])
         
-        og_description = soup.find('meta', property='og:description')
-        if og_description and og_description.get('content'):
-            desc_content = clean_text(og_description['content'])
+        og_description = tree.css_first('meta[property="og:description"]')
+        if og_description and og_description.attributes.get('content'):
+            desc_content = clean_text(og_description.attributes['content'])
             if desc_content and len(desc_content) > 10:
                 profile_data['bio'] = desc_content
-                print(f"📋 Extracted bio from og:description: {desc_content[:50]}...", file=sys.stderr)
+                logger.debug("📋 Extracted bio from og:description: %s...", desc_content[:50])
                 
                 # ENHANCED: Extract professional title from description
                 desc_lower = desc_content.lower()
                 if 'creator digital' in desc_lower or 'digital creator' in desc_lower:
                     profile_data['professional_title'] = 'Digital Creator'
-                    print(f"✅ Extracted professional title from description: Digital Creator", file=sys.stderr)
+                    logger.debug("✅ Extracted professional title from description: Digital Creator")
                 elif 'protopsalt' in desc_lower:
                     profile_data['professional_title'] = 'Protopsalt'
                     profile_data['church_position'] = 'Protopsalt'
-                    print(f"✅ Extracted church position from description: Protopsalt", file=sys.stderr)
+                    logger.debug("✅ Extracted church position from description: Protopsalt")
                 elif 'archdeacon' in desc_lower:
                     profile_data['professional_title'] = 'Archdeacon'
                     profile_data['church_position'] = 'Archdeacon'
-                    print(f"✅ Extracted church position from description: Archdeacon", file=sys.stderr)
+                    logger.debug("✅ Extracted church position from description: Archdeacon")
                 
                 # Extract followers/likes count from description (e.g., "26.312 aprecieri")
-                import re
-                follower_match = re.search(r'([\d,.]+)\s*(aprecieri|followers|urmăritori)', desc_content, re.IGNORECASE)
+                follower_match = _FOLLOWERS_RE.search(desc_content)
                 if follower_match:
                     follower_str = follower_match.group(1).replace('.', '').replace(',', '')
                     try:
                         profile_data['followers_count'] = int(follower_str)
-                        print(f"✅ Extracted followers count from description: {profile_data['followers_count']}", file=sys.stderr)
+                        logger.debug("✅ Extracted followers count from description: %s", profile_data['followers_count'])
                     except ValueError:
                         pass
         
         # Twitter meta tags as fallback
-        twitter_title = soup.find('meta', attrs={'name': 'twitter:title'})
-        if twitter_title and twitter_title.get('content') and not profile_data['name']:
-            twitter_content = clean_text(twitter_title['content'])
-            twitter_content = re.sub(r'\s*\|\s*Facebook.*$', '', twitter_content)
+        twitter_title = tree.css_first('meta[name="twitter:title"]')
+        if twitter_title and twitter_title.attributes.get('content') and not profile_data['name']:
+            twitter_content = clean_text(twitter_title.attributes['content'])
+            twitter_content = _FB_TITLE_SUFFIX_RE.sub('', twitter_content)
             if twitter_content and len(twitter_content.strip()) > 0:
                 profile_data['name'] = twitter_content.strip()
-                print(f"📋 Extracted name from twitter:title: {profile_data['name']}", file=sys.stderr)
+                logger.debug("📋 Extracted name from twitter:title: %s", profile_data['name'])
         
         # Additional meta tags
-        description_meta = soup.find('meta', attrs={'name': 'description'})
-        if description_meta and description_meta.get('content') and not profile_data['bio']:
-            desc_content = clean_text(description_meta['content'])
+        description_meta = tree.css_first('meta[name="description"]')
+        if description_meta and description_meta.attributes.get('content') and not profile_data['bio']:
+            desc_content = clean_text(description_meta.attributes['content'])
             if desc_content and len(desc_content) > 10:
                 profile_data['bio'] = desc_content
-                print(f"📋 Extracted bio from description meta: {desc_content[:50]}...", file=sys.stderr)
+                logger.debug("📋 Extracted bio from description meta: %s...", desc_content[:50])
         
     except Exception as e:
-        print(f"⚠️  Error extracting from meta tags: {e}", file=sys.stderr)
+        logger.warning("⚠️  Error extracting from meta tags: %s", e)
 
-def extract_from_page_content(soup, profile_data):
-    """Extract data from page content"""
+def extract_from_page_content(soup, profile_data, tags=None):
+    """
+    Extract data from page content
+    Pass the _index_tags() result as `tags` to reuse its tag lists
+    """
     try:
         # Page title as fallback for name
         if not profile_data['name']:
@@ -342,13 +747,10 @@ def extract_from_page_content(soup, profile_data):
             if title and title.text:
                 title_text = clean_text(title.text)
                 # Remove "| Facebook" and similar suffixes
-                title_text = re.sub(r'\s*\|\s*Facebook.*$', '', title_text)
-                title_text = re.sub(r'\s*-\s*Facebook.*$', '', title_text)
-                title_text = re.sub(r'\s*\|\s*Log into Facebook.*$', '', title_text)
-                title_text = re.sub(r'\s*\|\s*Sign up for Facebook.*$', '', title_text)
+                title_text = _FB_TITLE_SUFFIX_RE.sub('', title_text)
                 if title_text and len(title_text.strip()) > 0:
                     profile_data['name'] = title_text.strip()
-                    print(f"📋 Extracted name from page title: {profile_data['name']}", file=sys.stderr)
+                    logger.debug("📋 Extracted name from page title: %s", profile_data['name'])
         
         # Look for bio in various content areas
         bio_selectors = [
@@ -362,61 +764,52 @@ def extract_from_page_content(soup, profile_data):
             '.text_exposed_root'
         ]
         
-        for selector in bio_selectors:
-            bio_element = soup.select_one(selector)
-            if bio_element and not profile_data['bio']:
-                bio_text = clean_text(bio_element.get_text())
-                if len(bio_text) > 10:  # Only meaningful bio text
-                    profile_data['bio'] = bio_text
-                    print(f"📋 Extracted bio from {selector}: {bio_text[:50]}...", file=sys.stderr)
-                    break
+        if not profile_data['bio']:
+            for selector in bio_selectors:
+                bio_element = soup.select_one(selector)
+                if bio_element and not profile_data['bio']:
+                    bio_text = clean_text(bio_element.get_text())
+                    if len(bio_text) > 10:  # Only meaningful bio text
+                        profile_data['bio'] = bio_text
+                        logger.debug("📋 Extracted bio from %s: %s...", selector, bio_text[:50])
+                        break
         
         # Enhanced bio extraction for modern Facebook HTML structures
         if not profile_data['bio']:
-            extract_bio_from_modern_structure(soup, profile_data)
+            extract_bio_from_modern_structure(soup, profile_data, tags)
         
         # Try to extract from any h1 tags (common for profile names)
         if not profile_data['name']:
-            h1_tags = soup.find_all('h1')
+            h1_tags = tags['h1'] if tags is not None else soup.find_all('h1')
             for h1 in h1_tags:
                 h1_text = clean_text(h1.get_text())
                 if h1_text and len(h1_text) < 100 and len(h1_text) > 2:  # Reasonable name length
                     # Skip common Facebook UI text
-                    skip_patterns = [
-                        'facebook', 'log in', 'sign up', 'home', 'timeline', 'about', 'photos', 'friends',
-                        'more', 'settings', 'activity log', 'privacy shortcuts', 'support inbox'
-                    ]
-                    if not any(pattern in h1_text.lower() for pattern in skip_patterns):
+                    h1_lower = h1_text.lower()
+                    if not any(pattern in h1_lower for pattern in _H1_SKIP_PATTERNS):
                         profile_data['name'] = h1_text
-                        print(f"📋 Extracted name from h1: {profile_data['name']}", file=sys.stderr)
+                        logger.debug("📋 Extracted name from h1: %s", profile_data['name'])
                         break
         
         # Try to extract from span tags with specific patterns - ENHANCED
         if not profile_data['name']:
-            print("🔍 Trying enhanced span-based name extraction...", file=sys.stderr)
-            all_spans = soup.find_all('span')
+            logger.debug("🔍 Trying enhanced span-based name extraction...")
+            all_spans = tags['span'] if tags is not None else soup.find_all('span')
             name_candidates = []
             
             for span in all_spans:
-                span_text = clean_text(span.get_text())
+                span_text = clean_text(_span_text(span))
                 
                 # Skip if too short, too long, or contains numbers/symbols
                 if not span_text or len(span_text) < 2 or len(span_text) > 100:
                     continue
-                if any(char.isdigit() for char in span_text):
+                if _DIGIT_RE.search(span_text):
                     continue
                 if span_text.count(' ') > 5:  # Too many words for a name
                     continue
                     
                 # Skip common UI text
-                skip_patterns = [
-                    'like', 'share', 'comment', 'follow', 'message', 'more', 'home', 'timeline',
-                    'about', 'photos', 'friends', 'videos', 'check in', 'facebook', 'log in',
-                    'sign up', 'create', 'help', 'settings', 'privacy', 'terms', 'cookies',
-                    'see more', 'see less', 'add friend', 'edit profile', 'activity log'
-                ]
-                
-                if any(pattern in span_text.lower() for pattern in skip_patterns):
+                if _SKIP_SPAN_RE.search(span_text):
                     continue
                 
                 # Score this span as a potential name
@@ -456,25 +849,29 @@ def extract_from_page_content(soup, profile_data):
                 total_score = name_score + parent_context_score
                 if total_score >= 4:  # Good name candidate
                     name_candidates.append((span_text, total_score, span))
-                    print(f"📋 Name candidate (score: {total_score}): {span_text}", file=sys.stderr)
+                    logger.debug("📋 Name candidate (score: %s): %s", total_score, span_text)
             
             # Sort candidates by score and pick the best one
             if name_candidates:
                 name_candidates.sort(key=lambda x: x[1], reverse=True)
                 best_name = name_candidates[0]
                 profile_data['name'] = best_name[0]
-                print(f"✅ Selected name (score: {best_name[1]}): {profile_data['name']}", file=sys.stderr)
+                logger.debug("✅ Selected name (score: %s): %s", best_name[1], profile_data['name'])
         
     except Exception as e:
-        print(f"⚠️  Error extracting from page content: {e}", file=sys.stderr)
+        logger.warning("⚠️  Error extracting from page content: %s", e)
 
-def extract_from_json_ld(soup, profile_data):
-    """Extract data from JSON-LD structured data"""
+def extract_from_json_ld(tree, profile_data):
+    """Extract data from JSON-LD structured data (selectolax tree)"""
     try:
-        json_scripts = soup.find_all('script', type='application/ld+json')
+        json_scripts = tree.css('script[type="application/ld+json"]')
         for script in json_scripts:
             try:
-                data = json.loads(script.string)
+                text = script.text()
+                # Only Person blocks carry name/bio - skip the others unparsed
+                if '"Person"' not in text:
+                    continue
+                data = _json_loads(text)
                 if isinstance(data, dict):
                     if data.get('@type') == 'Person':
                         if data.get('name') and not profile_data['name']:
@@ -484,10 +881,13 @@ def extract_from_json_ld(soup, profile_data):
             except json.JSONDecodeError:
                 continue
     except Exception as e:
-        print(f"⚠️  Error extracting from JSON-LD: {e}", file=sys.stderr)
+        logger.warning("⚠️  Error extracting from JSON-LD: %s", e)
 
-def extract_from_facebook_selectors(soup, profile_data):
-    """Extract data using Facebook-specific selectors"""
+def extract_from_facebook_selectors(soup, profile_data, page_text_lower=None):
+    """
+    Extract data using Facebook-specific selectors
+    Pass the page's lowercased get_text() as `page_text_lower` to reuse it
+    """
     try:
         # Look for profile name in various Facebook elements
         name_selectors = [
@@ -506,45 +906,41 @@ def extract_from_facebook_selectors(soup, profile_data):
             '.timeline h1'
         ]
         
-        for selector in name_selectors:
-            name_element = soup.select_one(selector)
-            if name_element and not profile_data['name']:
-                name_text = clean_text(name_element.get_text())
-                if name_text and len(name_text) < 100 and len(name_text) > 1:  # Reasonable name length
-                    # Additional filtering for Facebook-specific content
-                    skip_patterns = [
-                        'facebook', 'timeline', 'cover photo', 'profile picture', 'add friend',
-                        'message', 'follow', 'more', 'activity', 'about', 'friends', 'photos'
-                    ]
-                    if not any(pattern in name_text.lower() for pattern in skip_patterns):
-                        profile_data['name'] = name_text
-                        print(f"📋 Extracted name from selector {selector}: {profile_data['name']}", file=sys.stderr)
-                        break
-        
-        # Look for location information with improved patterns
-        location_keywords = ['lives in', 'from', 'location', 'based in', 'located in']
-        all_text = soup.get_text().lower()
-        
-        for keyword in location_keywords:
-            if keyword in all_text:
-                # Try to extract location context with better regex
-                patterns = [
-                    rf'{keyword}\s+([^.\n,;]+?)(?:\s*[,;.]|\s*$)',
-                    rf'{keyword}:?\s*([^.\n,;]+?)(?:\s*[,;.]|\s*$)',
-                    rf'{keyword}\s+(.+?)(?:\s*\n|\s*$)'
-                ]
-                
-                for pattern in patterns:
-                    match = re.search(pattern, all_text)
-                    if match and not profile_data['location']:
-                        location = clean_text(match.group(1))
-                        if len(location) < 50 and len(location) > 2:  # Reasonable location length
-                            profile_data['location'] = location
-                            print(f"📋 Extracted location: {profile_data['location']}", file=sys.stderr)
+        if not profile_data['name']:
+            for selector in name_selectors:
+                name_element = soup.select_one(selector)
+                if name_element and not profile_data['name']:
+                    name_text = clean_text(name_element.get_text())
+                    if name_text and len(name_text) < 100 and len(name_text) > 1:  # Reasonable name length
+                        # Additional filtering for Facebook-specific content
+                        name_lower = name_text.lower()
+                        if not any(pattern in name_lower for pattern in _SELECTOR_NAME_SKIP_PATTERNS):
+                            profile_data['name'] = name_text
+                            logger.debug("📋 Extracted name from selector %s: %s", selector, profile_data['name'])
                             break
-                
-                if profile_data['location']:
-                    break
+        
+        # Look for location information with improved patterns (skipped when
+        # an earlier strategy already found one)
+        if not profile_data['location']:
+            all_text = page_text_lower if page_text_lower is not None else soup.get_text().lower()
+            
+            for keyword in _LOCATION_KEYWORDS:
+                idx = all_text.find(keyword)
+                if idx != -1:
+                    # Run the patterns on a short window after the first hit
+                    # instead of on the whole page text
+                    window = all_text[idx:idx + _LOCATION_WINDOW]
+                    for pattern in _LOCATION_RES[keyword]:
+                        match = pattern.search(window)
+                        if match and not profile_data['location']:
+                            location = clean_text(match.group(1))
+                            if len(location) < 50 and len(location) > 2:  # Reasonable location length
+                                profile_data['location'] = location
+                                logger.debug("📋 Extracted location: %s", profile_data['location'])
+                                break
+                    
+                    if profile_data['location']:
+                        break
         
         # Try to extract the username/page name directly from URL as fallback
         if not profile_data['name'] and profile_data.get('username'):
@@ -555,37 +951,28 @@ def extract_from_facebook_selectors(soup, profile_data):
                 readable_name = username.replace('.', ' ').replace('_', ' ').replace('-', ' ')
                 readable_name = ' '.join(word.capitalize() for word in readable_name.split())
                 profile_data['name'] = readable_name
-                print(f"📋 Using username as fallback name: {profile_data['name']}", file=sys.stderr)
+                logger.debug("📋 Using username as fallback name: %s", profile_data['name'])
         
     except Exception as e:
-        print(f"⚠️  Error extracting from Facebook selectors: {e}", file=sys.stderr)
+        logger.warning("⚠️  Error extracting from Facebook selectors: %s", e)
 
 def extract_name_fallback(soup, profile_data):
     """Fallback method to extract name from any reasonable text"""
     try:
-        print("🔍 Trying fallback name extraction methods...", file=sys.stderr)
+        logger.debug("🔍 Trying fallback name extraction methods...")
         
         # Look for any text that could be a profile name
-        # Check all text nodes and find the most likely candidate
-        all_text_elements = soup.find_all(text=True)
-        
+        # Check the name-hosting elements and find the most likely candidate
         candidates = []
-        for text_node in all_text_elements:
-            text = clean_text(str(text_node))
+        for element in soup.select(_NAME_FALLBACK_SELECTOR):
+            text = clean_text(element.get_text())
             # Skip empty, too long, or obviously non-name text
             if (text and len(text) > 2 and len(text) < 80 and 
                 not text.isdigit() and text.count(' ') <= 4):
                 
                 # Skip common Facebook UI text
-                skip_patterns = [
-                    'facebook', 'log in', 'sign up', 'home', 'timeline', 'about', 'photos', 
-                    'friends', 'more', 'settings', 'help', 'privacy', 'terms', 'cookies',
-                    'like', 'share', 'comment', 'follow', 'message', 'post', 'story',
-                    'see more', 'see all', 'show more', 'load more', 'view', 'edit',
-                    'add friend', 'accept', 'decline', 'block', 'report', 'hide'
-                ]
-                
-                if not any(pattern in text.lower() for pattern in skip_patterns):
+                text_lower = text.lower()
+                if not any(pattern in text_lower for pattern in _NAME_FALLBACK_SKIP_PATTERNS):
                     # Look for text that appears to be a proper name
                     words = text.split()
                     if len(words) >= 1 and len(words) <= 4:  # Reasonable name length
@@ -600,126 +987,96 @@ def extract_name_fallback(soup, profile_data):
             for candidate in candidates:
                 if len(candidate) >= 3:  # Minimum reasonable name length
                     profile_data['name'] = candidate
-                    print(f"📋 Extracted name using fallback: {profile_data['name']}", file=sys.stderr)
+                    logger.debug("📋 Extracted name using fallback: %s", profile_data['name'])
                     break
                     
     except Exception as e:
-        print(f"⚠️  Error in fallback name extraction: {e}", file=sys.stderr)
+        logger.warning("⚠️  Error in fallback name extraction: %s", e)
 
 def extract_from_url_components(profile_input, profile_data):
     """Extract name from URL components as last resort"""
     try:
-        print("🔍 Trying URL-based name extraction...", file=sys.stderr)
+        logger.debug("🔍 Trying URL-based name extraction...")
         
         # Parse the original input to get a readable name
         profile_input = profile_input.strip()
         
         # If it's a URL, extract the username part
-        if profile_input.startswith('http'):
+        if _URL_RE.match(profile_input):
             # Extract from URL
             if 'facebook.com/' in profile_input:
-                url_part = profile_input.split('facebook.com/')[-1]
-                url_part = url_part.split('?')[0].split('/')[0]  # Remove query params and extra paths
+                # First path segment - the query string and extra paths are dropped by urlparse
+                url_part = urlparse(profile_input).path.lstrip('/').split('/', 1)[0]
                 
                 if url_part and url_part != 'profile.php':
                     # Convert URL part to readable name
-                    readable_name = url_part.replace('.', ' ').replace('_', ' ').replace('-', ' ')
-                    readable_name = ' '.join(word.capitalize() for word in readable_name.split() if word)
+                    readable_name = url_part.translate(_NAME_SEP_TABLE)
+                    readable_name = ' '.join(word.capitalize() for word in readable_name.split())
                     
                     if readable_name and len(readable_name) > 0:
                         profile_data['name'] = readable_name
-                        print(f"📋 Extracted name from URL: {profile_data['name']}", file=sys.stderr)
+                        logger.debug("📋 Extracted name from URL: %s", profile_data['name'])
         else:
             # Direct username/identifier input
-            if not profile_input.isdigit():  # Skip pure numeric IDs
-                readable_name = profile_input.replace('.', ' ').replace('_', ' ').replace('-', ' ')
-                readable_name = readable_name.replace('@', '')  # Remove @ if present
-                readable_name = ' '.join(word.capitalize() for word in readable_name.split() if word)
+            if not _DIGITS_RE.match(profile_input):  # Skip pure numeric IDs
+                readable_name = profile_input.translate(_NAME_SEP_TABLE)
+                readable_name = ' '.join(word.capitalize() for word in readable_name.split())
                 
                 if readable_name and len(readable_name) > 0:
                     profile_data['name'] = readable_name
-                    print(f"📋 Extracted name from input: {profile_data['name']}", file=sys.stderr)
+                    logger.debug("📋 Extracted name from input: %s", profile_data['name'])
                     
     except Exception as e:
-        print(f"⚠️  Error in URL-based name extraction: {e}", file=sys.stderr)
+        logger.warning("⚠️  Error in URL-based name extraction: %s", e)
 
-def extract_bio_from_modern_structure(soup, profile_data):
+def extract_bio_from_modern_structure(soup, profile_data, tags=None):
     """
     Extract bio from modern Facebook HTML structures with dynamic classes.
     Optimized for mihail.buca.7 type profiles with rich Intro sections.
+    Pass the _index_tags() result as `tags` to reuse its tag lists.
     """
-    print("🔍 Trying modern bio extraction strategies...", file=sys.stderr)
+    logger.debug("🔍 Trying modern bio extraction strategies...")
     
     # Strategy 1: Look for Intro section - search for spans containing intro-like content
     intro_bio_parts = []
     
     # Look for all spans with dir="auto" which contain profile information
-    spans_with_dir_auto = soup.find_all('span', {'dir': 'auto'})
-    print(f"📋 Found {len(spans_with_dir_auto)} spans with dir='auto'", file=sys.stderr)
+    spans_with_dir_auto = tags['span_dir_auto'] if tags is not None else soup.find_all('span', {'dir': 'auto'})
+    logger.debug("📋 Found %s spans with dir='auto'", len(spans_with_dir_auto))
     
     # If no spans with dir='auto', try all spans
     if len(spans_with_dir_auto) == 0:
-        print("🔍 No spans with dir='auto' found, trying all spans...", file=sys.stderr)
-        spans_with_dir_auto = soup.find_all('span')
-        print(f"📋 Found {len(spans_with_dir_auto)} total spans", file=sys.stderr)
+        logger.debug("🔍 No spans with dir='auto' found, trying all spans...")
+        spans_with_dir_auto = tags['span'] if tags is not None else soup.find_all('span')
+        logger.debug("📋 Found %s total spans", len(spans_with_dir_auto))
+    
+    span_index = tags['intro_spans'] if tags is not None else _build_span_index(spans_with_dir_auto)
+    intro_hits = _first_hits_by_span(_INTRO_BIO_RE, span_index)
     
-    for span in spans_with_dir_auto:
-        text = clean_text(span.get_text())
+    for span_position, (span, text, text_lower) in enumerate(span_index):
         if not text or len(text) < 3:
             continue
         
-        # Enhanced bio patterns for mihail.buca.7 type profiles
-        bio_patterns = [
-            # Professional titles and roles (exact matches from HTML)
-            r'(?i)(profile.*digital creator|archdeacon and protopsalt|cantaret bisericesc)',
-            r'(?i)(digital creator|creator|artist|musician|singer)',
-            # Work experience patterns  
-            r'(?i)(worked at|works at|employed at|position at)',
-            r'(?i)(pictura bisericeasca|catedrala patriarhala)',
-            # Education patterns (exact matches from HTML)
-            r'(?i)(studied at|studies at|went to|graduated from)',
-            r'(?i)(facultatea de teologie ortodoxa pitesti|pastorala)',
-            r'(?i)(s\.t\.o\. bucuresti|seulement pour les connaisseurs|teologia)',
-            # Location patterns
-            r'(?i)(lives in|from|located in|based in)',
-            r'(?i)(bucharest|bucuresti|romania)',
-            # Personal info patterns
-            r'(?i)(married|single|in a relationship)',
-            # Links and external accounts
-            r'(?i)(youtube\.com/channel|facebook\.com/.*)',
-            # General descriptive patterns
-            r'(?i)(passionate|dedicated|experience|specialist)',
-        ]
-        
-        # Check if text matches intro patterns
+        # Check if text matches intro patterns (enhanced for mihail.buca.7 type profiles)
         is_intro_content = False
-        for pattern in bio_patterns:
-            if re.search(pattern, text):
-                is_intro_content = True
-                print(f"🎯 Found intro pattern '{pattern}' in: {text[:60]}...", file=sys.stderr)
-                break
+        match = intro_hits.get(span_position)
+        if match:
+            is_intro_content = True
+            logger.debug("🎯 Found intro pattern '%s' in: %s...", match.lastgroup, text[:60])
         
         # Also include certain standalone descriptive terms that appear in Intro sections
-        standalone_terms = [
-            'profile', 'digital creator', 'archdeacon', 'protopsalt', 'married',
-            'bucharest', 'romania', 'bucuresti', 'cantaret bisericesc'
-        ]
-        
-        if not is_intro_content:
-            for term in standalone_terms:
-                if term.lower() in text.lower() and len(text) <= 80:  # Increased length for compound terms
+        if not is_intro_content and len(text) <= 80:  # Increased length for compound terms
+            for term in _INTRO_STANDALONE_TERMS:
+                if term in text_lower:
                     is_intro_content = True
-                    print(f"🎯 Found standalone term '{term}' in: {text}", file=sys.stderr)
+                    logger.debug("🎯 Found standalone term '%s' in: %s", term, text)
                     break
         
         if is_intro_content and len(text) >= 3:
             # Skip obvious UI elements but be more permissive for profile content
-            ui_skip = ['see more', 'see less', 'follow', 'message', 'add friend', 
-                      'edit profile', 'like this', 'comment on', 'share this']
-            
-            if not any(ui in text.lower() for ui in ui_skip):
+            if not any(ui in text_lower for ui in _INTRO_UI_SKIP):
                 intro_bio_parts.append(text)
-                print(f"✅ Added intro part: {text}", file=sys.stderr)
+                logger.debug("✅ Added intro part: %s", text)
     
     # Strategy 2: Combine intro parts into a comprehensive bio
     if intro_bio_parts:
@@ -739,15 +1096,14 @@ def extract_bio_from_modern_structure(soup, profile_data):
             bio_text = " • ".join(unique_parts[:8])  # Increased from 5 to 8 for richer profiles
         
         profile_data['bio'] = bio_text
-        print(f"✅ Constructed bio from {len(unique_parts)} intro parts: {bio_text[:100]}...", file=sys.stderr)
+        logger.debug("✅ Constructed bio from %s intro parts: %s...", len(unique_parts), bio_text[:100])
         return
     
     # Strategy 3: Fallback to original span scoring method
-    print("🔍 No intro patterns found, trying fallback span scoring...", file=sys.stderr)
+    logger.debug("🔍 No intro patterns found, trying fallback span scoring...")
     bio_candidates = []
     
-    for i, span in enumerate(spans_with_dir_auto[:50]):  # Limit to first 50 spans for performance
-        text = clean_text(span.get_text())
+    for i, (span, text, text_lower) in enumerate(span_index[:50]):  # Limit to first 50 spans for performance
         if not text or len(text) < 5:
             continue
             
@@ -772,70 +1128,15 @@ def extract_bio_from_modern_structure(soup, profile_data):
         if not text.isdigit():
             score += 1
             
-        # Penalty for UI text
-        ui_keywords = ['see more', 'see less', 'follow', 'message', 'add friend', 
-                      'edit profile', 'like', 'comment', 'share', 'photos', 'videos',
-                      'friends', 'timeline', 'about', 'home', 'posts', 'reels', 'create']
-        ui_penalty = 0
-        for keyword in ui_keywords:
-            if keyword in text.lower():
-                ui_penalty += 3
-        score -= ui_penalty
-              
-        # Bonus for bio-like indicators
-        bio_indicators = ['profile', 'digital creator', 'worked at', 'studied at', 'lives in',
-                         'archdeacon', 'protopsalt', 'cantaret', 'bisericesc', 'teologie',
-                         'married', 'from', 'passionate', 'dedicated', 'experience']
-        for indicator in bio_indicators:
-            if indicator in text.lower():
-                score += 5
-                print(f"🎯 Found bio indicator '{indicator}' in: {text[:40]}...", file=sys.stderr)
-                
-        # Store candidates with positive scores
-        if score > 0:
-            bio_candidates.append((text, score, span))
-    
-    # Sort and select best candidate
-    if bio_candidates:
-        bio_candidates.sort(key=lambda x: x[1], reverse=True)
-        best_candidate = bio_candidates[0]
-        
-        # Show top 3 candidates for debugging
-        print(f"🏆 Top bio candidates:", file=sys.stderr)
-        for i, (text, score, span) in enumerate(bio_candidates[:3]):
-            print(f"   {i+1}. Score {score}: {text[:60]}...", file=sys.stderr)
-        
-        if best_candidate[1] >= 3:  # Reasonable threshold
-            profile_data['bio'] = best_candidate[0]
-            print(f"✅ Selected bio (score: {best_candidate[1]}): {best_candidate[0][:80]}...", file=sys.stderr)
-            return
-        else:
-            print(f"⚠️  Best candidate has low score ({best_candidate[1]}): {best_candidate[0][:60]}...", file=sys.stderr)
-        if text.count(' ') >= 2:
-            score += 2
-        if any(char.isalpha() for char in text):
-            score += 1
-        if not text.isdigit():
-            score += 1
-            
-        # Penalty for UI text
-        ui_keywords = ['see more', 'see less', 'follow', 'message', 'add friend', 
-                      'edit profile', 'like', 'comment', 'share', 'photos', 'videos',
-                      'friends', 'timeline', 'about', 'home', 'posts', 'reels', 'create']
-        ui_penalty = 0
-        for keyword in ui_keywords:
-            if keyword in text.lower():
-                ui_penalty += 3
-        score -= ui_penalty
+        # Penalty for UI text - one scan for all keywords
+        score -= 3 * len(set(_BIO_UI_KEYWORD_RE.findall(text_lower)))
               
         # Bonus for bio-like indicators
-        bio_indicators = ['profile', 'digital creator', 'worked at', 'studied at', 'lives in',
-                         'archdeacon', 'protopsalt', 'cantaret', 'bisericesc', 'teologie',
-                         'married', 'from', 'passionate', 'dedicated', 'experience']
-        for indicator in bio_indicators:
-            if indicator in text.lower():
+        indicator_hits = set(_BIO_INDICATOR_RE.findall(text_lower))
+        for indicator in _BIO_INDICATORS:
+            if indicator in indicator_hits:
                 score += 5
-                print(f"🎯 Found bio indicator '{indicator}' in: {text[:40]}...", file=sys.stderr)
+                logger.debug("🎯 Found bio indicator '%s' in: %s...", indicator, text[:40])
                 
         # Store candidates with positive scores
         if score > 0:
@@ -847,20 +1148,20 @@ def extract_bio_from_modern_structure(soup, profile_data):
         best_candidate = bio_candidates[0]
         
         # Show top 3 candidates for debugging
-        print(f"🏆 Top bio candidates:", file=sys.stderr)
+        logger.debug("🏆 Top bio candidates:")
         for i, (text, score, span) in enumerate(bio_candidates[:3]):
-            print(f"   {i+1}. Score {score}: {text[:60]}...", file=sys.stderr)
+            logger.debug("   %s. Score %s: %s...", i+1, score, text[:60])
         
         if best_candidate[1] >= 3:  # Reasonable threshold
             profile_data['bio'] = best_candidate[0]
-            print(f"✅ Selected bio (score: {best_candidate[1]}): {best_candidate[0][:80]}...", file=sys.stderr)
+            logger.debug("✅ Selected bio (score: %s): %s...", best_candidate[1], best_candidate[0][:80])
             return
         else:
-            print(f"⚠️  Best candidate has low score ({best_candidate[1]}): {best_candidate[0][:60]}...", file=sys.stderr)
+            logger.debug("⚠️  Best candidate has low score (%s): %s...", best_candidate[1], best_candidate[0][:60])
     
     # Strategy 2: Look for any meaningful text in divs (fallback)
-    print("🔍 Trying fallback div extraction...", file=sys.stderr)
-    all_divs = soup.find_all('div')
+    logger.debug("🔍 Trying fallback div extraction...")
+    all_divs = tags['div'] if tags is not None else soup.find_all('div')
     
     for div in all_divs:
         # Get direct text content (not nested elements)
@@ -873,27 +1174,24 @@ def extract_bio_from_modern_structure(soup, profile_data):
                     
         for text in direct_texts:
             if (len(text) >= 20 and len(text) <= 300 and
-                not any(keyword in text.lower() for keyword in 
-                       ['follow', 'message', 'friend', 'like', 'share', 'comment']) and
+                not any(keyword in text.lower() for keyword in _DIV_BIO_SKIP_KEYWORDS) and
                 text.count(' ') >= 3 and
                 not text.isdigit()):
                 
                 profile_data['bio'] = text
-                print(f"📋 Extracted bio from div fallback: {text[:50]}...", file=sys.stderr)
+                logger.debug("📋 Extracted bio from div fallback: %s...", text[:50])
                 return
     
     # Strategy 3: Comprehensive text search with Romanian language support
-    print("🔍 Trying comprehensive text search...", file=sys.stderr)
-    all_text_elements = soup.find_all(text=True)
-    
-    for text_node in all_text_elements:
+    logger.debug("🔍 Trying comprehensive text search...")
+    for text_node in _iter_text_candidates(soup, 20):
         # Convert to string and clean
-        try:
-            raw_text = str(text_node)
-            # Skip if it contains binary data or non-text content
-            if any(ord(char) > 127 and not char.isalpha() for char in raw_text[:50]):
-                continue
-        except:
+        raw_text = str(text_node)
+        # Skip if it contains binary data or non-text content (non-ASCII
+        # characters that are not letters) - isascii() settles the usual
+        # case in C, only non-ASCII heads are checked character by character
+        head = raw_text[:50]
+        if not head.isascii() and any(ord(char) > 127 and not char.isalpha() for char in head):
             continue
             
         text = clean_text(raw_text)
@@ -903,28 +1201,18 @@ def extract_bio_from_modern_structure(soup, profile_data):
             continue
             
         # Skip common UI elements
-        skip_patterns = [
-            'facebook', 'log in', 'sign up', 'home', 'timeline', 'photos', 'friends',
-            'see more', 'see less', 'follow', 'message', 'add friend', 'like', 'share',
-            'comment', 'post', 'story', 'settings', 'privacy', 'help'
-        ]
-        
-        if any(pattern in text.lower() for pattern in skip_patterns):
+        text_lower = text.lower()
+        if _TEXT_SEARCH_SKIP_RE.search(text_lower):
             continue
             
         # Look for bio-like content characteristics
         bio_score = 0
         
-        # Romanian/general bio indicators
-        bio_keywords = [
-            'din', 'din anul', 'din 1888', 'încă din', 'ceea ce', 'adevărul',
-            'since', 'founded', 'established', 'about', 'mission', 'vision',
-            'passionate', 'dedicated', 'company', 'organization'
-        ]
-        
-        for keyword in bio_keywords:
-            if keyword in text.lower():
-                bio_score += 3
+        # Romanian/general bio indicators - one regex scan rules out the common
+        # no-keyword case; overlapping keywords ('din' / 'din anul') are then
+        # counted individually so the score is unchanged
+        if _TEXT_SEARCH_BIO_RE.search(text_lower):
+            bio_score += 3 * sum(1 for keyword in _TEXT_SEARCH_BIO_KEYWORDS if keyword in text_lower)
                 
         # Sentence structure indicators
         if text.count('.') >= 1:
@@ -936,17 +1224,18 @@ def extract_bio_from_modern_structure(soup, profile_data):
             
         if bio_score >= 4:  # Good bio candidate
             profile_data['bio'] = text
-            print(f"📋 Extracted bio from text search (score: {bio_score}): {text[:50]}...", file=sys.stderr)
+            logger.debug("📋 Extracted bio from text search (score: %s): %s...", bio_score, text[:50])
             return
     
-    print("⚠️  Could not extract bio using modern extraction methods", file=sys.stderr)
+    logger.debug("⚠️  Could not extract bio using modern extraction methods")
 
-def extract_detailed_intro_information(soup, profile_data):
+def extract_detailed_intro_information(soup, profile_data, tags=None):
     """
     Extract detailed information from Facebook Intro section
     This includes professional, educational, location, and personal details
+    Pass the _index_tags() result as `tags` to reuse its tag lists
     """
-    print("🔍 Extracting detailed intro information...", file=sys.stderr)
+    logger.debug("🔍 Extracting detailed intro information...")
     
     import json
     
@@ -966,56 +1255,43 @@ def extract_detailed_intro_information(soup, profile_data):
         'church_position': None,
         'church_affiliation': None
     }
+    # Companies/institutions already in work_history/education, for O(1) dedup
+    seen_companies = set()
+    seen_institutions = set()
     
     # Find all text elements that might contain intro information
-    all_spans = soup.find_all('span', {'dir': 'auto'})
-    if not all_spans:
-        all_spans = soup.find_all('span')
+    if tags is not None:
+        span_index = tags['intro_spans']
+    else:
+        all_spans = soup.find_all('span', {'dir': 'auto'})
+        if not all_spans:
+            all_spans = soup.find_all('span')
+        span_index = _build_span_index(all_spans)
     
-    print(f"📋 Analyzing {len(all_spans)} spans for detailed info...", file=sys.stderr)
+    logger.debug("📋 Analyzing %s spans for detailed info...", len(span_index))
+    religious_hits = _first_hits_by_span(_RELIGIOUS_RE, span_index)
     
-    for span in all_spans:
-        text = clean_text(span.get_text())
+    for span_position, (span, text, text_lower) in enumerate(span_index):
         if not text or len(text) < 3:
             continue
         
         # Professional title patterns (îmbunătățite pentru română)
-        prof_patterns = [
-            r'(?i)^(digital creator|creator|artist|musician|singer|cantaret|protopsalt|archdeacon|diacon)$',
-            r'(?i)^(profile)\s*[•·]\s*(digital creator|creator)$',
-            r'(?i)^(arhidiacon|protopsalt|cântăreț|diacon)$',
-            r'(?i)^(creator digital|artist|muzician)$',
-            r'(?i)^(arhidiacon și protopsalt|archdeacon and protopsalt)$',
-            r'(?i)^(cântăreț bisericesc|cantor|psaltic)$',
-            r'(?i)^(profile|profil)\s*[•·]\s*(.+)$'
-        ]
-        for pattern in prof_patterns:
-            match = re.match(pattern, text.strip())
-            if match:
-                if not detailed_info['professional_title']:
+        # Scalar categories are skipped once filled - later matches are discarded
+        if not detailed_info['professional_title']:
+            for pattern in _PROF_TITLE_RES:
+                match = pattern.match(text)
+                if match:
                     # Extract the actual title from matched groups
                     if len(match.groups()) >= 2 and match.group(2):
                         detailed_info['professional_title'] = match.group(2).strip()
                     else:
                         detailed_info['professional_title'] = match.group(1).strip() if match.group(1) else text.strip()
-                    print(f"✅ Professional title: {detailed_info['professional_title']}", file=sys.stderr)
-                break
+                    logger.debug("✅ Professional title: %s", detailed_info['professional_title'])
+                    break
         
         # Work/employment patterns (îmbunătățite pentru context românesc)
-        work_patterns = [
-            r'(?i)(worked at|works at|employed at)\s+(.+)',
-            r'(?i)(archdeacon and protopsalt at)\s+(.+)',
-            r'(?i)(cantaret at|position at)\s+(.+)',
-            r'(?i)(arhidiacon și protopsalt la)\s+(.+)',
-            r'(?i)(lucrează la|a lucrat la)\s+(.+)',
-            r'(?i)(cântăreț la|diacon la)\s+(.+)',
-            r'(?i)(poziție la|angajat la)\s+(.+)',
-            r'(?i)(Archdeacon and Protopsalt)\s+(la|at)\s+(.+)',
-            r'(?i)(.*?)\s+(la|at)\s+(Catedrala\s+Patriarhală|Cathedral|Biserica|Church)(.+)',
-            r'(?i)(muzician la|artist la|creator la)\s+(.+)'
-        ]
-        for pattern in work_patterns:
-            match = re.search(pattern, text)
+        for pattern in _WORK_RES:
+            match = pattern.search(text)
             if match:
                 # Handle different pattern groups
                 if len(match.groups()) >= 3 and match.group(3):
@@ -1030,7 +1306,8 @@ def extract_detailed_intro_information(soup, profile_data):
                     position = 'Unknown position'
                     employer = match.group(1).strip() if match.group(1) else text.strip()
                 
-                if employer and employer not in [w.get('company', '') for w in detailed_info['work_history']]:
+                if employer and employer not in seen_companies:
+                    seen_companies.add(employer)
                     work_entry = {
                         'company': employer,
                         'position': position,
@@ -1041,93 +1318,70 @@ def extract_detailed_intro_information(soup, profile_data):
                     if work_entry['current'] and not detailed_info['current_employer']:
                         detailed_info['current_employer'] = employer
                     
-                    print(f"✅ Work: {work_entry}", file=sys.stderr)
+                    logger.debug("✅ Work: %s", work_entry)
                 break
         
         # Education patterns
-        edu_patterns = [
-            r'(?i)(studied at|studies at|graduated from|went to)\s+(.+)',
-            r'(?i)(facultatea de teologie)\s*(.+)?',
-            r'(?i)(s\.t\.o\.\s*bucuresti|pastorala)',
-        ]
-        for pattern in edu_patterns:
-            match = re.search(pattern, text)
+        for pattern in _EDU_RES:
+            match = pattern.search(text)
             if match:
                 if len(match.groups()) >= 2:
                     institution = match.group(2).strip() if match.group(2) else match.group(1).strip()
                 else:
                     institution = match.group(1).strip()
                 
-                if institution and institution not in [e.get('institution', '') for e in detailed_info['education']]:
+                if institution and institution not in seen_institutions:
+                    seen_institutions.add(institution)
                     edu_entry = {
                         'institution': institution,
                         'type': 'studied at' if 'studied' in match.group(0).lower() else 'education'
                     }
                     detailed_info['education'].append(edu_entry)
-                    print(f"✅ Education: {edu_entry}", file=sys.stderr)
+                    logger.debug("✅ Education: %s", edu_entry)
                 break
         
         # Location patterns
-        location_patterns = [
-            r'(?i)(lives in)\s+(.+)',
-            r'(?i)(from)\s+(.+)',
-            r'(?i)(located in|based in)\s+(.+)'
-        ]
-        for pattern in location_patterns:
-            match = re.search(pattern, text)
-            if match:
-                location = match.group(2).strip()
-                if 'lives in' in match.group(1).lower():
-                    if not detailed_info['current_location']:
-                        detailed_info['current_location'] = location
-                        print(f"✅ Current location: {location}", file=sys.stderr)
-                elif 'from' in match.group(1).lower():
-                    if not detailed_info['origin_location']:
-                        detailed_info['origin_location'] = location
-                        print(f"✅ Origin location: {location}", file=sys.stderr)
-                break
+        if not (detailed_info['current_location'] and detailed_info['origin_location']):
+            for pattern in _INTRO_LOCATION_RES:
+                match = pattern.search(text)
+                if match:
+                    location = match.group(2).strip()
+                    if 'lives in' in match.group(1).lower():
+                        if not detailed_info['current_location']:
+                            detailed_info['current_location'] = location
+                            logger.debug("✅ Current location: %s", location)
+                    elif 'from' in match.group(1).lower():
+                        if not detailed_info['origin_location']:
+                            detailed_info['origin_location'] = location
+                            logger.debug("✅ Origin location: %s", location)
+                    break
         
         # Relationship status patterns
-        relationship_patterns = [
-            r'(?i)^(married|single|in a relationship|divorced|widowed)$',
-            r'(?i)(married to|in a relationship with)\s+(.+)'
-        ]
-        for pattern in relationship_patterns:
-            match = re.search(pattern, text.strip())
-            if match:
-                if not detailed_info['relationship_status']:
+        if not detailed_info['relationship_status']:
+            for pattern in _RELATIONSHIP_RES:
+                match = pattern.search(text)
+                if match:
                     detailed_info['relationship_status'] = match.group(1).strip()
-                    print(f"✅ Relationship: {match.group(1).strip()}", file=sys.stderr)
-                break
+                    logger.debug("✅ Relationship: %s", match.group(1).strip())
+                    break
         
         # Religious information patterns
-        religious_patterns = [
-            r'(?i)(protopsalt|archdeacon|diacon|cantaret bisericesc)',
-            r'(?i)(catedrala patriarhala|biserica|cathedral)',
-            r'(?i)(pictura bisericeasca|church painting|religious art)'
-        ]
-        for pattern in religious_patterns:
-            if re.search(pattern, text):
-                if 'protopsalt' in text.lower() or 'archdeacon' in text.lower():
-                    if not detailed_info['church_position']:
-                        detailed_info['church_position'] = text.strip()
-                        print(f"✅ Church position: {text.strip()}", file=sys.stderr)
-                elif 'catedrala' in text.lower() or 'cathedral' in text.lower():
-                    if not detailed_info['church_affiliation']:
-                        detailed_info['church_affiliation'] = text.strip()
-                        print(f"✅ Church affiliation: {text.strip()}", file=sys.stderr)
-                elif not detailed_info['religious_info']:
-                    detailed_info['religious_info'] = text.strip()
-                    print(f"✅ Religious info: {text.strip()}", file=sys.stderr)
-                break
+        if span_position in religious_hits:
+            if 'protopsalt' in text_lower or 'archdeacon' in text_lower:
+                if not detailed_info['church_position']:
+                    detailed_info['church_position'] = text
+                    logger.debug("✅ Church position: %s", text)
+            elif 'catedrala' in text_lower or 'cathedral' in text_lower:
+                if not detailed_info['church_affiliation']:
+                    detailed_info['church_affiliation'] = text
+                    logger.debug("✅ Church affiliation: %s", text)
+            elif not detailed_info['religious_info']:
+                detailed_info['religious_info'] = text
+                logger.debug("✅ Religious info: %s", text)
         
         # Languages (if any mention of languages is found)
-        language_patterns = [
-            r'(?i)(speaks|fluent in|languages?)\s*[:]\s*(.+)',
-            r'(?i)(romanian|english|french|german|spanish|italian|greek)',
-        ]
-        for pattern in language_patterns:
-            match = re.search(pattern, text)
+        for pattern in _LANGUAGE_RES:
+            match = pattern.search(text)
             if match:
                 if len(match.groups()) >= 2:
                     langs = [lang.strip() for lang in match.group(2).split(',')]
@@ -1137,7 +1391,7 @@ def extract_detailed_intro_information(soup, profile_data):
                 for lang in langs:
                     if lang and lang not in detailed_info['languages']:
                         detailed_info['languages'].append(lang)
-                        print(f"✅ Language: {lang}", file=sys.stderr)
+                        logger.debug("✅ Language: %s", lang)
                 break
     
     # Convert lists to JSON strings and update profile_data
@@ -1152,120 +1406,96 @@ def extract_detailed_intro_information(soup, profile_data):
     profile_data['scraping_method'] = 'manual'
     profile_data['is_public'] = True  # Assume public if we can access it
     
-    print(f"✅ Extracted detailed info: {len([k for k, v in detailed_info.items() if v])} fields populated", file=sys.stderr)
+    logger.debug("✅ Extracted detailed info: %s fields populated", len([k for k, v in detailed_info.items() if v]))
 
-def extract_from_json_application_data(soup, profile_data):
+def extract_from_json_application_data(soup, profile_data, tags=None):
     """
     Extract profile data from <script type="application/json"> blocks
     These blocks contain rich structured data about the Facebook profile
     Enhanced with specific Facebook JSON structure navigation
+    Pass the _index_tags() result as `tags` to reuse its script list
     """
-    print("🔍 Extracting from JSON application data blocks...", file=sys.stderr)
+    logger.debug("🔍 Extracting from JSON application data blocks...")
     
     # Find all script tags with type="application/json"
-    json_scripts = soup.find_all('script', {'type': 'application/json'})
+    json_scripts = tags['json_script'] if tags is not None else soup.find_all('script', {'type': 'application/json'})
     
-    print(f"📋 Found {len(json_scripts)} JSON application data blocks", file=sys.stderr)
+    logger.debug("📋 Found %s JSON application data blocks", len(json_scripts))
     
     for script in json_scripts:
         try:
-            if not script.string:
+            raw = script.string
+            if not raw:
+                continue
+            
+            # Only profile_tile_sections under a "require" list yield data
+            # below - skip every other (often multi-MB) block with substring
+            # tests instead of a full parse
+            if '"require"' not in raw or '"profile_tile_sections"' not in raw:
                 continue
             
             # Parse the JSON content
-            json_data = json.loads(script.string)
+            json_data = _json_loads(raw)
             
             # First try the enhanced Facebook-specific structure parsing
             if extract_facebook_specific_json_structure(json_data, profile_data):
-                print("✅ Successfully extracted data using Facebook-specific JSON structure", file=sys.stderr)
+                logger.debug("✅ Successfully extracted data using Facebook-specific JSON structure")
                 continue
             
             # Fallback to generic recursive structure search
             # extract_profile_from_json_structure(json_data, profile_data)
-            print("⚠️  Facebook-specific structure not found, using generic JSON extraction", file=sys.stderr)
+            logger.debug("⚠️  Facebook-specific structure not found, using generic JSON extraction")
             
         except json.JSONDecodeError as e:
             # Skip invalid JSON blocks
             continue
         except Exception as e:
-            print(f"⚠️  Error processing JSON block: {e}", file=sys.stderr)
+            logger.warning("⚠️  Error processing JSON block: %s", e)
             continue
 
 def extract_facebook_specific_json_structure(json_data, profile_data):
     """
     Extract data using Facebook's specific JSON structure from application/json scripts
-    This function navigates the exact 'require' -> 'ScheduledServerJS' -> 'profile_tile_sections' structure
+    The profile_tile_sections live under 'require' entries (ScheduledServerJS,
+    RelayPrefetchedStreamCache) at varying depths, so they are located by key
     """
     try:
-        # Navigate through the complex nested structure
-        if not isinstance(json_data, dict) or 'require' not in json_data:
+        if type(json_data) is not dict or 'require' not in json_data:
             return False
-            
-        for require_item in json_data.get('require', []):
-            if isinstance(require_item, list) and len(require_item) > 3:
-                # Look for ScheduledServerJS data
-                if require_item[0] == "ScheduledServerJS" and require_item[1] == "handle":
-                    if process_facebook_scheduled_server_js(require_item[3], profile_data):
-                        return True
-                # Look for RelayPrefetchedStreamCache which contains profile data
-                elif require_item[0] == "RelayPrefetchedStreamCache" and require_item[1] == "next":
-                    if process_facebook_relay_cache(require_item[3], profile_data):
-                        return True
+        
+        for tile_sections in walk_for_key(json_data['require'], 'profile_tile_sections'):
+            logger.debug("✅ Found profile_tile_sections in require data")
+            if extract_from_facebook_profile_tile_sections(tile_sections, profile_data):
+                return True
         
         return False
                     
     except Exception as e:
-        print(f"⚠️  Error extracting from Facebook-specific JSON structure: {e}", file=sys.stderr)
+        logger.warning("⚠️  Error extracting from Facebook-specific JSON structure: %s", e)
         return False
 
-def process_facebook_scheduled_server_js(data_list, profile_data):
-    """Process Facebook's ScheduledServerJS data structure"""
-    
-    for item in data_list:
-        if isinstance(item, dict) and '__bbox' in item:
-            bbox_data = item['__bbox']
-            if 'result' in bbox_data:
-                result = bbox_data['result']
-                if 'data' in result and 'profile_tile_sections' in result['data']:
-                    return extract_from_facebook_profile_tile_sections(result['data']['profile_tile_sections'], profile_data)
-    
-    return False
-
-def process_facebook_relay_cache(cache_data, profile_data):
-    """Process Facebook's RelayPrefetchedStreamCache data structure"""
-    
-    try:
-        print("🔍 Processing Facebook RelayPrefetchedStreamCache...", file=sys.stderr)
-        
-        # Navigate through cache data structure to find profile_tile_sections
-        for item in cache_data:
-            if isinstance(item, dict):
-                # Look for __bbox with result containing profile data
-                if '__bbox' in item:
-                    bbox = item['__bbox']
-                    if isinstance(bbox, dict) and 'result' in bbox:
-                        result = bbox['result']
-                        if isinstance(result, dict) and 'data' in result:
-                            data = result['data']
-                            if isinstance(data, dict) and 'profile_tile_sections' in data:
-                                print("✅ Found profile_tile_sections in RelayCache!", file=sys.stderr)
-                                return extract_from_facebook_profile_tile_sections(data['profile_tile_sections'], profile_data)
-                
-                # Also check if this item directly contains profile_tile_sections
-                elif 'profile_tile_sections' in item:
-                    print("✅ Found direct profile_tile_sections in RelayCache!", file=sys.stderr)
-                    return extract_from_facebook_profile_tile_sections(item['profile_tile_sections'], profile_data)
-        
-        return False
-        
-    except Exception as e:
-        print(f"⚠️  Error processing RelayPrefetchedStreamCache: {e}", file=sys.stderr)
-        return False
+def walk_for_key(root, target_key):
+    """
+    Yield every value stored under `target_key` in nested dicts/lists
+    Iterative depth-first walk in document order - no recursion per level
+    Exact type checks: parsed JSON only ever holds plain dicts and lists
+    """
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        node_type = type(node)
+        if node_type is dict:
+            value = node.get(target_key)
+            if value is not None:
+                yield value
+            stack.extend(reversed(list(node.values())))
+        elif node_type is list:
+            stack.extend(reversed(node))
 
 def extract_from_facebook_profile_tile_sections(tile_sections, profile_data):
     """Extract data from Facebook's profile_tile_sections"""
     
-    print("🎯 Processing Facebook profile tile sections...", file=sys.stderr)
+    logger.debug("🎯 Processing Facebook profile tile sections...")
     
     try:
         edges = tile_sections.get('edges', [])
@@ -1274,14 +1504,14 @@ def extract_from_facebook_profile_tile_sections(tile_sections, profile_data):
         for edge in edges:
             node = edge.get('node', {})
             if node.get('profile_tile_section_type') == 'INTRO':
-                print("✅ Found Facebook INTRO section!", file=sys.stderr)
+                logger.debug("✅ Found Facebook INTRO section!")
                 extract_from_facebook_intro_section(node, profile_data)
                 found_intro = True
                 
         return found_intro
                 
     except Exception as e:
-        print(f"⚠️  Error extracting from Facebook tile sections: {e}", file=sys.stderr)
+        logger.warning("⚠️  Error extracting from Facebook tile sections: %s", e)
         return False
 
 def extract_from_facebook_intro_section(intro_node, profile_data):
@@ -1297,14 +1527,211 @@ def extract_from_facebook_intro_section(intro_node, profile_data):
                 extract_from_facebook_context_list(renderer.get('view', {}), profile_data)
                 
     except Exception as e:
-        print(f"⚠️  Error extracting from Facebook intro section: {e}", file=sys.stderr)
+        logger.warning("⚠️  Error extracting from Facebook intro section: %s", e)
+
+# One tile item as seen by the INTRO_CARD_* handlers below: its title text
+# (with the lowercase form and entity ranges), the raw renderer/context_item,
+# and the work_history/education/social_links collected across the list
+_IntroCard = namedtuple('_IntroCard', 'title title_lower ranges renderer context_data '
+                                      'work_history education social_links')
+
+# INTRO_CARD_* handlers for extract_from_facebook_context_list - each is
+# called as handler(card, profile_data) and reads only the card fields it needs
+
+def _intro_influencer_category(card, profile_data):
+    """Professional title from the influencer category"""
+    # Handle "Profil · Creator digital" format
+    if 'creator digital' in card.title_lower or 'digital creator' in card.title_lower:
+        profile_data['professional_title'] = 'Creator digital'
+        logger.debug("✅ Professional title: Creator digital")
+    elif '·' in card.title:
+        # Extract the part after the bullet point
+        parts = card.title.split('·')
+        if len(parts) > 1:
+            title = parts[-1].strip()
+            profile_data['professional_title'] = title
+            logger.debug("✅ Professional title: %s", title)
+
+def _intro_work(card, profile_data):
+    """Work information"""
+    work_info = extract_facebook_work_info(card.title, card.title_lower, card.ranges)
+    if work_info:
+        card.work_history.append(work_info)
+        logger.debug("✅ Work: %s", work_info)
+        
+        # Check for specific roles
+        if 'archdeacon and protopsalt' in card.title_lower:
+            profile_data['church_position'] = 'Archdeacon and Protopsalt'
+            # Extract church/organization from ranges
+            for range_item in card.ranges:
+                entity = range_item.get('entity', {})
+                if entity.get('__typename') == 'Page':
+                    church_name = entity.get('url', '').split('/')[-2] if entity.get('url') else ''
+                    if church_name:
+                        profile_data['church_affiliation'] = church_name.replace('-', ' ').title()
+                        logger.debug("✅ Church affiliation: %s", profile_data['church_affiliation'])
+                        break
+        logger.debug("✅ Work: %s", work_info)
+
+def _intro_education(card, profile_data):
+    """Education information"""
+    edu_info = extract_facebook_education_info(card.title, card.ranges)
+    if edu_info:
+        card.education.append(edu_info)
+        logger.debug("✅ Education: %s", edu_info)
+
+def _intro_current_city(card, profile_data):
+    """Current location"""
+    location = extract_facebook_location_from_title(card.title)
+    if location:
+        profile_data['current_location'] = location
+        logger.debug("✅ Current location: %s", location)
+
+def _intro_hometown(card, profile_data):
+    """Origin location"""
+    location = extract_facebook_location_from_title(card.title)
+    if location:
+        profile_data['origin_location'] = location
+        logger.debug("✅ Origin location: %s", location)
+
+def _intro_website(card, profile_data):
+    """Website/social links"""
+    # Handle WebsiteContextItemRenderer structure
+    if card.renderer.get('__typename') == 'WebsiteContextItemRenderer':
+        context_item = card.renderer.get('context_item', {})
+        url = context_item.get('url', '')
+        plaintext_title = context_item.get('plaintext_title', {}).get('text', '')
+        
+        logger.debug("🔗 Found website: %s -> %s", plaintext_title, url)
+        
+        if 'youtube.com/channel' in plaintext_title:
+            # Extract clean YouTube channel URL
+            if 'youtube.com/channel/' in plaintext_title:
+                channel_id = plaintext_title.split('youtube.com/channel/')[-1]
+                card.social_links['YouTube'] = f"https://www.youtube.com/channel/{channel_id}"
+                logger.debug("✅ YouTube channel: %s", card.social_links['YouTube'])
+        elif 'facebook.com/' in plaintext_title and 'Mihail-Buc' in plaintext_title:
+            # Extract Facebook page URL
+            card.social_links['Facebook_Page'] = plaintext_title
+            logger.debug("✅ Facebook page: %s", plaintext_title)
+        else:
+            card.social_links['Website'] = plaintext_title
+            logger.debug("✅ Website: %s", plaintext_title)
+    else:
+        # Fallback for simpler structure
+        url = card.context_data.get('url', '')
+        plaintext_title = card.context_data.get('plaintext_title', {}).get('text', '')
+        
+        if 'youtube.com' in plaintext_title:
+            card.social_links['YouTube'] = url
+            logger.debug("✅ YouTube link: %s", plaintext_title)
+        elif 'facebook.com' in plaintext_title:
+            card.social_links['Facebook'] = url
+            logger.debug("✅ Facebook link: %s", plaintext_title)
+        else:
+            card.social_links['Website'] = url
+            logger.debug("✅ Website link: %s", plaintext_title)
+
+def _intro_languages(card, profile_data):
+    """Languages"""
+    languages = extract_facebook_languages(card.title)
+    if languages:
+        profile_data['languages'] = json.dumps(languages, ensure_ascii=False)
+        logger.debug("✅ Languages: %s", languages)
+
+def _intro_family_members(card, profile_data):
+    """Family members, stored as a JSON array"""
+    family_info = extract_facebook_family(card.title, card.title_lower, card.ranges)
+    if family_info:
+        existing_family = profile_data.get('family_members', '[]')
+        try:
+            family_list = json.loads(existing_family)
+        except:
+            family_list = []
+        family_list.append(family_info)
+        profile_data['family_members'] = json.dumps(family_list, ensure_ascii=False)
+        logger.debug("✅ Family member: %s", family_info)
+
+def _intro_interests(card, profile_data):
+    """Interests/hobbies"""
+    interests = extract_facebook_interests(card.title)
+    if interests:
+        profile_data['interests_detailed'] = json.dumps(interests, ensure_ascii=False)
+        logger.debug("✅ Interests: %s", interests)
+
+def _intro_contact_info(card, profile_data):
+    """Contact info"""
+    contact_info = extract_facebook_contact(card.title)
+    if contact_info:
+        for contact_type, contact_value in contact_info.items():
+            profile_data[f'contact_{contact_type}'] = contact_value
+            logger.debug("✅ Contact %s: %s", contact_type, contact_value)
+
+def _intro_basic_info(card, profile_data):
+    """Basic info (catch-all)"""
+    basic_info = extract_facebook_basic_info(card.title)
+    if basic_info:
+        profile_data['additional_info'] = basic_info
+        logger.debug("✅ Basic info: %s", basic_info)
+
+def _intro_about(card, profile_data):
+    """Extended bio/about section"""
+    if card.title and len(card.title) > 10:
+        profile_data['about_section'] = card.title
+        logger.debug("✅ About section: %s...", card.title[:50])
+
+def _intro_life_event(card, profile_data):
+    """Life events, stored as a JSON array"""
+    if card.title:
+        existing_events = profile_data.get('life_events', '[]')
+        try:
+            events_list = json.loads(existing_events)
+        except:
+            events_list = []
+        events_list.append(card.title)
+        profile_data['life_events'] = json.dumps(events_list, ensure_ascii=False)
+        logger.debug("✅ Life event: %s", card.title)
+
+def _intro_title_field(field, label):
+    """Handler that stores a non-empty title text as profile_data[field]"""
+    def handler(card, profile_data):
+        if card.title:
+            profile_data[field] = card.title
+            logger.debug("✅ %s: %s", label, card.title)
+    return handler
+
+# timeline_context_list_item_type -> handler, one dict lookup per tile item
+_INTRO_CARD_HANDLERS = {
+    'INTRO_CARD_INFLUENCER_CATEGORY': _intro_influencer_category,
+    'INTRO_CARD_WORK': _intro_work,
+    'INTRO_CARD_EDUCATION': _intro_education,
+    'INTRO_CARD_CURRENT_CITY': _intro_current_city,
+    'INTRO_CARD_HOMETOWN': _intro_hometown,
+    'INTRO_CARD_RELATIONSHIP': _intro_title_field('relationship_status', 'Relationship status'),
+    'INTRO_CARD_WEBSITE': _intro_website,
+    'INTRO_CARD_LANGUAGES': _intro_languages,
+    'INTRO_CARD_RELIGIOUS_VIEWS': _intro_title_field('religious_info', 'Religious info'),
+    'INTRO_CARD_FAMILY_MEMBERS': _intro_family_members,
+    'INTRO_CARD_INTERESTS': _intro_interests,
+    'INTRO_CARD_CONTACT_INFO': _intro_contact_info,
+    'INTRO_CARD_BASIC_INFO': _intro_basic_info,
+    'INTRO_CARD_ABOUT': _intro_about,
+    'INTRO_CARD_LIFE_EVENT': _intro_life_event,
+    'INTRO_CARD_FAVORITE_QUOTES': _intro_title_field('favorite_quotes', 'Favorite quote'),
+    'INTRO_CARD_OTHER_NAMES': _intro_title_field('other_names', 'Other names'),
+    'INTRO_CARD_NICKNAME': _intro_title_field('other_names', 'Other names'),
+    'INTRO_CARD_POLITICAL_VIEWS': _intro_title_field('political_views', 'Political views'),
+    'INTRO_CARD_BIRTHDAY': _intro_title_field('birthday', 'Birthday'),
+    'INTRO_CARD_PHONE': _intro_title_field('contact_phone', 'Phone'),
+    'INTRO_CARD_EMAIL': _intro_title_field('contact_email', 'Email'),
+}
 
 def extract_from_facebook_context_list(view_data, profile_data):
     """Extract data from Facebook's context list view"""
     
     try:
         tile_items = view_data.get('profile_tile_items', {}).get('nodes', [])
-        print(f"📋 Found {len(tile_items)} Facebook tile items", file=sys.stderr)
+        logger.debug("📋 Found %s Facebook tile items", len(tile_items))
         
         # Initialize enhanced fields
         work_history = []
@@ -1319,219 +1746,20 @@ def extract_from_facebook_context_list(view_data, profile_data):
             if 'context_item' in renderer:
                 context_data = renderer['context_item']
                 title_data = context_data.get('title', {})
-                title_text = title_data.get('text', '')
+                # "text" can be null - keep it a string for the lowercasing below
+                title_text = title_data.get('text') or ''
                 item_type = node.get('timeline_context_list_item_type', '')
                 
-                print(f"📊 Processing Facebook item: {item_type} - {title_text}", file=sys.stderr)
-                
-                # Extract professional title from influencer category
-                if item_type == 'INTRO_CARD_INFLUENCER_CATEGORY':
-                    # Handle "Profil · Creator digital" format
-                    if 'creator digital' in title_text.lower() or 'digital creator' in title_text.lower():
-                        profile_data['professional_title'] = 'Creator digital'
-                        print(f"✅ Professional title: Creator digital", file=sys.stderr)
-                    elif '·' in title_text:
-                        # Extract the part after the bullet point
-                        parts = title_text.split('·')
-                        if len(parts) > 1:
-                            title = parts[-1].strip()
-                            profile_data['professional_title'] = title
-                            print(f"✅ Professional title: {title}", file=sys.stderr)
-                
-                # Extract work information
-                elif item_type == 'INTRO_CARD_WORK':
-                    work_info = extract_facebook_work_info(title_text, title_data.get('ranges', []))
-                    if work_info:
-                        work_history.append(work_info)
-                        print(f"✅ Work: {work_info}", file=sys.stderr)
-                        
-                        # Check for specific roles
-                        if 'archdeacon and protopsalt' in title_text.lower():
-                            profile_data['church_position'] = 'Archdeacon and Protopsalt'
-                            # Extract church/organization from ranges
-                            for range_item in title_data.get('ranges', []):
-                                entity = range_item.get('entity', {})
-                                if entity.get('__typename') == 'Page':
-                                    church_name = entity.get('url', '').split('/')[-2] if entity.get('url') else ''
-                                    if church_name:
-                                        profile_data['church_affiliation'] = church_name.replace('-', ' ').title()
-                                        print(f"✅ Church affiliation: {profile_data['church_affiliation']}", file=sys.stderr)
-                                        break
-                        print(f"✅ Work: {work_info}", file=sys.stderr)
-                
-                # Extract education information
-                elif item_type == 'INTRO_CARD_EDUCATION':
-                    edu_info = extract_facebook_education_info(title_text, title_data.get('ranges', []))
-                    if edu_info:
-                        education.append(edu_info)
-                        print(f"✅ Education: {edu_info}", file=sys.stderr)
-                
-                # Extract location information
-                elif item_type == 'INTRO_CARD_CURRENT_CITY':
-                    location = extract_facebook_location_from_title(title_text)
-                    if location:
-                        profile_data['current_location'] = location
-                        print(f"✅ Current location: {location}", file=sys.stderr)
-                
-                elif item_type == 'INTRO_CARD_HOMETOWN':
-                    location = extract_facebook_location_from_title(title_text)
-                    if location:
-                        profile_data['origin_location'] = location
-                        print(f"✅ Origin location: {location}", file=sys.stderr)
-                
-                # Extract relationship status
-                elif item_type == 'INTRO_CARD_RELATIONSHIP':
-                    if title_text:
-                        profile_data['relationship_status'] = title_text
-                        print(f"✅ Relationship status: {title_text}", file=sys.stderr)
-                
-                # Extract website/social links
-                elif item_type == 'INTRO_CARD_WEBSITE':
-                    # Handle WebsiteContextItemRenderer structure
-                    if renderer.get('__typename') == 'WebsiteContextItemRenderer':
-                        context_item = renderer.get('context_item', {})
-                        url = context_item.get('url', '')
-                        plaintext_title = context_item.get('plaintext_title', {}).get('text', '')
-                        
-                        print(f"🔗 Found website: {plaintext_title} -> {url}", file=sys.stderr)
-                        
-                        if 'youtube.com/channel' in plaintext_title:
-                            # Extract clean YouTube channel URL
-                            if 'youtube.com/channel/' in plaintext_title:
-                                channel_id = plaintext_title.split('youtube.com/channel/')[-1]
-                                social_links['YouTube'] = f"https://www.youtube.com/channel/{channel_id}"
-                                print(f"✅ YouTube channel: {social_links['YouTube']}", file=sys.stderr)
-                        elif 'facebook.com/' in plaintext_title and 'Mihail-Buc' in plaintext_title:
-                            # Extract Facebook page URL
-                            social_links['Facebook_Page'] = plaintext_title
-                            print(f"✅ Facebook page: {plaintext_title}", file=sys.stderr)
-                        else:
-                            social_links['Website'] = plaintext_title
-                            print(f"✅ Website: {plaintext_title}", file=sys.stderr)
-                    else:
-                        # Fallback for simpler structure
-                        url = context_data.get('url', '')
-                        plaintext_title = context_data.get('plaintext_title', {}).get('text', '')
-                        
-                        if 'youtube.com' in plaintext_title:
-                            social_links['YouTube'] = url
-                            print(f"✅ YouTube link: {plaintext_title}", file=sys.stderr)
-                        elif 'facebook.com' in plaintext_title:
-                            social_links['Facebook'] = url
-                            print(f"✅ Facebook link: {plaintext_title}", file=sys.stderr)
-                        else:
-                            social_links['Website'] = url
-                            print(f"✅ Website link: {plaintext_title}", file=sys.stderr)
-                
-                # Extract languages
-                elif item_type == 'INTRO_CARD_LANGUAGES':
-                    languages = extract_facebook_languages(title_text)
-                    if languages:
-                        profile_data['languages'] = json.dumps(languages, ensure_ascii=False)
-                        print(f"✅ Languages: {languages}", file=sys.stderr)
-                
-                # Extract religious views
-                elif item_type == 'INTRO_CARD_RELIGIOUS_VIEWS':
-                    if title_text:
-                        profile_data['religious_info'] = title_text
-                        print(f"✅ Religious info: {title_text}", file=sys.stderr)
-                
-                # Extract family members
-                elif item_type == 'INTRO_CARD_FAMILY_MEMBERS':
-                    family_info = extract_facebook_family(title_text, title_data.get('ranges', []))
-                    if family_info:
-                        # Store as JSON array
-                        existing_family = profile_data.get('family_members', '[]')
-                        try:
-                            family_list = json.loads(existing_family)
-                        except:
-                            family_list = []
-                        family_list.append(family_info)
-                        profile_data['family_members'] = json.dumps(family_list, ensure_ascii=False)
-                        print(f"✅ Family member: {family_info}", file=sys.stderr)
-                
-                # Extract interests/hobbies
-                elif item_type == 'INTRO_CARD_INTERESTS':
-                    interests = extract_facebook_interests(title_text)
-                    if interests:
-                        profile_data['interests_detailed'] = json.dumps(interests, ensure_ascii=False)
-                        print(f"✅ Interests: {interests}", file=sys.stderr)
-                
-                # Extract contact info
-                elif item_type == 'INTRO_CARD_CONTACT_INFO':
-                    contact_info = extract_facebook_contact(title_text)
-                    if contact_info:
-                        for contact_type, contact_value in contact_info.items():
-                            profile_data[f'contact_{contact_type}'] = contact_value
-                            print(f"✅ Contact {contact_type}: {contact_value}", file=sys.stderr)
-                
-                # Extract basic info (catch-all)
-                elif item_type == 'INTRO_CARD_BASIC_INFO':
-                    basic_info = extract_facebook_basic_info(title_text)
-                    if basic_info:
-                        profile_data['additional_info'] = basic_info
-                        print(f"✅ Basic info: {basic_info}", file=sys.stderr)
-                
-                # Extract about section
-                elif item_type == 'INTRO_CARD_ABOUT':
-                    if title_text and len(title_text) > 10:
-                        # Extended bio/about section
-                        profile_data['about_section'] = title_text
-                        print(f"✅ About section: {title_text[:50]}...", file=sys.stderr)
-                
-                # Extract life events
-                elif item_type == 'INTRO_CARD_LIFE_EVENT':
-                    if title_text:
-                        # Store life events as JSON array
-                        existing_events = profile_data.get('life_events', '[]')
-                        try:
-                            events_list = json.loads(existing_events)
-                        except:
-                            events_list = []
-                        events_list.append(title_text)
-                        profile_data['life_events'] = json.dumps(events_list, ensure_ascii=False)
-                        print(f"✅ Life event: {title_text}", file=sys.stderr)
-                
-                # Extract favorite quotes
-                elif item_type == 'INTRO_CARD_FAVORITE_QUOTES':
-                    if title_text:
-                        profile_data['favorite_quotes'] = title_text
-                        print(f"✅ Favorite quote: {title_text}", file=sys.stderr)
-                
-                # Extract other names/nicknames
-                elif item_type == 'INTRO_CARD_OTHER_NAMES' or item_type == 'INTRO_CARD_NICKNAME':
-                    if title_text:
-                        profile_data['other_names'] = title_text
-                        print(f"✅ Other names: {title_text}", file=sys.stderr)
-                
-                # Extract political views
-                elif item_type == 'INTRO_CARD_POLITICAL_VIEWS':
-                    if title_text:
-                        profile_data['political_views'] = title_text
-                        print(f"✅ Political views: {title_text}", file=sys.stderr)
-                
-                # Extract birthday (if public)
-                elif item_type == 'INTRO_CARD_BIRTHDAY':
-                    if title_text:
-                        profile_data['birthday'] = title_text
-                        print(f"✅ Birthday: {title_text}", file=sys.stderr)
-                
-                # Extract phone number
-                elif item_type == 'INTRO_CARD_PHONE':
-                    if title_text:
-                        profile_data['contact_phone'] = title_text
-                        print(f"✅ Phone: {title_text}", file=sys.stderr)
-                
-                # Extract email
-                elif item_type == 'INTRO_CARD_EMAIL':
-                    if title_text:
-                        profile_data['contact_email'] = title_text
-                        print(f"✅ Email: {title_text}", file=sys.stderr)
+                logger.debug("📊 Processing Facebook item: %s - %s", item_type, title_text)
                 
+                handler = _INTRO_CARD_HANDLERS.get(item_type)
+                if handler is not None:
+                    card = _IntroCard(title_text, title_text.lower(), title_data.get('ranges', []),
+                                      renderer, context_data, work_history, education, social_links)
+                    handler(card, profile_data)
                 # Log unknown types for future improvement
-                else:
-                    if item_type and item_type.startswith('INTRO_CARD_'):
-                        print(f"⚠️  Unknown INTRO_CARD type: {item_type} - {title_text}", file=sys.stderr)
+                elif item_type and item_type.startswith('INTRO_CARD_'):
+                    logger.debug("⚠️  Unknown INTRO_CARD type: %s - %s", item_type, title_text)
         
         # Convert to JSON strings for database storage
         if work_history:
@@ -1548,18 +1776,18 @@ def extract_from_facebook_context_list(view_data, profile_data):
         if social_links:
             profile_data['social_media_links'] = json.dumps(social_links, ensure_ascii=False)
         
-        print(f"🎉 Successfully extracted enhanced data from Facebook JSON!", file=sys.stderr)
+        logger.debug("🎉 Successfully extracted enhanced data from Facebook JSON!")
         
     except Exception as e:
-        print(f"⚠️  Error extracting from Facebook context list: {e}", file=sys.stderr)
+        logger.warning("⚠️  Error extracting from Facebook context list: %s", e)
 
-def extract_facebook_work_info(title_text, ranges):
-    """Extract work information from Facebook title text and ranges"""
+def extract_facebook_work_info(title_text, title_lower, ranges):
+    """Extract work information from Facebook title text (title_lower is its lowercase form) and ranges"""
     
     work_info = {'current': True, 'position': None, 'company': None}
     
     # Check for work-related patterns
-    if 'worked at' in title_text.lower() or 'a lucrat la' in title_text.lower():
+    if 'worked at' in title_lower or 'a lucrat la' in title_lower:
         work_info['current'] = False
     
     # Extract position and company from ranges if available
@@ -1582,13 +1810,8 @@ def extract_facebook_work_info(title_text, ranges):
     
     # Fallback: parse from title text if ranges don't work
     if not work_info['company']:
-        work_patterns = [
-            r'(?i)(.*?)\s+(?:works?\s+at|worked\s+at|la)\s+(.+)',
-            r'(?i)(?:works?\s+at|worked\s+at|la)\s+(.+)'
-        ]
-        
-        for pattern in work_patterns:
-            match = re.search(pattern, title_text)
+        for pattern in _TILE_WORK_RES:
+            match = pattern.search(title_text)
             if match:
                 if len(match.groups()) >= 2:
                     work_info['position'] = match.group(1).strip()
@@ -1614,13 +1837,8 @@ def extract_facebook_education_info(title_text, ranges):
     
     # Fallback: parse from title text if ranges don't work
     if not edu_info['institution']:
-        edu_patterns = [
-            r'(?i)(?:studied at|studies at|a studiat la)\s+(.+)',
-            r'(?i)(.+)(?:\s+University|\s+College|\s+Faculty)'
-        ]
-        
-        for pattern in edu_patterns:
-            match = re.search(pattern, title_text)
+        for pattern in _TILE_EDU_RES:
+            match = pattern.search(title_text)
             if match:
                 edu_info['institution'] = match.group(1).strip()
                 break
@@ -1631,14 +1849,8 @@ def extract_facebook_education_info(title_text, ranges):
 def extract_facebook_location_from_title(title_text):
     """Extract location from Facebook title text"""
     
-    location_patterns = [
-        r'(?i)(?:lives in|based in|located in|din)\s+(.+)',
-        r'(?i)(.+?)(?:,\s*Romania|,\s*România)',
-        r'(?i)(.+?)(?:\s*$)'
-    ]
-    
-    for pattern in location_patterns:
-        match = re.search(pattern, title_text)
+    for pattern in _TILE_LOCATION_RES:
+        match = pattern.search(title_text)
         if match:
             location = match.group(1).strip()
             # Clean up common location prefixes
@@ -1666,8 +1878,8 @@ def extract_facebook_languages(title_text):
     
     return [lang for lang in languages if len(lang) > 1]
 
-def extract_facebook_family(title_text, ranges):
-    """Extract family member information"""
+def extract_facebook_family(title_text, title_lower, ranges):
+    """Extract family member information - title_lower is title_text.lower()"""
     family_info = {
         'relationship': None,
         'name': None,
@@ -1675,20 +1887,20 @@ def extract_facebook_family(title_text, ranges):
     }
     
     # Extract relationship type (wife, husband, son, daughter, etc.)
-    if 'married to' in title_text.lower():
+    if 'married to' in title_lower:
         family_info['relationship'] = 'spouse'
-        family_info['name'] = title_text.lower().replace('married to', '').strip()
-    elif 'wife' in title_text.lower():
+        family_info['name'] = title_lower.replace('married to', '').strip()
+    elif 'wife' in title_lower:
         family_info['relationship'] = 'wife'
-    elif 'husband' in title_text.lower():
+    elif 'husband' in title_lower:
         family_info['relationship'] = 'husband'
-    elif 'son' in title_text.lower():
+    elif 'son' in title_lower:
         family_info['relationship'] = 'son'
-    elif 'daughter' in title_text.lower():
+    elif 'daughter' in title_lower:
         family_info['relationship'] = 'daughter'
-    elif 'mother' in title_text.lower():
+    elif 'mother' in title_lower:
         family_info['relationship'] = 'mother'
-    elif 'father' in title_text.lower():
+    elif 'father' in title_lower:
         family_info['relationship'] = 'father'
     
     # Extract profile URL from ranges if available
@@ -1725,14 +1937,12 @@ def extract_facebook_contact(title_text):
     contact_info = {}
     
     # Email pattern
-    email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-    email_match = re.search(email_pattern, title_text)
+    email_match = _EMAIL_RE.search(title_text)
     if email_match:
         contact_info['email'] = email_match.group()
     
     # Phone pattern (simple)
-    phone_pattern = r'[\+]?[0-9\s\-\(\)]{10,}'
-    phone_match = re.search(phone_pattern, title_text)
+    phone_match = _PHONE_RE.search(title_text)
     if phone_match:
         contact_info['phone'] = phone_match.group().strip()
     
@@ -1746,39 +1956,52 @@ def extract_facebook_basic_info(title_text):
 
 def main():
     """Main function - called when script is run directly"""
+    configure_scraper_logging(_DEBUG_LOG_BATCH)
+    
     try:
         # Get profile input from command line argument
         if len(sys.argv) < 2:
-            print("❌ Usage: python facebook_scraper.py <username_or_id_or_url>", file=sys.stderr)
+            logger.error("❌ Usage: python facebook_scraper.py <username_or_id_or_url> [...]")
             sys.exit(1)
         
+        # Several profiles: fetch them concurrently and output a JSON list
+        if len(sys.argv) > 2:
+            profile_inputs = sys.argv[1:]
+            logger.debug("🔍 Processing %s Facebook profiles", len(profile_inputs))
+            results = [
+                profile_data or {"error": "Could not extract profile data from the provided input"}
+                for profile_data in extract_facebook_profiles(profile_inputs)
+            ]
+            print(json.dumps(results, ensure_ascii=False, indent=2))
+            sys.exit(0)
+        
         profile_input = sys.argv[1]
         
-        print(f"🔍 Processing Facebook profile: {profile_input}", file=sys.stderr)
+        logger.debug("🔍 Processing Facebook profile: %s", profile_input)
         
         # Extract real profile data
         profile_data = extract_facebook_profile(profile_input)
         
         if profile_data:
             if 'error' in profile_data:
-                print(f"❌ Scraper error: {profile_data['error']}", file=sys.stderr)
+                logger.error("❌ Scraper error: %s", profile_data['error'])
                 # Output error JSON
                 print(json.dumps(profile_data))
                 sys.exit(1)
             else:
-                print(f"✅ Successfully extracted profile for: {profile_data['name']}", file=sys.stderr)
+                logger.debug("✅ Successfully extracted profile for: %s", profile_data['name'])
                 # Output JSON to stdout for the scheduler
                 print(json.dumps(profile_data, ensure_ascii=False, indent=2))
                 sys.exit(0)
         else:
-            print("❌ Failed to extract profile data", file=sys.stderr)
+            logger.error("❌ Failed to extract profile data")
             # Output error JSON
             error_data = {"error": "Could not extract profile data from the provided input"}
             print(json.dumps(error_data))
             sys.exit(1)
         
     except Exception as e:
-        print(f"💥 Fatal error in Facebook scraper: {e}", file=sys.stderr)
+        logger.error("💥 Fatal error in Facebook scraper: %s", e)
         # Output error JSON
         error_data = {"error": str(e)}
         print(json.dumps(error_data))
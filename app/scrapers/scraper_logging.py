@@ -0,0 +1,41 @@
+"""
+Logging setup shared by the scraper scripts
+Each scraper runs as a subprocess that prints its JSON result to stdout, so
+progress messages go to stderr through logging instead
+"""
+
+import logging
+import logging.handlers
+import os
+import sys
+
+
+def configure_scraper_logging(debug_batch_size=None):
+    """
+    Send log records to stderr - warnings only, unless SCRAPER_DEBUG=1
+    With debug_batch_size, debug records are buffered and written in batches
+    of that many (warnings and errors flush immediately)
+    """
+    # Fix Windows Unicode encoding issues - switch the existing streams to UTF-8 in place
+    if sys.platform == "win32":
+        try:
+            sys.stdout.reconfigure(encoding='utf-8')
+            sys.stderr.reconfigure(encoding='utf-8')
+        except Exception:
+            pass  # Fallback if encoding fix fails
+
+    if os.environ.get('SCRAPER_DEBUG') != '1':
+        logging.basicConfig(stream=sys.stderr, format='%(message)s', level=logging.WARNING)
+    elif debug_batch_size:
+        stderr_handler = logging.StreamHandler(sys.stderr)
+        stderr_handler.setFormatter(logging.Formatter('%(message)s'))
+        # Buffered, so debug output costs one write per batch instead of one
+        # per line; logging.shutdown() at exit flushes the remainder
+        logging.basicConfig(
+            handlers=[logging.handlers.MemoryHandler(
+                debug_batch_size, flushLevel=logging.WARNING, target=stderr_handler
+            )],
+            level=logging.DEBUG
+        )
+    else:
+        logging.basicConfig(stream=sys.stderr, format='%(message)s', level=logging.DEBUG)
@@ -11,6 +11,11 @@ import pytz
 from dateutil import parser
 from bs4 import BeautifulSoup
 
+try:
+    from ciso8601 import parse_datetime as _ciso_parse_datetime
+except ImportError:
+    _ciso_parse_datetime = None
+
 # Timezone România
 ROMANIA_TZ = pytz.timezone('Europe/Bucharest')
 
@@ -57,7 +62,7 @@ def parse_to_romania_time(date_string, source_format=None):
         print(f"⚠️  Eroare parsing dată '{date_string}': {e}")
         return None
 
-def extract_adevarul_published_date(article_url):
+def extract_adevarul_published_date(article_url, soup=None):
     """
     Extrage data publicării de pe un articol Adevarul.ro
     
@@ -67,13 +72,14 @@ def extract_adevarul_published_date(article_url):
     - JSON-LD schema
     """
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        response = requests.get(article_url, headers=headers, timeout=10)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.content, 'html.parser')
+        if soup is None:
+            headers = {
+                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+            }
+            response = requests.get(article_url, headers=headers, timeout=10)
+            response.raise_for_status()
+            
+            soup = BeautifulSoup(response.content, 'html.parser')
         
         # Strategia 1: Caută pattern "Publicat: DD.MM.YYYY HH:MM"
         published_patterns = [
@@ -149,7 +155,7 @@ def extract_adevarul_published_date(article_url):
         print(f"❌ Eroare extragere dată Adevarul {article_url}: {e}")
         return None
 
-def extract_biziday_published_date(article_url):
+def extract_biziday_published_date(article_url, soup=None):
     """
     Extrage data publicării de pe un articol Biziday.ro
     
@@ -157,13 +163,14 @@ def extract_biziday_published_date(article_url):
     - <time class="timeago" datetime="2025-06-29T15:03:11Z" title="2025-06-29 @ 14:56:26">
     """
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        response = requests.get(article_url, headers=headers, timeout=10)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.content, 'html.parser')
+        if soup is None:
+            headers = {
+                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+            }
+            response = requests.get(article_url, headers=headers, timeout=10)
+            response.raise_for_status()
+            
+            soup = BeautifulSoup(response.content, 'html.parser')
         
         # Strategia 1: <time class="timeago" datetime="...">
         time_elements = soup.find_all('time', class_='timeago')
@@ -263,13 +270,23 @@ def format_for_database(dt):
     # Format PostgreSQL: YYYY-MM-DD HH:MM:SS+TZ
     return dt_ro.isoformat()
 
-def extract_published_date_from_content(url, source_name="unknown"):
+def parse_iso_datetime(value):
+    """
+    Parsează un timestamp ISO 8601 (acceptă și sufixul 'Z')
+    Folosește ciso8601 dacă e instalat; ridică ValueError pentru input invalid
+    """
+    if _ciso_parse_datetime is not None:
+        return _ciso_parse_datetime(value)
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+def extract_published_date_from_content(url, source_name="unknown", soup=None):
     """
     Extrage data publicării dintr-un URL specific în funcție de sursa de știri
     
     Args:
         url: URL-ul articolului
         source_name: Numele sursei ("adevarul", "biziday", etc.)
+        soup: pagina deja parsată (opțional) - evită o nouă descărcare
         
     Returns:
         datetime cu timezone România sau None
@@ -277,19 +294,20 @@ def extract_published_date_from_content(url, source_name="unknown"):
     source_name = source_name.lower()
     
     if 'adevarul' in source_name or 'adevarul.ro' in url:
-        return extract_adevarul_published_date(url)
+        return extract_adevarul_published_date(url, soup)
     elif 'biziday' in source_name or 'biziday.ro' in url:
-        return extract_biziday_published_date(url)
+        return extract_biziday_published_date(url, soup)
     else:
         # Încercare generică
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-            response = requests.get(url, headers=headers, timeout=10)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
+            if soup is None:
+                headers = {
+                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+                }
+                response = requests.get(url, headers=headers, timeout=10)
+                response.raise_for_status()
+                
+                soup = BeautifulSoup(response.content, 'html.parser')
             
             # Caută meta tags generale
             meta_selectors = [
@@ -323,7 +341,7 @@ def extract_published_date_from_content(url, source_name="unknown"):
             print(f"❌ Eroare extragere dată generică {url}: {e}")
             return None
 
-def extract_adevarul_updated_date(article_url):
+def extract_adevarul_updated_date(article_url, soup=None):
     """
     Extrage data actualizării de pe un articol Adevarul.ro (OPTIMIZATĂ)
     
@@ -336,13 +354,14 @@ def extract_adevarul_updated_date(article_url):
         datetime cu timezone România sau None dacă nu e disponibilă
     """
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        response = requests.get(article_url, headers=headers, timeout=5)  # Timeout redus la 5s
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.content, 'html.parser')
+        if soup is None:
+            headers = {
+                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+            }
+            response = requests.get(article_url, headers=headers, timeout=5)  # Timeout redus la 5s
+            response.raise_for_status()
+            
+            soup = BeautifulSoup(response.content, 'html.parser')
         
         # Strategia 1: JSON-LD schema cu dateModified (cea mai rapidă)
         json_scripts = soup.find_all('script', type='application/ld+json')
@@ -507,7 +526,7 @@ def extract_adevarul_updated_date(article_url):
         print(f"❌ Eroare extragere dată actualizare Adevarul {article_url}: {e}")
         return None
 
-def extract_biziday_updated_date(article_url):
+def extract_biziday_updated_date(article_url, soup=None):
     """
     Extrage data actualizării de pe un articol Biziday.ro
     
@@ -520,13 +539,14 @@ def extract_biziday_updated_date(article_url):
         datetime cu timezone România sau None dacă nu e disponibilă
     """
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        response = requests.get(article_url, headers=headers, timeout=10)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.content, 'html.parser')
+        if soup is None:
+            headers = {
+                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+            }
+            response = requests.get(article_url, headers=headers, timeout=10)
+            response.raise_for_status()
+            
+            soup = BeautifulSoup(response.content, 'html.parser')
         
         # Strategia 1 (PRIORITATE): Meta tag article:modified_time
         meta_modified = soup.find('meta', property='article:modified_time')
@@ -593,13 +613,14 @@ def extract_biziday_updated_date(article_url):
         print(f"❌ Eroare extragere dată actualizare Biziday {article_url}: {e}")
         return None
 
-def extract_updated_date_from_content(url, source_name="unknown"):
+def extract_updated_date_from_content(url, source_name="unknown", soup=None):
     """
     Extrage data actualizării dintr-un URL specific în funcție de sursa de știri
     
     Args:
         url: URL-ul articolului
         source_name: Numele sursei ("adevarul", "biziday", etc.)
+        soup: pagina deja parsată (opțional) - evită o nouă descărcare
         
     Returns:
         datetime cu timezone România sau None dacă nu e disponibilă
@@ -607,19 +628,20 @@ def extract_updated_date_from_content(url, source_name="unknown"):
     source_name = source_name.lower()
     
     if 'adevarul' in source_name or 'adevarul.ro' in url:
-        return extract_adevarul_updated_date(url)
+        return extract_adevarul_updated_date(url, soup)
     elif 'biziday' in source_name or 'biziday.ro' in url:
-        return extract_biziday_updated_date(url)
+        return extract_biziday_updated_date(url, soup)
     else:
         # Încercare generică pentru alte surse
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-            response = requests.get(url, headers=headers, timeout=10)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
+            if soup is None:
+                headers = {
+                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+                }
+                response = requests.get(url, headers=headers, timeout=10)
+                response.raise_for_status()
+                
+                soup = BeautifulSoup(response.content, 'html.parser')
             
             # Caută meta tags generale pentru dată modificare
             meta_selectors = [
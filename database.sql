@@ -657,7 +657,8 @@ CREATE TABLE public.news_articles (
     created_at timestamp without time zone DEFAULT CURRENT_TIMESTAMP,
     updated_at timestamp without time zone DEFAULT CURRENT_TIMESTAMP,
     content_hash character varying(64),
-    search_vector tsvector
+    search_vector tsvector,
+    content_length integer
 );
 
 
@@ -1095,6 +1096,13 @@ CREATE INDEX idx_facebook_profiles_username ON public.facebook_user_profiles USI
 CREATE INDEX idx_news_articles_content_hash ON public.news_articles USING btree (content_hash);
 
 
+--
+-- Name: ix_news_articles_content_length; Type: INDEX; Schema: public; Owner: postgres
+--
+
+CREATE INDEX ix_news_articles_content_length ON public.news_articles USING btree (content_length);
+
+
 --
 -- TOC entry 4889 (class 1259 OID 18004)
 -- Name: idx_news_articles_created_at; Type: INDEX; Schema: public; Owner: postgres